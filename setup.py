@@ -16,7 +16,11 @@ setup(name="tap-zoho-crm",
         "backoff==2.2.1",
         "parameterized==0.9.0"
       ],
-      extras_require={"dev": ["pylint", "ipdb", "pytest"]},
+      extras_require={
+        "dev": ["pylint", "ipdb", "pytest"],
+        "async": ["aiohttp==3.10.10"],
+        "orjson": ["orjson==3.8.3"]
+      },
       entry_points="""
           [console_scripts]
           tap-zoho-crm=tap_zoho_crm:main
@@ -0,0 +1,187 @@
+import asyncio
+import threading
+from typing import Any, Dict, List, Mapping, Optional
+
+import backoff
+from singer import get_logger, metrics
+
+from tap_zoho_crm import json_codec
+from tap_zoho_crm.client import raise_for_error
+from tap_zoho_crm.rate_limiter import rate_limit_wait
+from tap_zoho_crm.exceptions import (
+    ZohoCRMRateLimitError,
+    ZohoCRMInternalServerError,
+    ZohoCRMServiceUnavailableError
+)
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+LOGGER = get_logger()
+
+if aiohttp is not None:
+    RETRYABLE_TRANSPORT_ERRORS = (
+        aiohttp.ClientConnectionError,
+        aiohttp.ClientPayloadError,
+        asyncio.TimeoutError
+    )
+else:
+    RETRYABLE_TRANSPORT_ERRORS = (asyncio.TimeoutError,)
+
+
+class AsyncResponse:
+    """Exposes a fully read aiohttp response through the attributes used by `raise_for_error`."""
+
+    def __init__(self, status_code: int, headers: Mapping[str, str], content: bytes) -> None:
+        self.status_code = status_code
+        self.headers = headers
+        self.content = content
+
+    def json(self) -> Any:
+        return json_codec.loads(self.content)
+
+
+class AsyncClient:
+    """
+    An asyncio HTTP engine used alongside a `Client`.
+    ~~~
+    Runs one event loop on a dedicated thread and one aiohttp session on it, so that any
+    thread can hand it a group of requests which are then performed concurrently. The
+    authentication, error handling and retry policy are those of the wrapped `Client`.
+    """
+
+    def __init__(self, client) -> None:
+        if aiohttp is None:
+            raise ImportError(
+                "The 'aiohttp' http_engine requires the aiohttp package, "
+                "install it with: pip install 'tap-zoho-crm[async]'"
+            )
+        self.client = client
+        self._session = None
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(
+            target=self._loop.run_forever, name="zoho-crm-event-loop", daemon=True
+        )
+        self._thread.start()
+
+    def make_requests(self, requests: List[Dict[str, Any]]) -> List[Any]:
+        """
+        Perform the requests concurrently and return the responses in request order.
+        Each request is a dict of `Client.make_request` keyword arguments.
+        """
+        future = asyncio.run_coroutine_threadsafe(self._gather(requests), self._loop)
+        return future.result()
+
+    async def _gather(self, requests: List[Dict[str, Any]]) -> List[Any]:
+        return await asyncio.gather(*(self.make_request(**request) for request in requests))
+
+    async def _get_session(self):
+        if self._session is None:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=self.client.max_concurrent_requests),
+                timeout=aiohttp.ClientTimeout(total=self.client.request_timeout)
+            )
+        return self._session
+
+    async def make_request(
+        self,
+        method: str,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, Any]] = None,
+        body: Optional[Any] = None,
+        path: Optional[str] = None,
+        is_auth_req: bool = True
+    ) -> Any:
+        """
+        Sends an HTTP request to the specified API endpoint.
+        """
+        params = params or {}
+        headers = headers or {}
+        body = body or {}
+        endpoint = endpoint or f"{self.client.base_url}/{path}"
+        if is_auth_req:
+            # A token refresh blocks, so it happens off the event loop
+            headers, params = await self._loop.run_in_executor(
+                None, self.client.authenticate, headers, params
+            )
+        return await self.__make_request(
+            method, endpoint,
+            headers=headers,
+            params={key: value for key, value in params.items() if value is not None},
+            data=body
+        )
+
+    @backoff.on_exception(
+        wait_gen=backoff.expo,
+        exception=RETRYABLE_TRANSPORT_ERRORS + (
+            ConnectionResetError,
+            ZohoCRMInternalServerError,
+            ZohoCRMServiceUnavailableError
+        ),
+        max_tries=5,
+        factor=2
+    )
+    @backoff.on_exception(
+        wait_gen=rate_limit_wait,
+        exception=(
+            ZohoCRMRateLimitError,
+        ),
+        max_tries=5,
+        jitter=None
+    )
+    async def __make_request(
+        self, method: str, endpoint: str, **kwargs
+    ) -> Optional[Mapping[Any, Any]]:
+        """Performs HTTP Operations."""
+        method = method.upper()
+        if method not in ("GET", "POST"):
+            raise ValueError(f"Unsupported method: {method}")
+        if method == "GET":
+            kwargs.pop("data", None)
+
+        session = await self._get_session()
+        await self._acquire_slot(endpoint)
+        try:
+            with metrics.http_request_timer(endpoint):
+                async with session.request(method, endpoint, **kwargs) as raw_response:
+                    response = AsyncResponse(
+                        raw_response.status, raw_response.headers, await raw_response.read()
+                    )
+                self.client.rate_limiter.update_from_headers(response.headers)
+                raise_for_error(response)
+        finally:
+            self.client.rate_limiter.release()
+
+        if response.status_code == 304:
+            # HTTP 304 Not Modified: only returned for conditional requests.
+            return None
+
+        if response.status_code == 204:
+            return {}
+
+        return response.json()
+
+    async def _acquire_slot(self, endpoint: str) -> None:
+        """Wait for a rate limiter slot. The limiter blocks, so the wait happens off the
+        event loop; when the request is cancelled meanwhile, the slot is released as soon
+        as the executor thread has taken it."""
+        acquired = self._loop.run_in_executor(None, self.client.rate_limiter.acquire, endpoint)
+        try:
+            await asyncio.shield(acquired)
+        except asyncio.CancelledError:
+            def release(future):
+                if not future.cancelled() and future.exception() is None:
+                    self.client.rate_limiter.release()
+            acquired.add_done_callback(release)
+            raise
+
+    def close(self) -> None:
+        """Close the session and stop the event loop thread."""
+        if self._session is not None:
+            asyncio.run_coroutine_threadsafe(self._session.close(), self._loop).result()
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
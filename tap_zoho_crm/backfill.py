@@ -0,0 +1,42 @@
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+from singer import utils
+
+BACKFILL_WORKERS = 4
+# Pages buffered per worker while the records of other windows are being written
+BACKFILL_BUFFER_PAGES = 2
+
+
+def get_backfill_settings(config: Mapping[str, Any]) -> Tuple[Optional[timedelta], int]:
+    """Return the length of a backfill window, None when sharding is disabled,
+    and the number of windows fetched concurrently."""
+    config_window_days = config.get("backfill_window_days")
+    window = timedelta(days=float(config_window_days)) if config_window_days else None
+    config_workers = config.get("backfill_workers")
+    workers = int(config_workers) if config_workers else BACKFILL_WORKERS
+    return window, max(1, workers)
+
+
+def split_windows(start: str, end: datetime, window: timedelta) -> List[Dict]:
+    """Split `start` to `end` into consecutive windows of `window`. The last window is
+    left open, so that it also covers the records modified while the sync runs."""
+    windows = []
+    window_start = utils.strptime_to_utc(start)
+    while window_start + window < end:
+        windows.append({"start": utils.strftime(window_start), "end": utils.strftime(window_start + window)})
+        window_start += window
+    windows.append({"start": utils.strftime(window_start), "end": None})
+    return windows
+
+
+def get_window_position(window: Dict) -> str:
+    """Return the replication key value a window resumes from."""
+    return window.get("progress") or window["start"]
+
+
+def get_low_water_mark(windows: List[Dict]) -> Optional[str]:
+    """Return the value below which every record of the pending windows was written:
+    the position of the earliest window which is not complete."""
+    if not windows:
+        return None
+    return min(get_window_position(window) for window in windows)
@@ -0,0 +1,143 @@
+import csv
+import io
+import json
+import tempfile
+import time
+import zipfile
+from typing import Any, Dict, Iterator, List, Optional
+from urllib.parse import urljoin
+from singer import get_logger
+
+from tap_zoho_crm.exceptions import ZohoCRMError
+
+LOGGER = get_logger()
+BULK_READ_POLL_INTERVAL = 10
+BULK_READ_TIMEOUT = 3600
+# Job states reported by the Bulk Read API while the export is being prepared
+BULK_READ_PENDING_STATES = {"ADDED", "QUEUED", "IN PROGRESS"}
+# Multi-select picklist values are separated by semicolons in the exported CSV
+MULTI_VALUE_SEPARATOR = ";"
+
+
+def bulk_row_to_record(row: Dict[str, str], properties: Dict[str, Dict]) -> Dict[str, Any]:
+    """Shape a CSV row like a record of the records API, so that the transformer types it.
+    CSV cells are strings: empty cells become None, multi-select values become lists
+    and lookups, which the export writes as the id of the related record, become
+    `{"id": ...}` objects. Numbers, booleans and timestamps are converted by the
+    transformer from their string form."""
+    record = {}
+    for field_name, value in row.items():
+        if value == "" or value is None:
+            record[field_name] = None
+            continue
+
+        types = properties.get(field_name, {}).get("type", [])
+        if "array" in types:
+            value = value.split(MULTI_VALUE_SEPARATOR)
+        elif "object" in types:
+            value = {"id": value}
+        record[field_name] = value
+    return record
+
+
+class BulkReader:
+    """
+    Extracts a module through the Zoho CRM Bulk Read API.
+    ~~~
+    For every page of the export, a bulk read job is created, polled until it is
+    completed, and its zipped CSV result is downloaded to a temporary file. The rows
+    are then read one at a time from the archive, so no page is ever held in memory.
+
+    Docs: https://www.zoho.com/crm/developer/docs/api/v8/bulk-read/overview.html
+    """
+
+    def __init__(
+            self,
+            client,
+            module: str,
+            fields: List[str],
+            properties: Dict[str, Dict],
+            criteria: Optional[Dict] = None
+        ) -> None:
+        self.client = client
+        self.module = module
+        self.fields = fields
+        self.properties = properties
+        self.criteria = criteria
+
+        config = client.config
+        config_poll_interval = config.get("bulk_read_poll_interval")
+        self.poll_interval = float(config_poll_interval) if config_poll_interval else BULK_READ_POLL_INTERVAL
+        config_timeout = config.get("bulk_read_timeout")
+        self.timeout = float(config_timeout) if config_timeout else BULK_READ_TIMEOUT
+
+    def get_records(self) -> Iterator[Dict]:
+        """Yield every record of the export, page by page."""
+        page, page_token = 1, None
+        while True:
+            job_id = self.create_job(page, page_token)
+            result = self.wait_for_job(job_id)
+            yield from self.read_result(result["download_url"])
+
+            if not result.get("more_records"):
+                return
+            page += 1
+            page_token = result.get("next_page_token")
+
+    def create_job(self, page: int, page_token: Optional[str] = None) -> str:
+        """Create the bulk read job of one page of the export and return its id."""
+        query = {
+            "module": {"api_name": self.module},
+            "fields": self.fields,
+            "page": page
+        }
+        if page_token:
+            query["page_token"] = page_token
+        if self.criteria:
+            query["criteria"] = self.criteria
+
+        response = self.client.make_request(
+            "POST",
+            f"{self.client.bulk_base_url}/read",
+            headers={"Content-Type": "application/json"},
+            body=json.dumps({"query": query, "file_type": "csv"})
+        )
+        job = response["data"][0]
+        if job.get("status") != "success":
+            raise ZohoCRMError(f"Bulk read job for {self.module} was not created: {job.get('message')}")
+        job_id = job["details"]["id"]
+        LOGGER.info("Created bulk read job {} for {} page {}".format(job_id, self.module, page))
+        return job_id
+
+    def wait_for_job(self, job_id: str) -> Dict:
+        """Poll the job until it is completed and return its result."""
+        deadline = time.monotonic() + self.timeout
+        while True:
+            response = self.client.make_request("GET", f"{self.client.bulk_base_url}/read/{job_id}")
+            job = response["data"][0]
+            state = job.get("state")
+            if state == "COMPLETED":
+                return job["result"]
+            if state not in BULK_READ_PENDING_STATES:
+                raise ZohoCRMError(f"Bulk read job {job_id} for {self.module} ended in state {state}")
+            if time.monotonic() >= deadline:
+                raise ZohoCRMError(
+                    f"Bulk read job {job_id} for {self.module} did not complete within {self.timeout} seconds"
+                )
+            time.sleep(self.poll_interval)
+
+    def read_result(self, download_url: str) -> Iterator[Dict]:
+        """Download the zipped CSV result of a job and yield its rows as records."""
+        with tempfile.TemporaryFile() as result_file:
+            self.client.make_request(
+                "GET",
+                urljoin(self.client.bulk_base_url, download_url),
+                download_to=result_file
+            )
+            result_file.seek(0)
+            with zipfile.ZipFile(result_file) as archive:
+                csv_name = next(name for name in archive.namelist() if name.lower().endswith(".csv"))
+                with archive.open(csv_name) as csv_file:
+                    rows = csv.DictReader(io.TextIOWrapper(csv_file, encoding="utf-8-sig", newline=""))
+                    for row in rows:
+                        yield bulk_row_to_record(row, self.properties)
@@ -1,10 +1,12 @@
-from typing import Any, Dict, Mapping, Optional, Tuple
+from typing import IO, Any, Dict, Mapping, Optional, Tuple
 from datetime import datetime, timedelta
+import threading
 import time
 
 import backoff
 import requests
 from requests import session
+from requests.adapters import HTTPAdapter
 from requests.exceptions import Timeout, ConnectionError, ChunkedEncodingError
 from singer import get_logger, metrics
 
@@ -15,11 +17,33 @@ from tap_zoho_crm.exceptions import (
     ZohoCRMInternalServerError,
     ZohoCRMServiceUnavailableError
 )
+from tap_zoho_crm import json_codec
+from tap_zoho_crm.json_stream import RESPONSE_CHUNK_SIZE, StreamedResponse
+from tap_zoho_crm.metadata_cache import MetadataCache
+from tap_zoho_crm.rate_limiter import RateLimiter, rate_limit_wait
+from tap_zoho_crm.token_cache import TokenCache
 
 LOGGER = get_logger()
 REQUEST_TIMEOUT = 300
-REFRESH_URL = "https://accounts.zoho.com/oauth/v2/token"
+MAX_CONCURRENT_REQUESTS = 5
+CONNECTION_POOL_SIZE = 10
+API_VERSION = "v8"
+DEFAULT_DATA_CENTER = "com"
+# Accounts server and API domain of every Zoho data center, keyed by data center
+DATA_CENTERS = {
+    "com": ("https://accounts.zoho.com", "https://www.zohoapis.com"),
+    "eu": ("https://accounts.zoho.eu", "https://www.zohoapis.eu"),
+    "in": ("https://accounts.zoho.in", "https://www.zohoapis.in"),
+    "com.au": ("https://accounts.zoho.com.au", "https://www.zohoapis.com.au"),
+    "jp": ("https://accounts.zoho.jp", "https://www.zohoapis.jp"),
+    "ca": ("https://accounts.zohocloud.ca", "https://www.zohoapis.ca"),
+    "sa": ("https://accounts.zoho.sa", "https://www.zohoapis.sa"),
+    "com.cn": ("https://accounts.zoho.com.cn", "https://www.zohoapis.com.cn"),
+}
 DEFAULT_EXPIRY_TIME_IN_SECONDS = 3600
+# The access token is refreshed this long before it expires, so that no request
+# starts with a token which expires while it is in flight
+TOKEN_REFRESH_MARGIN_IN_SECONDS = 300
 
 def raise_for_error(response: requests.Response) -> None:
     """Raises the associated response exception. Takes in a response object,
@@ -28,14 +52,14 @@ def raise_for_error(response: requests.Response) -> None:
 
     :param resp: requests.Response object
     """
+    if response.status_code in [200, 201, 204, 304]:
+        return
+
     try:
         response_json = response.json()
     except Exception:
         response_json = {}
 
-    if response.status_code in [200, 201, 204]:
-        return
-
     error_code = response_json.get("code", "").upper()
     error_text = response_json.get("message", "")
     error_status = response_json.get("status", "").lower()
@@ -86,15 +110,6 @@ def raise_for_error(response: requests.Response) -> None:
     raise exception_class(message, response) from None
 
 
-def wait_if_retry_after(details):
-    """Backoff handler that checks for a 'retry_after' attribute in the exception
-    and sleeps for the specified duration to respect API rate limits.
-    """
-    exc = details['exception']
-    if hasattr(exc, 'retry_after') and exc.retry_after is not None:
-        LOGGER.warning(f"Rate limited. Retrying in {exc.retry_after} seconds...")
-        time.sleep(exc.retry_after)
-
 class Client:
     """
     A Wrapper class.
@@ -111,29 +126,104 @@ class Client:
         self._access_token = None
         self._expires_at = None
         self._scope = None
-        self._api_domain = "https://www.zohoapis.com"
         self._token_type = None
-        self.base_url = f"{self._api_domain}/crm/v8"
+        self._token_lock = threading.Lock()
+
+        data_center = str(config.get("data_center") or DEFAULT_DATA_CENTER).lower()
+        if data_center not in DATA_CENTERS:
+            raise ValueError(
+                f"Unsupported data_center '{data_center}', expected one of: {', '.join(DATA_CENTERS)}"
+            )
+        accounts_server, default_api_domain = DATA_CENTERS[data_center]
+        self.refresh_url = f"{accounts_server}/oauth/v2/token"
 
         config_request_timeout = config.get("request_timeout")
         self.request_timeout = float(config_request_timeout) if config_request_timeout else REQUEST_TIMEOUT
 
+        config_token_refresh_margin = config.get("token_refresh_margin")
+        self.token_refresh_margin = float(config_token_refresh_margin) \
+            if config_token_refresh_margin else TOKEN_REFRESH_MARGIN_IN_SECONDS
+
+        config_max_concurrent_requests = config.get("max_concurrent_requests")
+        self.max_concurrent_requests = int(config_max_concurrent_requests) \
+            if config_max_concurrent_requests else MAX_CONCURRENT_REQUESTS
+        # Every thread of the parallel modes may hold a connection, so the pools are
+        # never smaller than the number of requests in flight
+        config_connection_pool_size = config.get("connection_pool_size")
+        self.connection_pool_size = int(config_connection_pool_size) \
+            if config_connection_pool_size else max(CONNECTION_POOL_SIZE, self.max_concurrent_requests)
+        self._mount_connection_pool(accounts_server)
+        self._set_api_domain(default_api_domain)
+
+        config_requests_per_minute = config.get("max_requests_per_minute")
+        self.rate_limiter = RateLimiter(
+            self.max_concurrent_requests,
+            float(config_requests_per_minute) if config_requests_per_minute else None
+        )
+        self.metadata_cache = MetadataCache.from_config(config)
+        self.token_cache = TokenCache.from_config(config)
+
+        self.async_client = None
+        if config.get("http_engine", "requests") == "aiohttp":
+            # Imported lazily as aiohttp is an optional dependency
+            from tap_zoho_crm.async_client import AsyncClient
+            self.async_client = AsyncClient(self)
+
     def __enter__(self):
-        self._refresh_access_token()
+        self.get_access_token()
         return self
 
     def __exit__(self, exception_type, exception_value, traceback):
+        connection_stats = self.get_connection_stats()
+        LOGGER.info(
+            "HTTP connection reuse: {} requests over {} connections".format(
+                connection_stats["requests"], connection_stats["connections"]
+            )
+        )
         self._session.close()
+        if self.async_client:
+            self.async_client.close()
+
+    def _mount_connection_pool(self, url: str) -> None:
+        """Give the host its own keep-alive connection pool sized for the parallel modes."""
+        if url in self._session.adapters:
+            return
+        self._session.mount(url, HTTPAdapter(
+            pool_connections=self.connection_pool_size,
+            pool_maxsize=self.connection_pool_size
+        ))
+
+    def _set_api_domain(self, api_domain: str) -> None:
+        """Send the API requests to `api_domain`."""
+        self._api_domain = api_domain
+        self.base_url = f"{self._api_domain}/crm/{API_VERSION}"
+        self.bulk_base_url = f"{self._api_domain}/crm/bulk/{API_VERSION}"
+        self._mount_connection_pool(self._api_domain)
+
+    def get_connection_stats(self) -> Dict[str, int]:
+        """Return the number of requests sent and of connections opened by the session."""
+        stats = {"requests": 0, "connections": 0}
+        adapters = {id(adapter): adapter for adapter in self._session.adapters.values()}
+        for adapter in adapters.values():
+            if not isinstance(adapter, HTTPAdapter):
+                continue
+            pools = adapter.poolmanager.pools
+            for pool_key in pools.keys():
+                pool = pools[pool_key]
+                stats["requests"] += pool.num_requests
+                stats["connections"] += pool.num_connections
+        return stats
 
     def _refresh_access_token(self) -> None:
         """Refreshes the access token."""
         LOGGER.info("Refreshing Access Token")
         resp_json = self.make_request(
             "POST",
-            endpoint=REFRESH_URL,
+            endpoint=self.refresh_url,
             headers={
                 "User-Agent": self.config["user_agent"],
-                "Content-Type": "application/json"
+                "Content-Type": "application/json",
+                "Accept-Encoding": "gzip"
             },
             params={
                 "refresh_token": self.config["refresh_token"],
@@ -146,18 +236,56 @@ class Client:
         )
         self._access_token = resp_json.get("access_token")
         self._scope = resp_json.get("scope")
-        self._api_domain = resp_json.get("api_domain")
+        # Requests go to the API domain of the data center the account lives in
+        self._set_api_domain(resp_json.get("api_domain") or self._api_domain)
         self._token_type = resp_json.get("token_type", "Bearer")
         expires_in_seconds = resp_json.get("expires_in", DEFAULT_EXPIRY_TIME_IN_SECONDS)
         self._expires_at = datetime.now() + timedelta(seconds=expires_in_seconds)
         LOGGER.info("Got refreshed access token")
 
+    def _load_or_refresh_access_token(self) -> None:
+        """Use the access token of the token cache while it is valid, otherwise refresh
+        it and update the cache. The cache stays locked meanwhile, so that concurrent
+        runs share a single refresh."""
+        if not self.token_cache:
+            self._refresh_access_token()
+            return
+
+        with self.token_cache.lock():
+            cached_token = self.token_cache.read()
+            if cached_token and cached_token["expires_at"] - self.token_refresh_margin > time.time():
+                LOGGER.info("Using cached access token")
+                self._access_token = cached_token["access_token"]
+                self._scope = cached_token.get("scope")
+                self._set_api_domain(cached_token.get("api_domain") or self._api_domain)
+                self._token_type = cached_token.get("token_type", "Bearer")
+                self._expires_at = datetime.fromtimestamp(cached_token["expires_at"])
+                return
+
+            self._refresh_access_token()
+            self.token_cache.write({
+                "access_token": self._access_token,
+                "scope": self._scope,
+                "api_domain": self._api_domain,
+                "token_type": self._token_type,
+                "expires_at": self._expires_at.timestamp()
+            })
+
+    def _is_access_token_valid(self) -> bool:
+        """Whether the access token stays valid beyond the refresh margin."""
+        return bool(self._access_token) and \
+            self._expires_at - timedelta(seconds=self.token_refresh_margin) > datetime.now()
+
     def get_access_token(self) -> str:
-        """Return access token if available or generate one."""
-        if self._access_token and self._expires_at > datetime.now():
+        """Return access token if available or generate one.
+        Only one refresh is in flight at a time; concurrent callers wait for it and then
+        use the token it obtained."""
+        if self._is_access_token_valid():
             return self._access_token
 
-        self._refresh_access_token()
+        with self._token_lock:
+            if not self._is_access_token_valid():
+                self._load_or_refresh_access_token()
         return self._access_token
 
     @property
@@ -167,7 +295,9 @@ class Client:
         """
         header = {
             'User-Agent': self.config["user_agent"],
-            'Content-Type': 'application/json'
+            'Content-Type': 'application/json',
+            'Accept-Encoding': 'gzip',
+            'Connection': 'keep-alive'
         }
         return header
 
@@ -189,10 +319,15 @@ class Client:
         headers: Optional[Dict[str, Any]] = None,
         body: Optional[Dict[str, Any]] = None,
         path: Optional[str] = None,
-        is_auth_req: bool = True
+        is_auth_req: bool = True,
+        stream: bool = False,
+        download_to: Optional[IO[bytes]] = None
     ) -> Any:
         """
         Sends an HTTP request to the specified API endpoint.
+        With `stream`, the JSON body is returned as a `StreamedResponse` which parses it
+        while it is read, instead of being loaded at once. With `download_to`, the body
+        is written to that binary file instead, and None is returned.
         """
         params = params or {}
         headers = headers or {}
@@ -205,7 +340,9 @@ class Client:
             headers=headers,
             params=params,
             data=body,
-            timeout=self.request_timeout
+            timeout=self.request_timeout,
+            stream=stream or download_to is not None,
+            download_to=download_to
         )
 
     @backoff.on_exception(
@@ -222,32 +359,52 @@ class Client:
         factor=2
     )
     @backoff.on_exception(
-        wait_gen=backoff.constant,
-        on_backoff=wait_if_retry_after,
+        wait_gen=rate_limit_wait,
         exception=(
             ZohoCRMRateLimitError,
         ),
         max_tries=5,
-        interval=1
+        jitter=None
     )
     def __make_request(
         self, method: str, endpoint: str, **kwargs
     ) -> Optional[Mapping[Any, Any]]:
         """Performs HTTP Operations."""
         method = method.upper()
-        with metrics.http_request_timer(endpoint):
-            if method in ("GET", "POST"):
-                if method == "GET":
-                    kwargs.pop("data", None)
-                response = self._session.request(method, endpoint, **kwargs)
-                raise_for_error(response)
-            else:
-                raise ValueError(f"Unsupported method: {method}")
+        download_to = kwargs.pop("download_to", None)
+        self.rate_limiter.acquire(endpoint)
+        try:
+            with metrics.http_request_timer(endpoint):
+                if method in ("GET", "POST"):
+                    if method == "GET":
+                        kwargs.pop("data", None)
+                    response = self._session.request(method, endpoint, **kwargs)
+                    self.rate_limiter.update_from_headers(response.headers)
+                    raise_for_error(response)
+                    if download_to is not None:
+                        # A retried download starts over in an empty file
+                        download_to.seek(0)
+                        download_to.truncate()
+                        for chunk in response.iter_content(chunk_size=RESPONSE_CHUNK_SIZE):
+                            download_to.write(chunk)
+                        return None
+                else:
+                    raise ValueError(f"Unsupported method: {method}")
+        finally:
+            self.rate_limiter.release()
+
+        if response.status_code == 304:
+            # HTTP 304 Not Modified: only returned for conditional requests,
+            # the caller already holds the current representation.
+            return None
 
         if response.status_code == 204:
             # HTTP 204 No Content: no response body is returned.
             # Return an empty dictionary to maintain consistent response structure.
             return {}
 
-        return response.json()
+        if kwargs.get("stream"):
+            return StreamedResponse.from_response(response)
+
+        return json_codec.loads(response.content)
 
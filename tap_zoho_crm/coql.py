@@ -0,0 +1,139 @@
+import json
+import re
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+from singer import get_logger, utils
+
+from tap_zoho_crm.helpers import ZOHO_DATETIME_FORMAT
+
+LOGGER = get_logger()
+COQL_PAGE_SIZE = 2000
+# Limits of a single COQL query
+COQL_MAX_FIELDS = 50
+COQL_MAX_IN_VALUES = 50
+COQL_ID_PATTERN = re.compile(r"\d+")
+
+
+def coql_literal(value: Any) -> str:
+    """Quote a value for a COQL condition. Record ids are numbers, other values strings."""
+    value = str(value)
+    if COQL_ID_PATTERN.fullmatch(value):
+        return value
+    return "'{}'".format(value.replace("\\", "\\\\").replace("'", "\\'"))
+
+
+def coql_datetime(value: str) -> str:
+    """Format a bookmark as a COQL datetime literal."""
+    return coql_literal(utils.strptime_to_utc(value).strftime(ZOHO_DATETIME_FORMAT))
+
+
+class CoqlReader:
+    """
+    Pages through a module with COQL queries using keyset pagination.
+    ~~~
+    Records are ordered by `(sort_key, id)` and each query asks for the records after
+    the last one of the previous page, `(sort_key, id) > (last sort_key, last id)`, so
+    no page token or offset is involved and an interrupted extraction resumes exactly
+    after the last record it wrote.
+
+    A query selects up to 50 fields. The first batch of fields pages through the module;
+    the other batches are fetched for the ids of that page with `id in (...)` queries, so
+    every batch describes the same records.
+
+    Docs: https://www.zoho.com/crm/developer/docs/api/v8/COQL-Overview.html
+    """
+
+    def __init__(
+            self,
+            client,
+            module: str,
+            fields: List[str],
+            sort_key: Optional[str] = None,
+            conditions: Optional[List[str]] = None,
+            after: Optional[Dict] = None
+        ) -> None:
+        self.client = client
+        self.module = module
+        self.sort_key = sort_key
+        self.conditions = conditions or []
+        self.after = after
+
+        required_fields = ["id"] + ([sort_key] if sort_key else [])
+        other_fields = [field for field in fields if field not in required_fields]
+        first_batch_size = COQL_MAX_FIELDS - len(required_fields)
+        self.page_fields = required_fields + other_fields[:first_batch_size]
+        self.hydrate_batches = [
+            other_fields[index:index + COQL_MAX_FIELDS - 1]
+            for index in range(first_batch_size, len(other_fields), COQL_MAX_FIELDS - 1)
+        ]
+
+    def query(self, select_query: str) -> List[Dict]:
+        response = self.client.make_request(
+            "POST",
+            f"{self.client.base_url}/coql",
+            headers={"Content-Type": "application/json"},
+            body=json.dumps({"select_query": select_query})
+        )
+        # A query without results answers 204 (an empty dict)
+        return (response or {}).get("data", [])
+
+    def get_keyset_condition(self) -> Optional[str]:
+        """Return the condition selecting the records after the last one read."""
+        if not self.after:
+            return None
+        after_id = coql_literal(self.after["id"])
+        if not self.sort_key:
+            return f"id > {after_id}"
+        after_value = coql_literal(self.after[self.sort_key])
+        return (f"({self.sort_key} > {after_value} or "
+                f"({self.sort_key} = {after_value} and id > {after_id}))")
+
+    def build_page_query(self) -> str:
+        conditions = list(self.conditions)
+        keyset_condition = self.get_keyset_condition()
+        if keyset_condition:
+            conditions.append(keyset_condition)
+        # COQL requires a where clause
+        where = " and ".join(f"({condition})" for condition in conditions) or "id is not null"
+        order_by = ", ".join(f"{field} asc" for field in ([self.sort_key] if self.sort_key else []) + ["id"])
+        return (f"select {', '.join(self.page_fields)} from {self.module} "
+                f"where {where} order by {order_by} limit {COQL_PAGE_SIZE}")
+
+    def hydrate(self, records: List[Dict], executor: ThreadPoolExecutor) -> None:
+        """Add the fields of the other batches to the records of a page."""
+        records_by_id = {record["id"]: record for record in records}
+        ids = list(records_by_id)
+        queries = [
+            "select id, {} from {} where id in ({})".format(
+                ", ".join(field_batch),
+                self.module,
+                ", ".join(coql_literal(record_id) for record_id in ids[index:index + COQL_MAX_IN_VALUES])
+            )
+            for field_batch in self.hydrate_batches
+            for index in range(0, len(ids), COQL_MAX_IN_VALUES)
+        ]
+        for partial_records in executor.map(self.query, queries):
+            for partial_record in partial_records:
+                record = records_by_id.get(partial_record.get("id"))
+                if record is not None:
+                    record.update(partial_record)
+
+    def get_pages(self) -> Iterator[Tuple[List[Dict], Dict]]:
+        """Yield the pages of the module with the keyset of their last record."""
+        max_workers = max(1, self.client.max_concurrent_requests)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            while True:
+                records = self.query(self.build_page_query())
+                if not records:
+                    return
+                if self.hydrate_batches:
+                    self.hydrate(records, executor)
+
+                last_record = records[-1]
+                self.after = {"id": last_record["id"]}
+                if self.sort_key:
+                    self.after[self.sort_key] = last_record[self.sort_key]
+                yield records, dict(self.after)
+
+                if len(records) < COQL_PAGE_SIZE:
+                    return
@@ -1,3 +1,6 @@
+from tap_zoho_crm.rate_limiter import MAX_RATE_LIMIT_RETRY_WAIT, parse_rate_limit_headers
+
+
 class ZohoCRMError(Exception):
     """class representing Generic Http error."""
 
@@ -39,17 +42,23 @@ class ZohoCRMUnprocessableEntityError(ZohoCRMBackoffError):
 class ZohoCRMRateLimitError(ZohoCRMBackoffError):
     """class representing 429 status code."""
     def __init__(self, message=None, response=None):
-        """Initialize the ZohoCRMRateLimitError. Parses the 'retry_in_seconds'  from the response (if present) and sets the
-            `retry_after` attribute accordingly.
+        """Initialize the ZohoCRMRateLimitError. Sets the `retry_after` attribute from the
+            'Retry-After' header, or else from the 'X-RATELIMIT-RESET' header, when present.
+            A response carrying neither, such as the accounts server's 400 "too many requests
+            continuously", waits `MAX_RATE_LIMIT_RETRY_WAIT` seconds.
         """
         self.response = response
         self.retry_after = None
 
-        if response is not None:
-            try:
-                self.retry_after = int(response.headers.get("Retry-After", 60))
-            except (ValueError, TypeError):
-                self.retry_after = 60
+        headers = getattr(response, "headers", None) or {}
+        try:
+            self.retry_after = int(headers["Retry-After"])
+        except (KeyError, ValueError, TypeError):
+            _, _, reset_in = parse_rate_limit_headers(headers)
+            if reset_in is not None:
+                self.retry_after = int(reset_in) + 1
+            elif response is not None:
+                self.retry_after = MAX_RATE_LIMIT_RETRY_WAIT
         base_msg = message or "Rate limit exhausted"
         retry_info = f"(Retry after {self.retry_after} seconds.)" \
             if self.retry_after is not None else "(Retry after unknown delay.)"
@@ -0,0 +1,83 @@
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterator, List, Mapping, Tuple
+
+# Format of the timestamps sent to Zoho CRM: `If-Modified-Since` headers, bulk read
+# criteria and COQL conditions
+ZOHO_DATETIME_FORMAT = "%Y-%m-%dT%H:%M:%S+00:00"
+# Marks the end of an iterator in the items yielded by `interleave`
+END_OF_ITERATOR = object()
+
+
+def get_config_list(config: Mapping[str, Any], key: str) -> List[str]:
+    """Return a config value given as a JSON list or as a comma separated string."""
+    values = config.get(key) or []
+    if isinstance(values, str):
+        values = values.split(",")
+    return [value.strip() for value in values if value.strip()]
+
+
+def is_list_of_objects(field_schema: Dict) -> bool:
+    """Whether a field holds a list of objects, such as a subform or attachments. These
+    fields are neither exported by bulk reads nor selectable with COQL."""
+    items_types = field_schema.get("items", {}).get("type", [])
+    return "object" in items_types
+
+
+def interleave(
+        iterators: List[Iterator],
+        max_workers: int,
+        buffer_size: int,
+        thread_name_prefix: str = "interleave"
+    ) -> Iterator[Tuple[int, Any]]:
+    """Consume `iterators` on up to `max_workers` threads and yield their items as
+    `(index, item)` in the order they arrive, followed by `(index, END_OF_ITERATOR)` once
+    an iterator is exhausted. The items of one iterator keep their order. Exceptions
+    raised by an iterator are re-raised in the caller. When the caller stops consuming,
+    the threads stop and the iterators which have not started are not consumed.
+    """
+    buffer = queue.Queue(maxsize=buffer_size)
+    stopped = threading.Event()
+
+    def put(item) -> bool:
+        while not stopped.is_set():
+            try:
+                buffer.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def produce(index: int, iterator: Iterator) -> None:
+        try:
+            # An iterator which starts after the caller stopped is not consumed at all
+            if stopped.is_set():
+                return
+            for item in iterator:
+                if not put((index, item, None)):
+                    return
+            put((index, END_OF_ITERATOR, None))
+        except Exception as err:
+            put((index, None, err))
+        finally:
+            # Generators are closed on the thread which ran them
+            if hasattr(iterator, "close"):
+                iterator.close()
+
+    executor = ThreadPoolExecutor(max_workers=max(1, max_workers), thread_name_prefix=thread_name_prefix)
+    try:
+        for index, iterator in enumerate(iterators):
+            executor.submit(produce, index, iterator)
+
+        remaining = len(iterators)
+        while remaining:
+            index, item, error = buffer.get()
+            if error is not None:
+                raise error
+            if item is END_OF_ITERATOR:
+                remaining -= 1
+            yield index, item
+    finally:
+        stopped.set()
+        executor.shutdown(wait=True, cancel_futures=True)
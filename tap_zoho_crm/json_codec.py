@@ -0,0 +1,58 @@
+import json
+import math
+from typing import Any, Union
+import singer
+
+try:
+    import orjson
+except ImportError:
+    # orjson is an optional dependency, the standard library codecs are used without it
+    orjson = None
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    """Decode a JSON document with orjson when it is installed.
+    orjson decodes integers beyond 64 bits as floats; Zoho CRM sends record ids as strings.
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # Documents the standard library accepts but orjson rejects, such as NaN
+            # literals, are decoded by the standard library, which raises otherwise
+            pass
+    return json.loads(data)
+
+
+def has_non_finite_float(value: Any) -> bool:
+    """Whether a value holds NaN or an infinity, which JSON cannot represent."""
+    if isinstance(value, float):
+        return not math.isfinite(value)
+    if isinstance(value, dict):
+        return any(has_non_finite_float(item) for item in value.values())
+    if isinstance(value, (list, tuple)):
+        return any(has_non_finite_float(item) for item in value)
+    return False
+
+
+def format_message(message: singer.Message) -> bytes:
+    """Serialize a Singer message to a single UTF-8 encoded JSON line, without the
+    trailing newline.
+    ~~~
+    With orjson, non-ASCII characters are written as UTF-8 instead of `\\u` escapes and
+    no whitespace separates the tokens; the decoded messages are identical to those of
+    `singer.format_message`. Values orjson cannot encode exactly, such as decimals and
+    integers beyond 64 bits, fall back to `singer.format_message`. So do NaN and
+    infinities, which orjson writes as null and singer rejects with a ValueError.
+    """
+    if orjson is not None:
+        message_dict = message.asdict()
+        try:
+            data = orjson.dumps(message_dict)
+        except TypeError:
+            pass
+        else:
+            # Non-finite floats can only hide behind a null
+            if b"null" not in data or not has_non_finite_float(message_dict):
+                return data
+    return singer.format_message(message).encode("utf-8")
@@ -0,0 +1,186 @@
+import codecs
+import json
+from typing import Any, Dict, Iterable, Iterator, Optional
+
+RESPONSE_CHUNK_SIZE = 64 * 1024
+JSON_WHITESPACE = " \t\n\r"
+END_OF_ARRAY = object()
+
+
+class JSONStreamReader:
+    """
+    Decodes JSON values one at a time from an iterable of byte chunks.
+    ~~~
+    Only the bytes of the value being decoded are buffered: each value is handed to the
+    C decoder of the standard library as soon as it is complete, and the buffer is
+    trimmed as values are consumed.
+    """
+
+    def __init__(self, chunks: Iterable[bytes]) -> None:
+        self._chunks = iter(chunks)
+        self._text_decoder = codecs.getincrementaldecoder("utf-8")()
+        self._json_decoder = json.JSONDecoder()
+        self._buffer = ""
+        self._pos = 0
+        self._eof = False
+
+    def _fill(self) -> bool:
+        """Append the next chunk to the buffer, returning False at the end of the input."""
+        while not self._eof:
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                self._eof = True
+                text = self._text_decoder.decode(b"", final=True)
+            else:
+                text = self._text_decoder.decode(chunk)
+            if text:
+                self._buffer = self._buffer[self._pos:] + text
+                self._pos = 0
+                return True
+        return False
+
+    def peek(self) -> str:
+        """Return the next non-whitespace character without consuming it, or "" at the end."""
+        while True:
+            while self._pos < len(self._buffer) and self._buffer[self._pos] in JSON_WHITESPACE:
+                self._pos += 1
+            if self._pos < len(self._buffer):
+                return self._buffer[self._pos]
+            if not self._fill():
+                return ""
+
+    def expect(self, *chars: str) -> str:
+        """Consume the next non-whitespace character, which must be one of `chars`."""
+        char = self.peek()
+        if char not in chars or not char:
+            raise ValueError(
+                f"Invalid JSON response: expected {' or '.join(chars)} but got {char or 'end of input'}"
+            )
+        self._pos += 1
+        return char
+
+    def read_value(self) -> Any:
+        """Decode the next JSON value."""
+        self.peek()
+        while True:
+            try:
+                value, end = self._json_decoder.raw_decode(self._buffer, self._pos)
+            except json.JSONDecodeError:
+                if self._fill():
+                    continue
+                raise
+            # A number at the end of the buffer may continue in the next chunk
+            if end == len(self._buffer) and self._fill():
+                continue
+            self._pos = end
+            return value
+
+
+class StreamedResponse:
+    """
+    The JSON object body of a response, parsed while it is read from the connection.
+    ~~~
+    Zoho CRM returns the records of a page before its `info` block, so the records are
+    yielded one by one by `get(data_key)` as they arrive, and the members which follow,
+    such as `info`, are decoded once they are looked up. The response is read once, in
+    order: looking up a member which follows a partially consumed array skips the rest
+    of the array.
+    """
+
+    def __init__(self, chunks: Iterable[bytes]) -> None:
+        self._reader = JSONStreamReader(chunks)
+        self._members: Dict[str, Any] = {}
+        self._started = False
+        self._finished = False
+        self._in_array = False
+        self._first_item = False
+
+    @classmethod
+    def from_response(cls, response) -> "StreamedResponse":
+        """Stream the body of a `requests` response opened with `stream=True`."""
+        return cls(response.iter_content(chunk_size=RESPONSE_CHUNK_SIZE))
+
+    def __bool__(self) -> bool:
+        return True
+
+    def _next_key(self) -> Optional[str]:
+        """Advance to the next member of the object and return its key, or None after the last one."""
+        if self._finished:
+            return None
+        # Skip the rest of an array the caller stopped consuming
+        while self._in_array:
+            self._next_item()
+
+        reader = self._reader
+        if not self._started:
+            reader.expect("{")
+            self._started = True
+            if reader.peek() == "}":
+                reader.expect("}")
+                self._finished = True
+                return None
+        elif reader.expect(",", "}") == "}":
+            self._finished = True
+            return None
+
+        key = reader.read_value()
+        reader.expect(":")
+        return key
+
+    def _next_item(self) -> Any:
+        """Read the next item of the array being streamed, or return END_OF_ARRAY after its last item."""
+        reader = self._reader
+        if self._first_item:
+            self._first_item = False
+            if reader.peek() != "]":
+                return reader.read_value()
+        if reader.expect(",", "]") == "]":
+            self._in_array = False
+            return END_OF_ARRAY
+        return reader.read_value()
+
+    def _iter_array(self) -> Iterator:
+        """Yield the items of the array being streamed."""
+        while self._in_array:
+            item = self._next_item()
+            if item is END_OF_ARRAY:
+                return
+            yield item
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Return the value of `key`, or an iterator over its items when it is an array
+        which has not been read yet."""
+        if key in self._members:
+            return self._members[key]
+
+        while True:
+            member_key = self._next_key()
+            if member_key is None:
+                return default
+            if member_key == key and self._reader.peek() == "[":
+                self._reader.expect("[")
+                self._in_array = True
+                self._first_item = True
+                self._members[key] = []
+                return self._iter_array()
+            self._members[member_key] = self._reader.read_value()
+            if member_key == key:
+                return self._members[key]
+
+    def read_rest(self) -> Dict[str, Any]:
+        """Decode every remaining member and return the members which were not streamed."""
+        member_key = self._next_key()
+        while member_key is not None:
+            self._members[member_key] = self._reader.read_value()
+            member_key = self._next_key()
+        return self._members
+
+    def __contains__(self, key: str) -> bool:
+        if key not in self._members:
+            self.get(key)
+        return key in self._members
+
+    def __getitem__(self, key: str) -> Any:
+        if key not in self:
+            raise KeyError(key)
+        return self._members[key]
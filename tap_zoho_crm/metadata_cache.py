@@ -0,0 +1,78 @@
+import os
+import json
+import time
+import hashlib
+from datetime import datetime, timezone
+from typing import Any, Dict, Mapping, Optional
+from singer import get_logger
+
+from tap_zoho_crm.helpers import ZOHO_DATETIME_FORMAT
+
+LOGGER = get_logger()
+DEFAULT_METADATA_CACHE_TTL = 86400
+MODULES_CACHE_KEY = "_modules"
+
+
+class MetadataCache:
+    """
+    An opt-in on-disk cache for the `settings/modules` and `settings/fields` responses.
+    ~~~
+    Entries are stored as one JSON file per module under a directory keyed by the
+    account (a hash of the client id and refresh token, so no secret is written to disk).
+    Entries older than the TTL are revalidated with an `If-Modified-Since` request.
+    """
+
+    def __init__(self, cache_dir: str, org_key: str, ttl: float, force_refresh: bool = False) -> None:
+        self.cache_dir = os.path.join(cache_dir, org_key)
+        self.ttl = ttl
+        self.force_refresh = force_refresh
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+    @classmethod
+    def from_config(cls, config: Mapping[str, Any]) -> Optional["MetadataCache"]:
+        """Build the cache from the tap config, or return None if caching is not enabled."""
+        cache_dir = config.get("metadata_cache_dir")
+        if not cache_dir:
+            return None
+
+        org_key = hashlib.sha256(
+            f"{config.get('client_id')}:{config.get('refresh_token')}".encode("utf-8")
+        ).hexdigest()[:16]
+        config_ttl = config.get("metadata_cache_ttl")
+        ttl = float(config_ttl) if config_ttl else DEFAULT_METADATA_CACHE_TTL
+        force_refresh = str(config.get("refresh_metadata_cache", False)).lower() == "true"
+        return cls(cache_dir, org_key, ttl, force_refresh)
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, f"{key}.json")
+
+    def read(self, key: str) -> Optional[Dict]:
+        """Return the cached entry for the key, or None if it is missing or a refresh is forced."""
+        if self.force_refresh:
+            return None
+        try:
+            with open(self._path(key)) as cache_file:
+                return json.load(cache_file)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as err:
+            LOGGER.warning(f"Ignoring unreadable metadata cache entry '{key}': {err}")
+            return None
+
+    def is_fresh(self, entry: Dict) -> bool:
+        """Whether the entry is younger than the TTL and can be used without a request."""
+        return time.time() - entry.get("fetched_at", 0) < self.ttl
+
+    def write(self, key: str, response: Any) -> Dict:
+        """Store the response atomically and return the new entry."""
+        entry = {
+            "fetched_at": time.time(),
+            "last_modified": datetime.now(timezone.utc).strftime(ZOHO_DATETIME_FORMAT),
+            "response": response
+        }
+        path = self._path(key)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w") as cache_file:
+            json.dump(entry, cache_file)
+        os.replace(tmp_path, path)
+        return entry
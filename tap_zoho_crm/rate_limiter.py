@@ -0,0 +1,136 @@
+import threading
+import time
+from typing import Mapping, Optional, Tuple
+from singer import get_logger, metrics
+
+LOGGER = get_logger()
+RATE_LIMITER_WAIT_METRIC = "rate_limiter_wait"
+# Requests are paced once fewer than this share of the window's calls remain
+ADAPTIVE_THROTTLE_THRESHOLD = 0.2
+MAX_RATE_LIMIT_RETRY_WAIT = 60
+
+
+def parse_rate_limit_headers(headers: Optional[Mapping[str, str]]) -> Tuple[Optional[int], Optional[int], Optional[float]]:
+    """
+    Parse the `X-RATELIMIT-LIMIT`, `X-RATELIMIT-REMAINING` and `X-RATELIMIT-RESET` headers
+    Zoho CRM returns on every response. Returns the window's limit, the remaining calls
+    and the seconds until the window resets, each None when absent or malformed.
+    """
+    if not headers:
+        return None, None, None
+
+    def to_int(value):
+        try:
+            return int(value)
+        except (TypeError, ValueError):
+            return None
+
+    limit = to_int(headers.get("X-RATELIMIT-LIMIT"))
+    remaining = to_int(headers.get("X-RATELIMIT-REMAINING"))
+    reset_at = to_int(headers.get("X-RATELIMIT-RESET"))
+    # The reset time is an epoch timestamp in milliseconds
+    reset_in = max(0.0, reset_at / 1000.0 - time.time()) if reset_at else None
+    return limit, remaining, reset_in
+
+
+def rate_limit_wait(*, factor: float = 1, max_value: float = MAX_RATE_LIMIT_RETRY_WAIT):
+    """
+    A backoff wait generator for rate limit errors: waits the delay requested by the API
+    (`retry_after`) when known, and grows exponentially from `factor` otherwise.
+    """
+    exception = yield
+    attempt = 0
+    while True:
+        retry_after = getattr(exception, "retry_after", None)
+        if retry_after is not None:
+            wait = retry_after
+        else:
+            wait = min(factor * 2 ** attempt, max_value)
+        attempt += 1
+        LOGGER.warning(f"Rate limited. Retrying in {wait} seconds...")
+        exception = yield wait
+
+
+class RateLimiter:
+    """
+    A thread-safe token bucket shared by every request of a `Client`.
+    ~~~
+    Enforces:
+     - a limit on the number of requests in flight at once, matching the concurrency
+       limit of the Zoho CRM edition
+     - optionally, a sustained number of requests per minute; the bucket holds up to
+       `max_concurrent_requests` tokens, so short bursts never exceed the concurrency limit
+
+    The rate limit headers of every response adapt the pace: when few calls remain in the
+    current window, requests are spread evenly until it resets, and the pacing is lifted
+    as soon as the headers show enough headroom again.
+
+    The time a request spends waiting for a slot or a token is emitted as a timer metric.
+    """
+
+    def __init__(self, max_concurrent_requests: int, requests_per_minute: Optional[float] = None) -> None:
+        self.max_concurrent_requests = max_concurrent_requests
+        self.requests_per_minute = requests_per_minute
+        self.total_wait = 0.0
+        self._slots = threading.BoundedSemaphore(max_concurrent_requests)
+        self._lock = threading.Lock()
+        self._capacity = float(max_concurrent_requests)
+        self._tokens = self._capacity
+        self._updated_at = time.monotonic()
+        self._min_interval = 0.0
+        self._next_request_at = 0.0
+
+    def _take_token(self) -> float:
+        """Take a token if one is available, otherwise return the seconds until the next one."""
+        with self._lock:
+            now = time.monotonic()
+            refill_rate = self.requests_per_minute / 60.0
+            self._tokens = min(self._capacity, self._tokens + (now - self._updated_at) * refill_rate)
+            self._updated_at = now
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return 0.0
+            return (1 - self._tokens) / refill_rate
+
+    def acquire(self, endpoint: Optional[str] = None) -> float:
+        """Block until the request may be sent and return the seconds spent waiting."""
+        started_at = time.monotonic()
+        self._slots.acquire()
+        if self.requests_per_minute:
+            wait_time = self._take_token()
+            while wait_time:
+                time.sleep(wait_time)
+                wait_time = self._take_token()
+
+        with self._lock:
+            now = time.monotonic()
+            start_at = max(now, self._next_request_at)
+            self._next_request_at = start_at + self._min_interval
+        if start_at > now:
+            time.sleep(start_at - now)
+
+        waited = time.monotonic() - started_at
+        if waited > 0.001:
+            with self._lock:
+                self.total_wait += waited
+            metrics.log(LOGGER, metrics.Point(
+                "timer", RATE_LIMITER_WAIT_METRIC, waited, {metrics.Tag.endpoint: endpoint}
+            ))
+        return waited
+
+    def release(self) -> None:
+        self._slots.release()
+
+    def update_from_headers(self, headers: Optional[Mapping[str, str]]) -> None:
+        """Adapt the pace to the rate limit headers of a response."""
+        limit, remaining, reset_in = parse_rate_limit_headers(headers)
+        if remaining is None or reset_in is None:
+            return
+
+        with self._lock:
+            if limit and remaining >= limit * ADAPTIVE_THROTTLE_THRESHOLD:
+                self._min_interval = 0.0
+            else:
+                self._min_interval = reset_in / max(remaining, 1)
+                if remaining == 0:
+                    self._next_request_at = max(self._next_request_at, time.monotonic() + reset_in)
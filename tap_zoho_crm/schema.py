@@ -1,5 +1,6 @@
 import os
 import json
+from concurrent.futures import ThreadPoolExecutor
 import singer
 from typing import Dict, Tuple, Optional, Any, Mapping, List
 from singer import (
@@ -9,6 +10,7 @@ from singer import (
 
 from tap_zoho_crm.streams import STREAMS
 from tap_zoho_crm.client import Client
+from tap_zoho_crm.metadata_cache import MODULES_CACHE_KEY
 
 LOGGER = singer.get_logger()
 PK_OVERRIDES = {}
@@ -233,10 +235,9 @@ def get_dynamic_schema(client: Client) -> Tuple[Dict, Dict]:
         if module.get("viewable") and module.get("api_supported")]
 
     available_modules.extend(FIELD_METADATA_ONLY_MODULES)
+    modules_field_metadata = get_modules_field_metadata(client, available_modules)
 
-    for module in available_modules:
-        module_metadata = get_dynamic_metadata(client, module=module)
-        module_metadata = module_metadata.get("fields", [])
+    for module, module_metadata in modules_field_metadata.items():
         if not module_metadata:
             LOGGER.info(f"Skipping module {module}: No field metadata available.")
             continue
@@ -277,29 +278,86 @@ def get_dynamic_schema(client: Client) -> Tuple[Dict, Dict]:
         if replication_key:
             mdata = metadata.write(
                 mdata, ('properties', replication_key), 'inclusion', 'automatic')
+        mdata = metadata.write(mdata, (), 'module-api-name', module)
 
         field_metadata[module] = metadata.to_list(mdata)
 
     return schemas, field_metadata
 
 
+def get_modules_field_metadata(client: Client, modules: List[str]) -> Dict[str, List[Dict]]:
+    """
+    Fetch the field metadata of every module on a bounded thread pool and return it
+    keyed by module, in the same order as `modules`. A module whose fetch fails is
+    logged and left out without aborting the remaining fetches.
+    """
+    if not modules:
+        return {}
+
+    max_workers = max(1, min(len(modules), client.max_concurrent_requests))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {
+            module: executor.submit(get_dynamic_metadata, client, module=module)
+            for module in modules
+        }
+
+    modules_field_metadata = {}
+    for module, future in futures.items():
+        try:
+            modules_field_metadata[module] = future.result().get("fields", [])
+        except Exception as err:
+            LOGGER.error(f"Skipping module {module}: Failed to fetch field metadata: {err}")
+
+    return modules_field_metadata
+
+
 def get_dynamic_metadata(client: Client, module: Optional[str] = None) -> Optional[Mapping[Any, Any]]:
     """
     Fetch dynamic metadata from the Zoho CRM API.
+    When the metadata cache is enabled, a fresh cached response is returned without a
+    request and a stale one is revalidated with an `If-Modified-Since` request. Zoho
+    answers that request with the modified items only, so when anything was modified
+    the full list is fetched again.
     """
     params = {}
     if module is None:
         path = "settings/modules"
         endpoint_tag = "modules"
+        data_key = "modules"
     else:
         path = f"settings/fields"
         endpoint_tag = module
+        data_key = "fields"
         params = {"module": module}
 
+    cache = client.metadata_cache
+    cache_key = module or MODULES_CACHE_KEY
+    cached_entry = cache.read(cache_key) if cache else None
+    if cached_entry and cache.is_fresh(cached_entry):
+        LOGGER.info(f"Using cached metadata for {endpoint_tag}")
+        return cached_entry["response"]
+
+    headers = {}
+    if cached_entry:
+        headers["If-Modified-Since"] = cached_entry["last_modified"]
+
     endpoint = f"{client.base_url}/{path}"
     with metrics.http_request_timer("describe") as timer:
         timer.tags['endpoint'] = endpoint_tag
-        response = client.make_request('GET', endpoint, params=params)
+        response = client.make_request('GET', endpoint, params=params, headers=headers)
 
-    return response
+    if cached_entry:
+        if response is None:
+            LOGGER.info(f"Cached metadata for {endpoint_tag} is not modified")
+            response = cached_entry["response"]
+        else:
+            LOGGER.info(f"Cached metadata for {endpoint_tag} is modified, fetching it again")
+            with metrics.http_request_timer("describe") as timer:
+                timer.tags['endpoint'] = endpoint_tag
+                response = client.make_request('GET', endpoint, params=params, headers={})
+
+    # Skippable errors, such as NO_PERMISSION, answer without the list and are not cached
+    if cache and isinstance(response, dict) and data_key in response:
+        cache.write(cache_key, response)
 
+    return response
@@ -1,20 +1,82 @@
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+import copy
+import functools
 import json
-from typing import Any, Dict, Tuple, List, Iterator
+import time
+from datetime import timedelta
+from typing import Any, Callable, Dict, Tuple, List, Iterator, Optional
+import backoff
+from requests.exceptions import Timeout, ConnectionError, ChunkedEncodingError
 from singer import (
     Transformer,
     get_bookmark,
     get_logger,
     metrics,
     write_bookmark,
-    write_record,
-    write_schema,
     metadata,
-    utils
+    utils,
+    clear_bookmark
 )
 
+from tap_zoho_crm.backfill import (
+    BACKFILL_BUFFER_PAGES,
+    get_backfill_settings,
+    get_low_water_mark,
+    get_window_position,
+    split_windows
+)
+from tap_zoho_crm.bulk_read import BulkReader
+from tap_zoho_crm.coql import CoqlReader, coql_datetime
+from tap_zoho_crm.exceptions import ZohoCRMBadRequestError
+from tap_zoho_crm.helpers import (
+    END_OF_ITERATOR,
+    ZOHO_DATETIME_FORMAT,
+    get_config_list,
+    interleave,
+    is_list_of_objects
+)
+from tap_zoho_crm.writer import write_record, write_schema, write_state
+
 LOGGER = get_logger()
 FIELD_BATCH_SIZE = 50
+# Max number of record ids the records API accepts in the `ids` param
+MAX_IDS_PER_REQUEST = 100
+STATE_CHECKPOINT_RECORDS = 1000
+STATE_CHECKPOINT_INTERVAL = 300
+# Zoho CRM page tokens are valid for a day after they are issued
+PAGE_TOKEN_EXPIRY_IN_SECONDS = 86400
+# Errors raised while a streamed body is read, after `make_request` has returned
+STREAMED_BODY_ERRORS = (ConnectionResetError, ConnectionError, ChunkedEncodingError, Timeout)
+
+
+def retry_streamed_body(fetch: Callable) -> Callable:
+    """Fetch a page again when the connection is lost while its streamed body is read.
+    Loaded bodies are read within `make_request`, which already retries these errors,
+    so the page is only retried when it is called with `stream` set."""
+    retrying_fetch = backoff.on_exception(
+        wait_gen=backoff.expo,
+        exception=STREAMED_BODY_ERRORS,
+        max_tries=5,
+        factor=2
+    )(fetch)
+
+    @functools.wraps(fetch)
+    def wrapper(*args, stream: bool = False, **kwargs):
+        if stream:
+            return retrying_fetch(*args, stream=stream, **kwargs)
+        return fetch(*args, stream=stream, **kwargs)
+    return wrapper
+
+
+def prefetch(iterator: Iterator, buffer_size: int) -> Iterator:
+    """Consume `iterator` on a background thread, keeping at most `buffer_size` items
+    buffered ahead of the caller. Exceptions raised by the iterator are re-raised in the
+    caller, and the thread stops when the caller stops consuming.
+    """
+    for _, item in interleave([iterator], 1, buffer_size, thread_name_prefix="page-prefetch"):
+        if item is not END_OF_ITERATOR:
+            yield item
 
 
 class BaseStream(ABC):
@@ -42,6 +104,8 @@ class BaseStream(ABC):
     http_method = "GET"
     pagination_supported = True
     is_dynamic = False
+    if_modified_since_supported = False
+    sort_by = ""
 
     def __init__(self, client=None, catalog=None) -> None:
         self.client = client
@@ -51,6 +115,8 @@ class BaseStream(ABC):
         self.child_to_sync = []
         self.params = {}
         self.data_payload = {}
+        self.headers = dict(self.headers)
+        self.coql_after = None
 
     @property
     @abstractmethod
@@ -103,31 +169,61 @@ class BaseStream(ABC):
         """
 
     def get_records(self) -> Iterator:
-        """Fetch records from the Zoho CRM API, handling pagination and dynamic field batching.
+        """Fetch records from the Zoho CRM API page by page.
+        With `prefetch_pages` set, the pages are fetched on a background thread into a
+        queue of that many pages, so that the next page is in flight while the current
+        one is transformed and written. Once every record of a page has been consumed,
+        the cursor of the next page is handed to `checkpoint_pagination`.
+        Streams listed in `bulk_read_streams` are read through the Bulk Read API instead.
+        """
+        if self.is_bulk_read():
+            yield from self.get_bulk_records()
+            return
+
+        pages = self.get_pages()
+        config_prefetch_pages = self.client.config.get("prefetch_pages")
+        if config_prefetch_pages and int(config_prefetch_pages) > 0:
+            pages = prefetch(pages, int(config_prefetch_pages))
+
+        for records, next_page_cursor in pages:
+            yield from records
+            if next_page_cursor:
+                self.checkpoint_pagination(next_page_cursor)
+
+    def get_pages(self) -> Iterator[Tuple[List[Dict], Optional[Dict]]]:
+        """Fetch the pages of the stream, handling pagination and dynamic field batching.
+        Yields the records of each page with the cursor of the next page, or None for the last page.
         - For static streams: makes paginated API requests and yields records directly.
-        - For dynamic streams: batches fields into groups of 50 (due to API limits), merges partial
+        - For dynamic streams: batches fields into groups of 50 (due to API limits), fetches the
+        batches of a page concurrently (bounded by `max_concurrent_requests`), merges partial
         records across field batches by record ID, and yields fully combined records.
+        With `stream_responses` set, the records of each response are parsed and merged one by
+        one while the body is read, rather than after the whole body is loaded. A page is
+        still yielded once it is complete, and a connection lost while a body is read
+        fetches the page again.
+        With `hydrate_by_id` set, dynamic streams list the ids of a page first and fetch the
+        field batches of those ids, see `get_hydrated_pages`.
+        Streams listed in `coql_streams` are paged with COQL queries instead.
         """
+        if self.is_coql():
+            yield from self.get_coql_pages()
+            return
+
         self.params["per_page"] = self.page_size
+        stream_responses = str(self.client.config.get("stream_responses", False)).lower() == "true"
 
         if not self.is_dynamic:
-            next_page = 1
+            next_page = self.params.get(self.next_page_key, 1)
             while next_page:
-                response = self.client.make_request(
-                    self.http_method,
-                    self.url_endpoint,
-                    self.params,
-                    self.headers,
-                    body=json.dumps(self.data_payload),
-                    path=self.path
-                )
-                raw_records = response.get(self.data_key, [])
-                next_page = self.update_pagination_key(response, next_page)
-                yield from raw_records
+                raw_records, page_info = self.fetch_page(stream=stream_responses)
+                next_page = self.update_pagination_key(page_info, next_page)
+                yield raw_records, self.get_pagination_cursor() if next_page else None
             return
 
         # Dynamic stream logic: field batching with merging
-        field_names = list(self.schema.get("properties", {}).keys())
+        # The aiohttp engine loads the bodies it fetches, and retries them on its own
+        stream_responses = stream_responses and not self.client.async_client
+        field_names = self.get_selected_fields()
         if "id" not in field_names:
             field_names.insert(0, "id")
 
@@ -135,37 +231,261 @@ class BaseStream(ABC):
             field_names[item:item + FIELD_BATCH_SIZE]
             for item in range(0, len(field_names), FIELD_BATCH_SIZE)
             ]
-        next_page = 1
-
-        while next_page:
-            merged_records: Dict[str, Dict] = {}
-            response = None
-
-            for field_batch in batched_fields:
-                self.params["fields"] = ",".join(field_batch)
-                response = self.client.make_request(
-                    self.http_method,
-                    self.url_endpoint,
-                    self.params,
-                    self.headers,
-                    body=json.dumps(self.data_payload),
-                    path=self.path
-                )
+        hydrate_by_id = str(self.client.config.get("hydrate_by_id", False)).lower() == "true"
+        if hydrate_by_id and len(batched_fields) > 1:
+            yield from self.get_hydrated_pages(batched_fields, stream_responses)
+            return
 
-                records = response.get(self.data_key, [])
-                for record in records:
-                    record_id = record.get("id")
-                    if not record_id:
-                        continue
-                    if record_id not in merged_records:
-                        merged_records[record_id] = {}
-                    merged_records[record_id].update(record)
+        max_workers = max(1, min(len(batched_fields), self.client.max_concurrent_requests))
+        next_page = self.params.get(self.next_page_key, 1)
 
-            next_page = self.update_pagination_key(response, next_page) if response else None
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            while next_page:
+                records, page_info = self.fetch_merged_page(batched_fields, executor, stream=stream_responses)
+                next_page = self.update_pagination_key(page_info, next_page)
+                yield records, self.get_pagination_cursor() if next_page else None
+
+    @retry_streamed_body
+    def fetch_page(self, stream: bool = False) -> Tuple[List[Dict], Dict]:
+        """Fetch the current page of a static stream and return its records along with its
+        `info` block. A streamed body is read to its end here, within the retries."""
+        response = self.client.make_request(
+            self.http_method,
+            self.url_endpoint,
+            self.params,
+            self.headers,
+            body=json.dumps(self.data_payload),
+            path=self.path,
+            stream=stream
+        )
+        # A conditional request answers 304 (None) when nothing was modified
+        response = response or {}
+        # The page's `info` block follows its records in a streamed response
+        raw_records = list(response.get(self.data_key, []))
+        return raw_records, {"info": response["info"]} if "info" in response else {}
+
+    @retry_streamed_body
+    def fetch_merged_page(
+            self,
+            batched_fields: List[List[str]],
+            executor: ThreadPoolExecutor,
+            stream: bool = False
+        ) -> Tuple[List[Dict], Dict]:
+        """Fetch every field batch of the current page, merge the partial records by id and
+        return them along with the page's `info` block. Streamed bodies are read here, so a
+        connection lost while one is read fetches the whole page again."""
+        if self.client.async_client:
+            responses = self.client.async_client.make_requests(
+                [self.get_field_batch_request(field_batch) for field_batch in batched_fields])
+            # A conditional request answers 304 (None) when nothing was modified
+            responses = [response or {} for response in responses]
+        else:
+            responses = executor.map(
+                lambda field_batch: self.fetch_field_batch(field_batch, stream=stream),
+                batched_fields
+            )
 
-            for record in merged_records.values():
-                yield record
+        # Responses are in batch order, so merging stays deterministic
+        merged_records: Dict[str, Dict] = {}
+        response = None
+        for response in responses:
+            records = response.get(self.data_key, [])
+            for record in records:
+                record_id = record.get("id")
+                if not record_id:
+                    continue
+                if record_id not in merged_records:
+                    merged_records[record_id] = {}
+                merged_records[record_id].update(record)
+
+        page_info = {"info": response["info"]} if response and "info" in response else {}
+        return list(merged_records.values()), page_info
+
+    def get_hydrated_pages(
+            self, batched_fields: List[List[str]], stream_responses: bool = False
+        ) -> Iterator[Tuple[List[Dict], Optional[Dict]]]:
+        """Fetch the pages of a dynamic stream in two phases: the page is listed with its
+        record ids only, then every field batch is fetched for those ids with `ids` requests.
+        Every batch describes the same records even when records are modified between the
+        requests of a page. The sort key is listed along with the ids, so that the records of
+        a page keep the order they were listed in.
+        """
+        max_workers = max(1, self.client.max_concurrent_requests)
+        next_page = self.params.get(self.next_page_key, 1)
+        listed_fields = ["id"] + ([self.sort_by] if self.sort_by else [])
 
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            while next_page:
+                response = self.fetch_field_batch(listed_fields)
+                listed_records = [record for record in response.get(self.data_key, []) if record.get("id")]
+                next_page = self.update_pagination_key(response, next_page)
+                records = self.hydrate_records(listed_records, batched_fields, executor, stream=stream_responses)
+                yield records, self.get_pagination_cursor() if next_page else None
+
+    def get_hydration_request(self, field_batch: List[str], record_ids: List[str]) -> Dict:
+        """Return the `make_request` arguments which fetch a batch of fields of the given records."""
+        # The listed records are fetched whatever their modified time
+        headers = {key: value for key, value in self.headers.items() if key != "If-Modified-Since"}
+        return {
+            "method": self.http_method,
+            "endpoint": self.url_endpoint,
+            "params": {"ids": ",".join(record_ids), "fields": ",".join(field_batch)},
+            "headers": headers,
+            "body": json.dumps(self.data_payload),
+            "path": self.path
+        }
+
+    @retry_streamed_body
+    def hydrate_records(
+            self,
+            listed_records: List[Dict],
+            batched_fields: List[List[str]],
+            executor: ThreadPoolExecutor,
+            stream: bool = False
+        ) -> List[Dict]:
+        """Fetch every field batch of the listed records, `MAX_IDS_PER_REQUEST` ids per
+        request, and merge them in the order they were listed. Records deleted since they
+        were listed are left out."""
+        record_ids = [record["id"] for record in listed_records]
+        id_chunks = [
+            record_ids[item:item + MAX_IDS_PER_REQUEST]
+            for item in range(0, len(record_ids), MAX_IDS_PER_REQUEST)
+        ]
+        requests = [
+            self.get_hydration_request(field_batch, id_chunk)
+            for field_batch in batched_fields
+            for id_chunk in id_chunks
+        ]
+        if self.client.async_client:
+            responses = [response or {} for response in self.client.async_client.make_requests(requests)]
+        else:
+            responses = executor.map(
+                lambda request: self.client.make_request(**request, stream=stream) or {},
+                requests
+            )
+
+        merged_records: Dict[str, Dict] = {record_id: {} for record_id in record_ids}
+        for response in responses:
+            for record in response.get(self.data_key, []):
+                merged_record = merged_records.get(record.get("id"))
+                if merged_record is not None:
+                    merged_record.update(record)
+
+        records = []
+        for listed_record in listed_records:
+            record = merged_records[listed_record["id"]]
+            if not record:
+                continue
+            # A record modified since it was listed keeps its listed sort key, so the page stays
+            # in order for the bookmark and the backfill windows; its new version is listed later
+            record.update(listed_record)
+            records.append(record)
+        return records
+
+    def is_bulk_read(self) -> bool:
+        """Whether the stream is a module extracted through the Bulk Read API."""
+        return self.is_dynamic and self.tap_stream_id in get_config_list(self.client.config, "bulk_read_streams")
+
+    def get_bulk_read_criteria(self) -> Optional[Dict]:
+        """Return the criteria of the bulk read jobs, or None to export every record."""
+        return None
+
+    def get_bulk_records(self) -> Iterator[Dict]:
+        """Export the selected fields of the module with bulk read jobs and yield the records
+        in the shape of the records API. Fields the export does not include are left out."""
+        properties = self.schema.get("properties", {})
+        field_names = self.get_fields_without_object_lists("is not available through bulk read")
+        bulk_reader = BulkReader(self.client, self.path, field_names, properties, self.get_bulk_read_criteria())
+        return bulk_reader.get_records()
+
+    def is_coql(self) -> bool:
+        """Whether the stream is a module paged with COQL queries."""
+        return self.is_dynamic and self.tap_stream_id in get_config_list(self.client.config, "coql_streams")
+
+    def get_coql_conditions(self) -> List[str]:
+        """Return the conditions of the COQL queries, beyond the keyset of the last record read."""
+        return []
+
+    def get_coql_pages(self) -> Iterator[Tuple[List[Dict], Optional[Dict]]]:
+        """Page through the module with COQL queries, ordered by the sort key and id.
+        Each page is followed by the cursor holding the keyset of its last record.
+        Fields COQL cannot select are left out."""
+        field_names = self.get_fields_without_object_lists("cannot be selected with COQL")
+        coql_reader = CoqlReader(
+            self.client,
+            self.path,
+            field_names,
+            sort_key=self.sort_by or None,
+            conditions=self.get_coql_conditions(),
+            after=self.coql_after
+        )
+        for records, after in coql_reader.get_pages():
+            self.coql_after = after
+            yield records, self.get_pagination_cursor()
+
+    def get_pagination_cursor(self) -> Dict:
+        """Return the pagination params which fetch the next page."""
+        cursor = {
+            "page": self.params.get(self.next_page_key, 1),
+            "page_token": self.params.get(self.next_page_token)
+        }
+        if self.coql_after:
+            cursor["after"] = self.coql_after
+        return cursor
+
+    def checkpoint_pagination(self, next_page_cursor: Dict) -> None:
+        """Called once every record of a page has been consumed, with the cursor of the
+        next page. Streams which can resume mid-stream persist the cursor here.
+        """
+
+    def get_selected_fields(self) -> List[str]:
+        """Return the schema fields which will survive the transformer's metadata filter.
+        Deselected and unsupported fields are left out so that they are not requested
+        from the API; primary and replication keys are always requested.
+        """
+        required_fields = list(self.key_properties) + list(self.replication_keys or [])
+        field_names = [field for field in required_fields if field]
+        for field_name in self.schema.get("properties", {}).keys():
+            if field_name in field_names:
+                continue
+            breadcrumb = ("properties", field_name)
+            inclusion = metadata.get(self.metadata, breadcrumb, "inclusion")
+            selected = metadata.get(self.metadata, breadcrumb, "selected")
+            if inclusion == "automatic" or (selected is not False and inclusion != "unsupported"):
+                field_names.append(field_name)
+        return field_names
+
+    def get_fields_without_object_lists(self, reason: str) -> List[str]:
+        """Return the selected fields, leaving out and logging those which hold lists of
+        objects, which bulk reads and COQL queries cannot fetch; `reason` says why."""
+        properties = self.schema.get("properties", {})
+        field_names = []
+        for field_name in self.get_selected_fields():
+            if not is_list_of_objects(properties.get(field_name, {})):
+                field_names.append(field_name)
+            else:
+                LOGGER.info("Field {} of {} {}, skipping it".format(field_name, self.tap_stream_id, reason))
+        return field_names
+
+    def get_field_batch_request(self, field_batch: List[str]) -> Dict:
+        """Return the `make_request` arguments which fetch the current page restricted to
+        a single batch of fields. The params are copied so that concurrent batches do not
+        overwrite each other's `fields` value.
+        """
+        return {
+            "method": self.http_method,
+            "endpoint": self.url_endpoint,
+            "params": dict(self.params, fields=",".join(field_batch)),
+            "headers": self.headers,
+            "body": json.dumps(self.data_payload),
+            "path": self.path
+        }
+
+    def fetch_field_batch(self, field_batch: List[str], stream: bool = False) -> Dict:
+        """Fetch the current page restricted to a single batch of fields."""
+        response = self.client.make_request(**self.get_field_batch_request(field_batch), stream=stream)
+        # A conditional request answers 304 (None) when nothing was modified
+        return response or {}
 
     def write_schema(self) -> None:
         """
@@ -226,6 +546,8 @@ class BaseStream(ABC):
 class IncrementalStream(BaseStream):
     """Base Class for Incremental Stream."""
 
+    # Upper bound of the replication key while a backfill window is fetched
+    window_end = None
 
     def get_bookmark(self, state: dict, stream: str, key: Any = None) -> int:
         """A wrapper for singer.get_bookmark to deal with compatibility for
@@ -250,19 +572,89 @@ class IncrementalStream(BaseStream):
         )
 
 
+    def set_incremental_filters(self, bookmark_date: str) -> None:
+        """Push the bookmark to the API so that only modified records are paged.
+        Streams backed by the records API honour the `If-Modified-Since` header and
+        can be sorted by the replication key; the client-side comparison in `sync`
+        remains in place for the others.
+        """
+        self.update_params(updated_since=bookmark_date)
+        if not bookmark_date:
+            return
+
+        if self.if_modified_since_supported:
+            # The header may select the records modified after it, so it is sent a second
+            # early: records of the bookmark's second are fetched again rather than lost
+            self.headers["If-Modified-Since"] = (
+                utils.strptime_to_utc(bookmark_date) - timedelta(seconds=1)
+            ).strftime(ZOHO_DATETIME_FORMAT)
+        if self.sort_by:
+            self.update_params(sort_by=self.sort_by, sort_order="asc")
+
+    def get_bulk_read_criteria(self) -> Optional[Dict]:
+        """Export the records modified since the bookmark, like the `If-Modified-Since` header."""
+        bookmark_date = self.params.get("updated_since")
+        if not bookmark_date or not self.replication_keys:
+            return None
+        return {
+            "field": {"api_name": self.replication_keys[0]},
+            "comparator": "greater_equal",
+            "value": utils.strptime_to_utc(bookmark_date).strftime(ZOHO_DATETIME_FORMAT)
+        }
+
+    def get_coql_conditions(self) -> List[str]:
+        """Query the records modified since the bookmark, and before the end of the
+        backfill window being fetched."""
+        bookmark_date = self.params.get("updated_since")
+        if not bookmark_date or not self.replication_keys:
+            return []
+        conditions = [f"{self.replication_keys[0]} >= {coql_datetime(bookmark_date)}"]
+        if self.window_end:
+            conditions.append(f"{self.replication_keys[0]} < {coql_datetime(self.window_end)}")
+        return conditions
+
+    def get_checkpoint_settings(self) -> Tuple[int, float]:
+        """Return the number of records and the seconds between two in-stream checkpoints."""
+        config = self.client.config
+        checkpoint_records = config.get("state_checkpoint_records")
+        checkpoint_interval = config.get("state_checkpoint_interval")
+        return (
+            int(checkpoint_records) if checkpoint_records else STATE_CHECKPOINT_RECORDS,
+            float(checkpoint_interval) if checkpoint_interval else STATE_CHECKPOINT_INTERVAL
+        )
+
     def sync(
         self,
         state: Dict,
         transformer: Transformer,
         parent_obj: Dict = None,
     ) -> Dict:
-        """Implementation for `type: Incremental` stream."""
+        """Implementation for `type: Incremental` stream.
+        When records arrive sorted by the replication key, the bookmark is written and a
+        STATE message emitted every `state_checkpoint_records` records or
+        `state_checkpoint_interval` seconds, so that an interrupted sync resumes close to
+        where it stopped.
+        """
         bookmark_date = self.get_bookmark(state, self.tap_stream_id)
         current_max_bookmark_date = bookmark_date
-        self.update_params(updated_since=bookmark_date)
+        self.set_incremental_filters(bookmark_date)
+        if self.is_coql():
+            # Resume right after the last record written by an interrupted sync
+            self.coql_after = get_bookmark(state, self.tap_stream_id, "coql_after")
         self.update_data_payload(parent_obj=parent_obj)
         self.url_endpoint = self.get_url_endpoint(parent_obj)
 
+        if parent_obj is None:
+            windows = self.get_backfill_windows(state, bookmark_date)
+            if windows:
+                return self.sync_backfill_windows(state, transformer, windows)
+
+        checkpoint_records, checkpoint_interval = self.get_checkpoint_settings()
+        # Bulk read exports are not sorted, so the bookmark only moves at the end
+        sorted_records = bool(self.sort_by) and not self.is_bulk_read()
+        records_since_checkpoint = 0
+        last_checkpoint_time = time.monotonic()
+
         with metrics.record_counter(self.tap_stream_id) as counter:
             for record in self.get_records():
                 record = self.modify_object(record, parent_obj)
@@ -286,6 +678,153 @@ class IncrementalStream(BaseStream):
                     for child in self.child_to_sync:
                         child.sync(state=state, transformer=transformer, parent_obj=record)
 
+                    # Checkpointing is only safe when records arrive in ascending order
+                    records_since_checkpoint += 1
+                    if sorted_records and (
+                            records_since_checkpoint >= checkpoint_records
+                            or time.monotonic() - last_checkpoint_time >= checkpoint_interval):
+                        state = self.write_bookmark(
+                            state, self.tap_stream_id, value=current_max_bookmark_date)
+                        if self.coql_after:
+                            write_bookmark(state, self.tap_stream_id, "coql_after", {
+                                "id": record["id"], self.sort_by: record[self.sort_by]
+                            })
+                        write_state(state)
+                        records_since_checkpoint = 0
+                        last_checkpoint_time = time.monotonic()
+
+            state = self.write_bookmark(state, self.tap_stream_id, value=current_max_bookmark_date)
+            # The next sync starts from the bookmark itself, to catch records modified
+            # within the same second as the last one
+            if get_bookmark(state, self.tap_stream_id, "coql_after"):
+                clear_bookmark(state, self.tap_stream_id, "coql_after")
+            # Windows left by a backfill are covered by the bookmark, their low-water mark
+            if get_bookmark(state, self.tap_stream_id, "backfill_windows"):
+                clear_bookmark(state, self.tap_stream_id, "backfill_windows")
+            return counter.value
+
+    def get_backfill_windows(self, state: Dict, bookmark_date: str) -> Optional[List[Dict]]:
+        """Return the pending windows of a sharded backfill, or None when the stream is
+        synced through a single cursor. A backfill is sharded when `backfill_window_days`
+        is set and the bookmark is older than one window; an interrupted backfill resumes
+        the windows saved in the state."""
+        window, _ = get_backfill_settings(self.client.config)
+        # Windows resume from the last record they wrote, which needs sorted records
+        if not window or not self.sort_by or self.is_bulk_read() or self.child_to_sync:
+            return None
+
+        saved_windows = get_bookmark(state, self.tap_stream_id, "backfill_windows")
+        if saved_windows:
+            return [dict(saved_window) for saved_window in saved_windows]
+
+        now = utils.now()
+        if utils.strptime_to_utc(bookmark_date) + window >= now:
+            return None
+        return split_windows(bookmark_date, now, window)
+
+    def get_window_stream(self, window: Dict) -> "IncrementalStream":
+        """Return a copy of the stream which pages through the records of one window."""
+        window_stream = copy.copy(self)
+        window_stream.params = {
+            key: value for key, value in self.params.items()
+            if key not in (self.next_page_key, self.next_page_token)
+        }
+        window_stream.headers = dict(self.headers)
+        window_stream.coql_after = None
+        window_stream.window_end = window["end"]
+        window_stream.set_incremental_filters(get_window_position(window))
+        return window_stream
+
+    def get_window_pages(self, window: Dict) -> Iterator[List[Dict]]:
+        """Yield the pages of records modified within a window. Records are sorted by
+        the replication key, so paging stops at the first record past the window."""
+        window_end = utils.strptime_to_utc(window["end"]) if window["end"] else None
+        replication_key = self.replication_keys[0]
+        for records, _ in self.get_window_stream(window).get_pages():
+            if window_end is None:
+                yield records
+                continue
+
+            window_records = [
+                record for record in records
+                if not record.get(replication_key) or utils.strptime_to_utc(record[replication_key]) < window_end
+            ]
+            yield window_records
+            if len(window_records) < len(records):
+                return
+
+    def checkpoint_backfill(self, state: Dict, pending_windows: List[Dict]) -> Dict:
+        """Save the progress of the pending windows and move the bookmark to their low-water mark."""
+        write_bookmark(state, self.tap_stream_id, "backfill_windows",
+                       [dict(window) for window in pending_windows])
+        low_water_mark = get_low_water_mark(pending_windows)
+        if low_water_mark:
+            state = self.write_bookmark(state, self.tap_stream_id, value=low_water_mark)
+        write_state(state)
+        return state
+
+    def sync_backfill_windows(self, state: Dict, transformer: Transformer, windows: List[Dict]) -> int:
+        """Sync the stream by fetching its windows concurrently, `backfill_workers` at a time.
+        Pages are written on the calling thread as they arrive. Each window records the
+        replication key of the last record it wrote, and the bookmark only moves up to
+        the earliest window which is not complete, so an interrupted backfill loses nothing.
+        """
+        _, workers = get_backfill_settings(self.client.config)
+        LOGGER.info("Backfilling {} in {} windows of {} with {} workers".format(
+            self.tap_stream_id, len(windows), self.replication_keys[0], workers))
+
+        replication_key = self.replication_keys[0]
+        pending_windows = list(windows)
+        current_max_bookmark_date = get_low_water_mark(windows)
+        checkpoint_records, checkpoint_interval = self.get_checkpoint_settings()
+        records_since_checkpoint = 0
+        last_checkpoint_time = time.monotonic()
+
+        pages = interleave(
+            [self.get_window_pages(window) for window in windows],
+            workers,
+            workers * BACKFILL_BUFFER_PAGES,
+            thread_name_prefix="backfill-window"
+        )
+        with metrics.record_counter(self.tap_stream_id) as counter:
+            for window_index, records in pages:
+                window = windows[window_index]
+                if records is END_OF_ITERATOR:
+                    LOGGER.info("Backfill window of {} starting at {} is complete".format(
+                        self.tap_stream_id, window["start"]))
+                    pending_windows.remove(window)
+                    state = self.checkpoint_backfill(state, pending_windows)
+                    records_since_checkpoint = 0
+                    last_checkpoint_time = time.monotonic()
+                    continue
+
+                for record in records:
+                    record = self.modify_object(record)
+                    transformed_record = transformer.transform(
+                        record, self.schema, self.metadata
+                    )
+
+                    record_timestamp = transformed_record[replication_key]
+                    if not record_timestamp:
+                        LOGGER.critical("Replication Key is None in response")
+                    elif record_timestamp < get_window_position(window):
+                        continue
+                    else:
+                        window["progress"] = record_timestamp
+                        current_max_bookmark_date = max(current_max_bookmark_date, record_timestamp)
+
+                    if self.is_selected():
+                        write_record(self.tap_stream_id, transformed_record)
+                        counter.increment()
+
+                    records_since_checkpoint += 1
+                    if records_since_checkpoint >= checkpoint_records \
+                            or time.monotonic() - last_checkpoint_time >= checkpoint_interval:
+                        state = self.checkpoint_backfill(state, pending_windows)
+                        records_since_checkpoint = 0
+                        last_checkpoint_time = time.monotonic()
+
+            clear_bookmark(state, self.tap_stream_id, "backfill_windows")
             state = self.write_bookmark(state, self.tap_stream_id, value=current_max_bookmark_date)
             return counter.value
 
@@ -295,29 +834,100 @@ class FullTableStream(BaseStream):
 
     replication_keys = []
 
+    def __init__(self, client=None, catalog=None) -> None:
+        super().__init__(client, catalog)
+        self.pagination_state = None
+
+    def checkpoint_pagination(self, next_page_cursor: Dict) -> None:
+        """Persist the pagination cursor for the next page in the state and emit it."""
+        if self.pagination_state is None:
+            return
+
+        cursor = dict(next_page_cursor, saved_at=utils.strftime(utils.now()))
+        write_bookmark(self.pagination_state, self.tap_stream_id, "pagination", cursor)
+        write_state(self.pagination_state)
+
+    def resume_pagination(self, state: Dict) -> bool:
+        """Restore the pagination cursor of an interrupted sync from the state.
+        Returns True when the stream resumes from a saved cursor. A cursor whose page
+        token has expired is discarded so that the stream restarts from the first page.
+        """
+        cursor = get_bookmark(state, self.tap_stream_id, "pagination")
+        if not cursor:
+            return False
+
+        if cursor.get("after"):
+            self.coql_after = cursor["after"]
+            LOGGER.info("Resuming {} after record {}".format(self.tap_stream_id, cursor["after"]["id"]))
+            return True
+
+        if cursor.get("page_token"):
+            token_age = utils.now() - utils.strptime_to_utc(cursor["saved_at"])
+            if token_age.total_seconds() >= PAGE_TOKEN_EXPIRY_IN_SECONDS:
+                LOGGER.info("Saved page token for {} has expired, restarting the stream".format(
+                    self.tap_stream_id))
+                clear_bookmark(state, self.tap_stream_id, "pagination")
+                return False
+            self.params[self.next_page_token] = cursor["page_token"]
+
+        self.params[self.next_page_key] = cursor["page"]
+        LOGGER.info("Resuming {} from page {}".format(self.tap_stream_id, cursor["page"]))
+        return True
+
+    def reset_pagination(self, state: Dict) -> None:
+        """Drop the pagination cursor so that the stream restarts from the first page."""
+        self.params.pop(self.next_page_key, None)
+        self.params.pop(self.next_page_token, None)
+        self.coql_after = None
+        clear_bookmark(state, self.tap_stream_id, "pagination")
+
     def sync(
         self,
         state: Dict,
         transformer: Transformer,
         parent_obj: Dict = None,
     ) -> Dict:
-        """Abstract implementation for `type: Fulltable` stream."""
+        """Abstract implementation for `type: Fulltable` stream.
+        Top level streams checkpoint their pagination cursor after every page, so that
+        an interrupted sync resumes from the last completed page instead of re-reading
+        the whole table.
+        """
         self.url_endpoint = self.get_url_endpoint(parent_obj)
         self.update_data_payload(parent_obj=parent_obj)
-        with metrics.record_counter(self.tap_stream_id) as counter:
-            for record in self.get_records():
-                transformed_record = transformer.transform(
-                    record, self.schema, self.metadata
-                )
-                if self.is_selected():
-                    write_record(self.tap_stream_id, transformed_record)
-                    counter.increment()
 
-                for child in self.child_to_sync:
-                    child.sync(state=state, transformer=transformer, parent_obj=record)
+        resuming = False
+        if parent_obj is None and self.pagination_supported and not self.is_bulk_read():
+            self.pagination_state = state
+            resuming = self.resume_pagination(state)
 
+        with metrics.record_counter(self.tap_stream_id) as counter:
+            try:
+                self.sync_records(state, transformer, counter)
+            except ZohoCRMBadRequestError:
+                if not resuming or counter.value:
+                    raise
+                LOGGER.warning("Saved pagination cursor for {} was rejected, restarting the stream".format(
+                    self.tap_stream_id))
+                self.reset_pagination(state)
+                self.sync_records(state, transformer, counter)
+
+            if get_bookmark(state, self.tap_stream_id, "pagination"):
+                clear_bookmark(state, self.tap_stream_id, "pagination")
             return counter.value
 
+    def sync_records(self, state: Dict, transformer: Transformer, counter: metrics.Counter) -> None:
+        """Write the records of the stream and sync its children."""
+        for record in self.get_records():
+            transformed_record = transformer.transform(
+                record, self.schema, self.metadata
+            )
+            if self.is_selected():
+                write_record(self.tap_stream_id, transformed_record)
+                counter.increment()
+
+            for child in self.child_to_sync:
+                child.sync(state=state, transformer=transformer, parent_obj=record)
+
 
 class ParentBaseStream(IncrementalStream):
     """Base Class for Parent Stream."""
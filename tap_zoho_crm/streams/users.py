@@ -7,4 +7,5 @@ class Users(IncrementalStream):
     replication_keys = ["Modified_Time"]
     data_key = "users"
     path = "users"
+    if_modified_since_supported = True
 
@@ -1,10 +1,20 @@
-from typing import Dict
+import copy
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional
 import singer
 from singer import metadata
 from tap_zoho_crm.streams import STREAMS, abstracts
 from tap_zoho_crm.client import Client
 from tap_zoho_crm.streams.abstracts import IncrementalStream, FullTableStream
-from tap_zoho_crm.schema import get_dynamic_schema
+from tap_zoho_crm.schema import get_dynamic_metadata
+from tap_zoho_crm.transform import CompiledTransformer
+from tap_zoho_crm.writer import (
+    BufferedOutputWriter,
+    OutputWriter,
+    ThreadedOutputWriter,
+    set_output_writer,
+    write_state
+)
 
 LOGGER = singer.get_logger()
 
@@ -17,7 +27,7 @@ def update_currently_syncing(state: Dict, stream_name: str) -> None:
         del state["currently_syncing"]
     else:
         singer.set_currently_syncing(state, stream_name)
-    singer.write_state(state)
+    write_state(state)
 
 
 def write_schema(stream, client, streams_to_sync, catalog) -> None:
@@ -56,7 +66,9 @@ def build_dynamic_stream(
         "replication_keys": property(lambda self: replication_keys),
         "path": module_path,
         "data_key": "data",
-        "is_dynamic": True
+        "is_dynamic": True,
+        "if_modified_since_supported": True,
+        "sort_by": "Modified_Time" if replication_keys == ["Modified_Time"] else ""
     }
 
     base_class = IncrementalStream if replication_method.upper() == "INCREMENTAL" else FullTableStream
@@ -71,6 +83,41 @@ def build_dynamic_stream(
     return DynamicStreamClass(client, catalog_entry) # pylint: disable=abstract-class-instantiated
 
 
+def get_dynamic_module_paths(
+        client: Client,
+        catalog: singer.Catalog,
+        stream_names: List[str]
+    ) -> Dict[str, str]:
+    """
+    Map the selected dynamic streams to their Zoho CRM module API names.
+    The name is read from the `module-api-name` metadata written during discovery;
+    for catalogs discovered before it existed, the module list is fetched once.
+    """
+    module_paths = {}
+    missing_streams = []
+    for stream_name in stream_names:
+        if stream_name in STREAMS:
+            continue
+        catalog_metadata = metadata.to_map(catalog.get_stream(stream_name).metadata)
+        module_path = catalog_metadata.get((), {}).get('module-api-name')
+        if module_path:
+            module_paths[stream_name] = module_path
+        else:
+            missing_streams.append(stream_name)
+
+    if missing_streams:
+        LOGGER.info("Fetching module API names for streams: {}".format(missing_streams))
+        modules = get_dynamic_metadata(client).get("modules", [])
+        module_lookup = {
+            module.get("api_name").lower(): module.get("api_name")
+            for module in modules if module.get("api_name")
+        }
+        for stream_name in missing_streams:
+            module_paths[stream_name] = module_lookup.get(stream_name)
+
+    return module_paths
+
+
 def deselect_unselected_fields(catalog_entry):
     """
     If a field isn't manually deselected, it will be included in the sync by default,
@@ -91,8 +138,6 @@ def sync(client: Client, config: Dict, catalog: singer.Catalog, state) -> None:
     """
     Sync selected streams from catalog
     """
-    dynamic_schemas, _ = get_dynamic_schema(client)
-    dynamic_schema_path = {item.lower(): item for item in dynamic_schemas.keys()}
     streams_to_sync = []
     for stream in catalog.get_selected_streams(state):
         catalog_entry = catalog.get_stream(stream.tap_stream_id)
@@ -101,20 +146,82 @@ def sync(client: Client, config: Dict, catalog: singer.Catalog, state) -> None:
         streams_to_sync.append(stream.tap_stream_id)
 
     LOGGER.info("selected_streams: {}".format(streams_to_sync))
+    dynamic_schema_path = get_dynamic_module_paths(client, catalog, streams_to_sync)
 
     last_stream = singer.get_currently_syncing(state)
     LOGGER.info("last/currently syncing stream: {}".format(last_stream))
 
-    with singer.Transformer() as transformer:
-        for stream_name in streams_to_sync:
-            if stream_name in STREAMS:
-                stream = STREAMS[stream_name](client, catalog.get_stream(stream_name))
-            else:
-                stream = build_dynamic_stream(
-                    client,
-                    catalog.get_stream(stream_name),
-                    dynamic_schema_path.get(stream_name)
+    config_output_buffer_size = config.get("output_buffer_size")
+    output_buffer_size = int(config_output_buffer_size) if config_output_buffer_size else 0
+    output_writer = BufferedOutputWriter(output_buffer_size) if output_buffer_size > 0 else OutputWriter()
+
+    config_parallel_streams = config.get("parallel_streams")
+    parallel_streams = int(config_parallel_streams) if config_parallel_streams else 1
+    if parallel_streams > 1:
+        sync_streams_concurrently(
+            client, catalog, state, streams_to_sync, dynamic_schema_path, parallel_streams, output_writer)
+        return
+
+    previous_writer = set_output_writer(output_writer)
+    try:
+        with CompiledTransformer() as transformer:
+            for stream_name in streams_to_sync:
+                stream = build_stream(client, catalog, stream_name, dynamic_schema_path)
+
+                parent_name = getattr(stream, "parent", None)
+                if parent_name:
+                    if parent_name not in streams_to_sync:
+                        streams_to_sync.append(parent_name)
+                    continue
+
+                write_schema(stream, client, streams_to_sync, catalog)
+                LOGGER.info("START Syncing: {}".format(stream_name))
+                update_currently_syncing(state, stream_name)
+                total_records = stream.sync(state=state, transformer=transformer)
+
+                update_currently_syncing(state, None)
+                LOGGER.info(
+                    "FINISHED Syncing: {}, total_records: {}".format(
+                        stream_name, total_records
+                    )
                 )
+    finally:
+        set_output_writer(previous_writer)
+        output_writer.close()
+
+
+def build_stream(client: Client, catalog: singer.Catalog, stream_name: str, dynamic_schema_path: Dict) -> object:
+    """Create the static or dynamic stream instance for a selected stream."""
+    if stream_name in STREAMS:
+        return STREAMS[stream_name](client, catalog.get_stream(stream_name))
+    return build_dynamic_stream(
+        client,
+        catalog.get_stream(stream_name),
+        dynamic_schema_path.get(stream_name)
+    )
+
+
+def sync_streams_concurrently(
+        client: Client,
+        catalog: singer.Catalog,
+        state: Dict,
+        streams_to_sync: List[str],
+        dynamic_schema_path: Dict,
+        max_workers: int,
+        output: Optional[OutputWriter] = None
+    ) -> None:
+    """
+    Sync the selected streams on a pool of `max_workers` threads.
+    Every message goes through a single writer thread so that the output stays valid
+    Singer. Each stream syncs against its own copy of its bookmarks, which the writer
+    merges into the tap state whenever the stream emits STATE.
+    """
+    output_writer = ThreadedOutputWriter(state, output)
+    previous_writer = set_output_writer(output_writer)
+    try:
+        streams = []
+        for stream_name in streams_to_sync:
+            stream = build_stream(client, catalog, stream_name, dynamic_schema_path)
 
             parent_name = getattr(stream, "parent", None)
             if parent_name:
@@ -123,14 +230,41 @@ def sync(client: Client, config: Dict, catalog: singer.Catalog, state) -> None:
                 continue
 
             write_schema(stream, client, streams_to_sync, catalog)
-            LOGGER.info("START Syncing: {}".format(stream_name))
-            update_currently_syncing(state, stream_name)
-            total_records = stream.sync(state=state, transformer=transformer)
-
-            update_currently_syncing(state, None)
-            LOGGER.info(
-                "FINISHED Syncing: {}, total_records: {}".format(
-                    stream_name, total_records
-                )
-            )
+            streams.append(stream)
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(sync_stream_isolated, stream, get_stream_state(stream, state))
+                for stream in streams
+            ]
+        for future in futures:
+            future.result()
+    finally:
+        set_output_writer(previous_writer)
+        output_writer.close()
 
+
+def get_stream_state(stream, state: Dict) -> Dict:
+    """Return a state holding a copy of the bookmarks of a stream and its children."""
+    bookmarks = state.get("bookmarks", {})
+    stream_names = [stream.tap_stream_id] + [child.tap_stream_id for child in stream.child_to_sync]
+    return {
+        "bookmarks": {
+            stream_name: copy.deepcopy(bookmarks.get(stream_name, {}))
+            for stream_name in stream_names
+        }
+    }
+
+
+def sync_stream_isolated(stream, stream_state: Dict) -> int:
+    """Sync one stream against its own state and emit its final bookmarks."""
+    LOGGER.info("START Syncing: {}".format(stream.tap_stream_id))
+    with CompiledTransformer() as transformer:
+        total_records = stream.sync(state=stream_state, transformer=transformer)
+    write_state(stream_state)
+    LOGGER.info(
+        "FINISHED Syncing: {}, total_records: {}".format(
+            stream.tap_stream_id, total_records
+        )
+    )
+    return total_records
@@ -0,0 +1,75 @@
+import os
+import json
+import hashlib
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, Mapping, Optional
+from singer import get_logger
+
+try:
+    import fcntl
+except ImportError:
+    # File locking is not available on Windows
+    fcntl = None
+
+LOGGER = get_logger()
+
+
+class TokenCache:
+    """
+    An opt-in file which keeps the OAuth access token between runs.
+    ~~~
+    The file is only readable by its owner and holds the access token, its expiry and
+    the API domain. It is tied to the refresh token which issued the access token, so
+    a cache written for other credentials is ignored. Callers hold `lock()` while they
+    read and refresh, so that taps started together perform a single refresh.
+    """
+
+    def __init__(self, path: str, refresh_token: str) -> None:
+        self.path = path
+        self.lock_path = f"{path}.lock"
+        self.refresh_token_hash = hashlib.sha256(refresh_token.encode("utf-8")).hexdigest()
+
+    @classmethod
+    def from_config(cls, config: Mapping[str, Any]) -> Optional["TokenCache"]:
+        """Build the cache from the tap config, or return None if it is not enabled."""
+        path = config.get("token_cache_path")
+        if not path:
+            return None
+        return cls(path, config["refresh_token"])
+
+    @contextmanager
+    def lock(self) -> Iterator[None]:
+        """Hold an exclusive lock on the cache across processes."""
+        lock_fd = os.open(self.lock_path, os.O_RDWR | os.O_CREAT, 0o600)
+        try:
+            if fcntl:
+                fcntl.flock(lock_fd, fcntl.LOCK_EX)
+            yield
+        finally:
+            if fcntl:
+                fcntl.flock(lock_fd, fcntl.LOCK_UN)
+            os.close(lock_fd)
+
+    def read(self) -> Optional[Dict]:
+        """Return the cached token, or None if there is no usable cache for these credentials."""
+        try:
+            with open(self.path) as cache_file:
+                token = json.load(cache_file)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as err:
+            LOGGER.warning(f"Ignoring unreadable token cache: {err}")
+            return None
+
+        if token.get("refresh_token_hash") != self.refresh_token_hash:
+            return None
+        return token
+
+    def write(self, token: Dict) -> None:
+        """Store the token atomically in a file only readable by its owner."""
+        token = dict(token, refresh_token_hash=self.refresh_token_hash)
+        tmp_path = f"{self.path}.{os.getpid()}.tmp"
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "w") as cache_file:
+            json.dump(token, cache_file)
+        os.replace(tmp_path, self.path)
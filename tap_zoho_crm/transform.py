@@ -0,0 +1,300 @@
+import decimal
+import re
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from singer import Transformer
+from singer.transform import NO_INTEGER_DATETIME_PARSING, breadcrumb_path, string_to_datetime
+from singer.utils import strftime
+
+# Timestamps in this shape are parsed identically by `datetime.fromisoformat` and by
+# the dateutil parser behind singer's `strptime_to_utc`, at a fraction of the cost
+ISO_DATETIME_PATTERN = re.compile(
+    r"\d{4}-\d{2}-\d{2}(T\d{2}:\d{2}:\d{2}(\.\d{1,6})?(Z|[+-]\d{2}:\d{2})?)?"
+)
+
+# A converter takes a value and the path of the value in the record, and returns
+# whether the value matches its schema along with the transformed value
+Converter = Callable[[Any, Optional[List]], Tuple[bool, Any]]
+
+
+def transform_datetime(value: Any) -> Optional[str]:
+    """Format a timestamp the way singer's transformer does for `date-time` fields."""
+    if value is None or value == "":
+        return None
+    if isinstance(value, str) and ISO_DATETIME_PATTERN.fullmatch(value):
+        try:
+            parsed = datetime.fromisoformat(value)
+            if parsed.tzinfo is None:
+                parsed = parsed.replace(tzinfo=timezone.utc)
+            parsed = parsed.astimezone(timezone.utc)
+        except (ValueError, OverflowError):
+            # Invalid dates, and dates which leave the supported range once moved to UTC
+            return string_to_datetime(value)
+        return strftime(parsed)
+    return string_to_datetime(value)
+
+
+class CompiledTransformer(Transformer):
+    """
+    A drop-in replacement for `singer.Transformer` which compiles each stream's schema
+    and metadata once, instead of walking them for every record.
+    ~~~
+    The first record of a stream builds a plan: the fields to drop as deselected or
+    unsupported, and one converter per schema property with the type coercions of
+    `singer.Transformer` resolved ahead of time. Records are then transformed in a
+    single pass over their fields. Schemas using features the plan does not cover
+    (`patternProperties`, a root which is not an object, ...) are transformed by
+    `singer.Transformer`, as is any record which does not match the schema, so
+    that errors are reported exactly as before.
+    """
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self._plans = {}
+
+    def transform(self, data, schema, metadata=None):
+        if self.pre_hook or self.integer_datetime_fmt != NO_INTEGER_DATETIME_PARSING \
+                or not isinstance(data, dict):
+            return super().transform(data, schema, metadata)
+
+        plan = self._get_plan(schema, metadata)
+        if plan is None:
+            return super().transform(data, schema, metadata)
+
+        dropped_fields, field_converters = plan
+        result = {}
+        for field_name, value in data.items():
+            if field_name in dropped_fields:
+                self.filtered.add(dropped_fields[field_name])
+                continue
+
+            field_converter = field_converters.get(field_name)
+            if field_converter is None:
+                self.removed.add(field_name)
+                continue
+
+            convert, path = field_converter
+            success, result[field_name] = convert(value, path)
+            if not success:
+                # Let singer's transformer walk the record again to collect the errors
+                return super().transform(data, schema, metadata)
+        return result
+
+    def _get_plan(self, schema: Dict, metadata: Optional[Dict]):
+        """Return the cached plan of a stream, compiling it on first use."""
+        plan_key = (id(schema), id(metadata))
+        cached = self._plans.get(plan_key)
+        # The schema and metadata are kept with the plan, so their ids stay unique
+        if cached is None or cached[0] is not schema or cached[1] is not metadata:
+            cached = (schema, metadata, self._compile_plan(schema, metadata))
+            self._plans[plan_key] = cached
+        return cached[2]
+
+    def _compile_plan(self, schema: Dict, metadata: Optional[Dict]):
+        if "anyOf" in schema or schema.get("format") or schema.get("patternProperties"):
+            return None
+        types = schema.get("type")
+        if not isinstance(types, list):
+            types = [types]
+        # Singer tries `null` last, so a dict record always takes the object branch
+        if next((typ for typ in types if typ != "null"), None) != "object":
+            return None
+
+        properties = schema.get("properties", {})
+        if not properties:
+            return None
+
+        # Mirrors `filter_data_by_metadata`: automatic fields are kept as they are,
+        # deselected and unsupported fields are dropped, and the other fields are
+        # filtered further by the metadata of their nested properties, if any
+        dropped_fields = {}
+        automatic_fields = set()
+        nested_metadata_fields = set()
+        if metadata:
+            for breadcrumb, field_metadata in metadata.items():
+                if len(breadcrumb) < 2 or breadcrumb[0] != "properties":
+                    continue
+                if len(breadcrumb) > 2:
+                    nested_metadata_fields.add(breadcrumb[1])
+                elif field_metadata.get("inclusion") == "automatic":
+                    automatic_fields.add(breadcrumb[1])
+                elif field_metadata.get("selected") is False or field_metadata.get("inclusion") == "unsupported":
+                    dropped_fields[breadcrumb[1]] = breadcrumb_path(breadcrumb)
+
+        field_converters = {}
+        for field_name, field_schema in properties.items():
+            if field_name in dropped_fields:
+                continue
+            field_converter = self._compile(field_schema)
+            if field_name in nested_metadata_fields and field_name not in automatic_fields:
+                field_converter = self._with_nested_filter(field_converter, metadata, field_name)
+            field_converters[field_name] = (field_converter, [field_name])
+        return dropped_fields, field_converters
+
+    def _with_nested_filter(self, field_converter: Converter, metadata: Dict, field_name: str) -> Converter:
+        """Apply the metadata of the nested properties of a field before converting it."""
+        breadcrumb = ("properties", field_name)
+
+        def convert(value, path):
+            return field_converter(self.filter_data_by_metadata(value, metadata, breadcrumb), path)
+        return convert
+
+    def _compile(self, schema: Dict) -> Converter:
+        """Build the converter of a schema, mirroring `Transformer.transform_recur`."""
+        if "anyOf" in schema:
+            subschema_converters = [self._compile(subschema) for subschema in schema["anyOf"]]
+
+            def convert_any_of(value, path):
+                for subschema_converter in subschema_converters:
+                    success, converted = subschema_converter(value, path)
+                    if success:
+                        return success, converted
+                return False, None
+            return convert_any_of
+
+        if "type" not in schema:
+            return lambda value, path: (True, value)
+
+        types = schema["type"]
+        if not isinstance(types, list):
+            types = [types]
+        types = [typ for typ in types if typ != "null"] + (["null"] if "null" in types else [])
+        type_converters = [self._compile_type(typ, schema) for typ in types]
+
+        if len(type_converters) == 1:
+            return type_converters[0]
+
+        def convert_types(value, path):
+            for type_converter in type_converters:
+                success, converted = type_converter(value, path)
+                if success:
+                    return success, converted
+            return False, None
+        return convert_types
+
+    def _compile_type(self, typ: str, schema: Dict) -> Converter:
+        """Build the converter of a single type, mirroring `Transformer._transform`."""
+        if typ == "null":
+            return convert_null
+        if schema.get("format") == "date-time":
+            return convert_datetime
+        if schema.get("format") == "singer.decimal":
+            return convert_decimal
+        if typ == "object":
+            if schema.get("patternProperties"):
+                return lambda value, path: self._transform_object(
+                    value, schema.get("properties", {}), path or [], schema.get("patternProperties"))
+            return self._compile_object(schema.get("properties", {}))
+        if typ == "array":
+            if "items" not in schema:
+                return lambda value, path: self._transform_array(value, schema["items"], path or [])
+            return self._compile_array(self._compile(schema["items"]))
+        return TYPE_CONVERTERS.get(typ, convert_unknown)
+
+    def _compile_object(self, properties: Dict) -> Converter:
+        property_converters = {key: self._compile(subschema) for key, subschema in properties.items()}
+
+        def convert_object(value, path):
+            if not isinstance(value, dict):
+                return False, value
+            if not property_converters:
+                return True, value
+            result = {}
+            for key, item in value.items():
+                property_converter = property_converters.get(key)
+                if property_converter is None:
+                    self.removed.add(".".join(map(str, path + [key])))
+                    continue
+                success, result[key] = property_converter(item, path + [key])
+                if not success:
+                    return False, None
+            return True, result
+        return convert_object
+
+    def _compile_array(self, item_converter: Converter) -> Converter:
+        def convert_array(value, path):
+            if not isinstance(value, list):
+                return False, value
+            result = []
+            for index, item in enumerate(value):
+                success, converted = item_converter(item, path + [index])
+                if not success:
+                    return False, None
+                result.append(converted)
+            return True, result
+        return convert_array
+
+
+def convert_null(value, path):
+    if value is None or value == "":
+        return True, None
+    return False, None
+
+
+def convert_datetime(value, path):
+    value = transform_datetime(value)
+    return value is not None, value
+
+
+def convert_decimal(value, path):
+    if value is None:
+        return False, None
+    if isinstance(value, (str, float, int)):
+        try:
+            return True, str(decimal.Decimal(str(value)))
+        except Exception:
+            return False, None
+    if isinstance(value, decimal.Decimal):
+        try:
+            return True, "NaN" if value.is_snan() else str(value)
+        except Exception:
+            return False, None
+    return False, None
+
+
+def convert_string(value, path):
+    if value is None:
+        return False, None
+    try:
+        return True, str(value)
+    except Exception:
+        return False, None
+
+
+def convert_integer(value, path):
+    if isinstance(value, str):
+        value = value.replace(",", "")
+    try:
+        return True, int(value)
+    except Exception:
+        return False, None
+
+
+def convert_number(value, path):
+    if isinstance(value, str):
+        value = value.replace(",", "")
+    try:
+        return True, float(value)
+    except Exception:
+        return False, None
+
+
+def convert_boolean(value, path):
+    if isinstance(value, str) and value.lower() == "false":
+        return True, False
+    try:
+        return True, bool(value)
+    except Exception:
+        return False, None
+
+
+def convert_unknown(value, path):
+    return False, None
+
+
+TYPE_CONVERTERS = {
+    "string": convert_string,
+    "integer": convert_integer,
+    "number": convert_number,
+    "boolean": convert_boolean,
+}
@@ -0,0 +1,184 @@
+import copy
+import queue
+import sys
+import threading
+from typing import Any, Dict, List, Optional
+import singer
+
+from tap_zoho_crm import json_codec
+
+LOGGER = singer.get_logger()
+WRITER_QUEUE_SIZE = 10000
+OUTPUT_BUFFER_SIZE = 1024 * 1024
+
+
+def write_stdout(data: bytes) -> None:
+    """Write encoded lines to stdout. They are UTF-8 whatever the encoding of the text
+    stream, like the ASCII-escaped lines of singer."""
+    # Text written to stdout by other means goes out first
+    sys.stdout.flush()
+    sys.stdout.buffer.write(data)
+    sys.stdout.buffer.flush()
+
+
+def emit_message(message: singer.Message) -> None:
+    """Write a Singer message to stdout, serialized with the fast JSON codec when installed."""
+    write_stdout(json_codec.format_message(message) + b"\n")
+
+
+def emit_state(state: Dict) -> None:
+    emit_message(singer.StateMessage(value=state))
+
+
+class OutputWriter:
+    """
+    Writes Singer messages to stdout as soon as they are emitted.
+    ~~~
+    This is the writer used by a sequential sync; other writers change how the
+    messages emitted by the streams reach stdout.
+    """
+
+    def write_message(self, message: singer.Message) -> None:
+        emit_message(message)
+
+    def write_state(self, state: Dict) -> None:
+        emit_state(state)
+
+    def close(self) -> None:
+        """Flush any pending message."""
+
+
+class BufferedOutputWriter(OutputWriter):
+    """
+    Batches serialized messages into large writes to stdout.
+    ~~~
+    Messages are buffered until `buffer_size` bytes are pending. A STATE message
+    always flushes the buffer together with itself, so a target never receives a
+    state ahead of the records it covers.
+    """
+
+    def __init__(self, buffer_size: int = OUTPUT_BUFFER_SIZE) -> None:
+        self.buffer_size = buffer_size
+        self._lines = []
+        self._pending_size = 0
+
+    def write_message(self, message: singer.Message) -> None:
+        line = json_codec.format_message(message) + b"\n"
+        self._lines.append(line)
+        self._pending_size += len(line)
+        if self._pending_size >= self.buffer_size:
+            self.flush()
+
+    def write_state(self, state: Dict) -> None:
+        # Serialized now, as the caller keeps mutating its state
+        self._lines.append(json_codec.format_message(singer.StateMessage(value=state)) + b"\n")
+        self.flush()
+
+    def flush(self) -> None:
+        if not self._lines:
+            return
+        write_stdout(b"".join(self._lines))
+        self._lines = []
+        self._pending_size = 0
+
+    def close(self) -> None:
+        self.flush()
+
+
+class ThreadedOutputWriter(OutputWriter):
+    """
+    Serializes the messages of concurrently syncing streams through a single thread.
+    ~~~
+    Messages are written in the order they were queued, so SCHEMA, RECORD and STATE
+    messages of one stream keep their relative order. Each stream syncs against its
+    own state object; the writer merges the bookmarks it receives into the tap state
+    and emits the merged state through `output`.
+    """
+
+    def __init__(self, state: Dict, output: Optional[OutputWriter] = None) -> None:
+        self.state = state
+        self.output = output or OutputWriter()
+        self._queue = queue.Queue(maxsize=WRITER_QUEUE_SIZE)
+        self._error = None
+        self._thread = threading.Thread(target=self._run, name="singer-writer", daemon=True)
+        self._thread.start()
+
+    def _put(self, item: Any) -> None:
+        if self._error:
+            raise self._error
+        self._queue.put(item)
+
+    def write_message(self, message: singer.Message) -> None:
+        self._put(message)
+
+    def write_state(self, state: Dict) -> None:
+        # Copied in the calling thread, which is the only one mutating this stream state
+        self._put(copy.deepcopy(state))
+
+    def _run(self) -> None:
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+            if self._error:
+                # Keep draining so that producers never block on a dead writer
+                continue
+            try:
+                if isinstance(item, dict):
+                    self.merge_state(item)
+                    self.output.write_state(self.state)
+                else:
+                    self.output.write_message(item)
+            except Exception as err:
+                LOGGER.critical("Singer output writer failed: {}".format(err))
+                self._error = err
+
+    def merge_state(self, stream_state: Dict) -> None:
+        """Merge the bookmarks of one stream state into the tap state."""
+        bookmarks = self.state.setdefault("bookmarks", {})
+        for stream_name, bookmark in stream_state.get("bookmarks", {}).items():
+            if bookmark or stream_name in bookmarks:
+                bookmarks[stream_name] = bookmark
+
+    def close(self) -> None:
+        """Write every queued message and stop the writer thread."""
+        self._queue.put(None)
+        self._thread.join()
+        if self._error:
+            raise self._error
+        self.output.close()
+
+
+_OUTPUT_WRITER = OutputWriter()
+
+
+def get_output_writer() -> OutputWriter:
+    return _OUTPUT_WRITER
+
+
+def set_output_writer(output_writer: OutputWriter) -> OutputWriter:
+    """Install the writer used by the streams and return the previous one."""
+    global _OUTPUT_WRITER
+    previous_writer = _OUTPUT_WRITER
+    _OUTPUT_WRITER = output_writer
+    return previous_writer
+
+
+def write_record(stream_name: str, record: Dict) -> None:
+    _OUTPUT_WRITER.write_message(singer.RecordMessage(stream=stream_name, record=record))
+
+
+def write_schema(stream_name: str, schema: Dict, key_properties: List[str],
+                 bookmark_properties: Optional[List[str]] = None) -> None:
+    if isinstance(key_properties, (str, bytes)):
+        key_properties = [key_properties]
+    _OUTPUT_WRITER.write_message(singer.SchemaMessage(
+        stream=stream_name,
+        schema=schema,
+        key_properties=key_properties,
+        bookmark_properties=bookmark_properties
+    ))
+
+
+def write_state(state: Dict) -> None:
+    _OUTPUT_WRITER.write_state(state)
@@ -0,0 +1,79 @@
+"""
+Compare the per-record cost of `singer.Transformer` and `CompiledTransformer` on a
+generated dynamic module. Run it from the repository root:
+
+    python tests/benchmarks/benchmark_transform.py --fields 350 --records 2000
+"""
+import argparse
+import copy
+import random
+import time
+from singer import Transformer, metadata
+from tap_zoho_crm.schema import field_to_property_schema
+from tap_zoho_crm.transform import CompiledTransformer
+
+FIELD_SAMPLES = [
+    ({"data_type": "text"}, lambda: random.choice(["Müller", "Acme Corp", None])),
+    ({"data_type": "picklist"}, lambda: random.choice(["Qualified", "Closed Won"])),
+    ({"data_type": "multiselectpicklist"}, lambda: ["a", "b"]),
+    ({"data_type": "ownerlookup", "json_type": "jsonobject"},
+     lambda: {"name": "Jane Doe", "id": "5725767000000411001", "email": "jane@example.com"}),
+    ({"data_type": "currency", "json_type": "double"}, lambda: round(random.uniform(0, 10000), 2)),
+    ({"data_type": "boolean"}, lambda: random.choice([True, False])),
+    ({"data_type": "datetime"}, lambda: "2024-01-{:02d}T10:15:30+05:30".format(random.randint(1, 28))),
+    ({"data_type": "date"}, lambda: "2024-02-{:02d}".format(random.randint(1, 28))),
+    ({"data_type": "integer"}, lambda: random.randint(0, 1000)),
+    ({"data_type": "double"}, lambda: random.random()),
+]
+
+
+def build_module(field_count: int, record_count: int):
+    """Return the schema, metadata and records of a module with `field_count` fields."""
+    random.seed(0)
+    schema = {"type": "object", "properties": {"id": {"type": ["null", "string"]}}}
+    generators = {"id": lambda: str(random.randint(10 ** 18, 10 ** 19))}
+    for index in range(field_count):
+        field, generator = FIELD_SAMPLES[index % len(FIELD_SAMPLES)]
+        field_name = "{}_{}".format(field["data_type"], index)
+        schema["properties"][field_name] = field_to_property_schema(field)
+        generators[field_name] = generator
+
+    mdata = metadata.to_map(metadata.get_standard_metadata(schema=schema, key_properties=["id"]))
+    # Deselect a tenth of the fields, as a typical catalog does
+    for field_name in list(schema["properties"])[1::10]:
+        mdata = metadata.write(mdata, ("properties", field_name), "selected", False)
+
+    records = [
+        {field_name: generator() for field_name, generator in generators.items()}
+        for _ in range(record_count)
+    ]
+    return schema, mdata, records
+
+
+def time_transformer(transformer: Transformer, schema, mdata, records) -> float:
+    # singer's transformer drops deselected fields from the record it is given
+    records = copy.deepcopy(records)
+    started_at = time.perf_counter()
+    for record in records:
+        transformer.transform(record, schema, mdata)
+    return time.perf_counter() - started_at
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--fields", type=int, default=350)
+    parser.add_argument("--records", type=int, default=2000)
+    args = parser.parse_args()
+
+    schema, mdata, records = build_module(args.fields, args.records)
+    singer_seconds = time_transformer(Transformer(), schema, mdata, records)
+    compiled_seconds = time_transformer(CompiledTransformer(), schema, mdata, records)
+
+    print("{} records of {} fields".format(args.records, args.fields))
+    for name, seconds in (("singer.Transformer", singer_seconds), ("CompiledTransformer", compiled_seconds)):
+        print("{:<20} {:8.3f}s  {:8.1f} us/record".format(name, seconds, seconds / args.records * 1e6))
+    print("speedup: {:.1f}x".format(singer_seconds / compiled_seconds))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,35 @@
+from unittest.mock import MagicMock
+from tap_zoho_crm.streams.abstracts import IncrementalStream
+
+
+class DynamicLeadsStream(IncrementalStream):
+    tap_stream_id = "leads"
+    key_properties = ["id"]
+    replication_method = "INCREMENTAL"
+    replication_keys = ["Modified_Time"]
+    data_key = "data"
+    path = "Leads"
+    is_dynamic = True
+    sort_by = "Modified_Time"
+
+
+def build_client(config, make_request=None):
+    """A client answering `make_request` with the given callable, without the aiohttp engine."""
+    client = MagicMock()
+    client.base_url = "https://www.zohoapis.com/crm/v8"
+    client.config = dict({"start_date": "2024-01-01T00:00:00Z"}, **config)
+    client.async_client = None
+    client.max_concurrent_requests = 2
+    if make_request:
+        client.make_request.side_effect = make_request
+    return client
+
+
+def build_stream(client, schema, stream_class=DynamicLeadsStream):
+    """A stream of the client with every field of the schema selected."""
+    catalog = MagicMock()
+    catalog.schema.to_dict.return_value = schema
+    catalog.metadata = []
+    stream = stream_class(client=client, catalog=catalog)
+    stream.is_selected = MagicMock(return_value=True)
+    return stream
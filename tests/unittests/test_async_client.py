@@ -0,0 +1,145 @@
+import asyncio
+import json
+import threading
+import time
+import unittest
+from datetime import datetime, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import patch, AsyncMock
+from tap_zoho_crm import async_client
+from tap_zoho_crm.client import Client
+from tap_zoho_crm.exceptions import ZohoCRMNotFoundError, ZohoCRMRateLimitError
+
+
+class RecordsHandler(BaseHTTPRequestHandler):
+    """A stand-in for the records API answering the statuses queued by a test for each path."""
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        server = self.server
+        server.requests.append((self.path, dict(self.headers)))
+        statuses = server.statuses.get(self.path.split("?")[0].rsplit("/", 1)[-1], [(200, {})])
+        status, headers = statuses.pop(0) if len(statuses) > 1 else statuses[0]
+
+        payload = b"" if status in (204, 304) else json.dumps(
+            {"data": [{"id": "1"}]} if status == 200 else {"status": "error", "code": "ERROR", "message": "Failed"}
+        ).encode("utf-8")
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+
+@unittest.skipIf(async_client.aiohttp is None, "aiohttp is not installed")
+class TestAsyncClient(unittest.TestCase):
+
+    def setUp(self):
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), RecordsHandler)
+        self.server.requests = []
+        self.server.statuses = {}
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+        self.client = Client({
+            "client_id": "dummy_id",
+            "client_secret": "dummy_secret",
+            "refresh_token": "dummy_token",
+            "user_agent": "test-account <test-email>",
+            "http_engine": "aiohttp",
+            "max_concurrent_requests": 1
+        })
+        self.client._access_token = "token"
+        self.client._token_type = "Zoho-oauthtoken"
+        self.client._expires_at = datetime.now() + timedelta(hours=1)
+        self.client._set_api_domain("http://127.0.0.1:{}".format(self.server.server_address[1]))
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+        self.client.async_client.close()
+        self.client._session.close()
+
+    def request(self, name, **kwargs):
+        return dict(method="GET", endpoint=f"{self.client.base_url}/{name}", params={"page": 1}, **kwargs)
+
+    def test_requests_are_authenticated_off_the_event_loop(self):
+        """The token is sent with every request and obtained on an executor thread."""
+        authenticate = self.client.authenticate
+        threads = []
+
+        def record_thread(headers, params):
+            threads.append(threading.current_thread().name)
+            return authenticate(headers, params)
+
+        with patch.object(self.client, "authenticate", side_effect=record_thread):
+            responses = self.client.async_client.make_requests([self.request("Leads"), self.request("Deals")])
+
+        self.assertEqual(responses, [{"data": [{"id": "1"}]}] * 2)
+        self.assertNotIn("zoho-crm-event-loop", threads)
+        self.assertEqual(self.server.requests[0][1]["Authorization"], "Zoho-oauthtoken token")
+
+    def test_not_modified_and_no_content(self):
+        """304 answers None and 204 an empty dict, like the requests engine."""
+        self.server.statuses = {"Leads": [(304, {})], "Deals": [(204, {})]}
+
+        responses = self.client.async_client.make_requests([self.request("Leads"), self.request("Deals")])
+
+        self.assertEqual(responses, [None, {}])
+
+    @patch("backoff._async.asyncio.sleep", new_callable=AsyncMock)
+    def test_server_errors_are_retried(self, mock_sleep):
+        """5xx answers are retried with the backoff of the requests engine."""
+        self.server.statuses = {"Leads": [(500, {}), (503, {}), (200, {})]}
+
+        responses = self.client.async_client.make_requests([self.request("Leads")])
+
+        self.assertEqual(responses, [{"data": [{"id": "1"}]}])
+        self.assertEqual(len(self.server.requests), 3)
+
+    @patch("backoff._async.asyncio.sleep", new_callable=AsyncMock)
+    def test_rate_limit_waits_retry_after(self, mock_sleep):
+        """A 429 waits the delay requested by the API before it is retried."""
+        self.server.statuses = {"Leads": [(429, {"Retry-After": "7"}), (200, {})]}
+
+        responses = self.client.async_client.make_requests([self.request("Leads")])
+
+        self.assertEqual(responses, [{"data": [{"id": "1"}]}])
+        mock_sleep.assert_awaited_once_with(7)
+
+    @patch("backoff._async.asyncio.sleep", new_callable=AsyncMock)
+    def test_rate_limit_gives_up(self, mock_sleep):
+        """A rate limit which outlasts the retries fails the request."""
+        self.server.statuses = {"Leads": [(429, {"Retry-After": "1"})]}
+
+        with self.assertRaises(ZohoCRMRateLimitError):
+            self.client.async_client.make_requests([self.request("Leads")])
+        self.assertEqual(len(self.server.requests), 5)
+
+    def test_client_errors_raise(self):
+        """Error answers raise the exceptions of `raise_for_error` without retries."""
+        self.server.statuses = {"Leads": [(404, {})]}
+
+        with self.assertRaises(ZohoCRMNotFoundError):
+            self.client.async_client.make_requests([self.request("Leads")])
+        self.assertEqual(len(self.server.requests), 1)
+
+    def test_cancelled_request_releases_its_slot(self):
+        """A request cancelled while it waits for the limiter does not keep the slot it gets."""
+        rate_limiter = self.client.rate_limiter
+        rate_limiter.acquire()
+        engine = self.client.async_client
+
+        waiting = asyncio.run_coroutine_threadsafe(engine._acquire_slot("Leads"), engine._loop)
+        time.sleep(0.1)
+        engine._loop.call_soon_threadsafe(waiting.cancel)
+        with self.assertRaises(Exception):
+            waiting.result(timeout=2)
+        rate_limiter.release()
+        # Let the executor thread take the released slot before it is checked
+        time.sleep(0.2)
+
+        self.assertTrue(rate_limiter._slots.acquire(timeout=2))
+        rate_limiter.release()
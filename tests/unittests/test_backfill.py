@@ -0,0 +1,214 @@
+import copy
+import time
+import unittest
+from datetime import timedelta
+from unittest.mock import patch, MagicMock
+from singer import utils
+from tap_zoho_crm.backfill import get_low_water_mark, split_windows
+from tap_zoho_crm.helpers import END_OF_ITERATOR, interleave
+from tap_zoho_crm.transform import CompiledTransformer
+from stream_fixtures import DynamicLeadsStream, build_client, build_stream
+
+SCHEMA = {
+    "type": "object",
+    "properties": {
+        "id": {"type": ["null", "string"]},
+        "Modified_Time": {"type": ["null", "string"], "format": "date-time"}
+    }
+}
+
+# One record every ten days of the year, sorted by modified time like the API sorts them
+RECORDS = [
+    {"id": str(index), "Modified_Time": utils.strftime(
+        utils.strptime_to_utc("2024-01-01T00:00:00Z") + timedelta(days=10 * index, hours=1))}
+    for index in range(36)
+]
+
+
+class PagedLeadsStream(DynamicLeadsStream):
+    failing_window_start = None
+
+    def get_pages(self):
+        """Pages of two records modified since the `updated_since` filter."""
+        updated_since = self.params["updated_since"]
+        if self.failing_window_start and updated_since >= self.failing_window_start:
+            raise RuntimeError("Window failed")
+        records = [record for record in RECORDS if record["Modified_Time"] >= updated_since]
+        for index in range(0, len(records), 2):
+            yield records[index:index + 2], None
+
+
+class HydratedLeadsStream(DynamicLeadsStream):
+    """Pages through the records API, listing the ids of a page before hydrating them."""
+    if_modified_since_supported = True
+    page_size = 5
+    modified_ids = ()
+
+    def answer_request(self, method, endpoint, params, headers, body=None, path=None, stream=False):
+        if "ids" in params:
+            return self.answer_hydration(params)
+        return self.answer_listing(params, headers)
+
+    def answer_listing(self, params, headers):
+        updated_since = utils.strptime_to_utc(headers["If-Modified-Since"])
+        records = [record for record in RECORDS if utils.strptime_to_utc(record["Modified_Time"]) >= updated_since]
+        start = (params.get("page", 1) - 1) * params["per_page"]
+        return {
+            "data": [{field: record[field] for field in params["fields"].split(",")}
+                     for record in records[start:start + params["per_page"]]],
+            "info": {"more_records": start + params["per_page"] < len(records)}
+        }
+
+    def answer_hydration(self, params):
+        records = []
+        for record_id in params["ids"].split(","):
+            record = {field: "value" for field in params["fields"].split(",")}
+            record["id"] = record_id
+            if "Modified_Time" in record:
+                # Records modified since they were listed answer their new modified time
+                record["Modified_Time"] = ("2026-01-01T00:00:00.000000Z" if record_id in self.modified_ids
+                                           else RECORDS[int(record_id)]["Modified_Time"])
+            records.append(record)
+        return {"data": records}
+
+
+class TestBackfillWindows(unittest.TestCase):
+
+    def test_split_windows(self):
+        """The range is split into consecutive windows and the last one is left open."""
+        windows = split_windows("2024-01-01T00:00:00Z", utils.strptime_to_utc("2024-01-25T00:00:00Z"),
+                                timedelta(days=10))
+        self.assertEqual(windows, [
+            {"start": "2024-01-01T00:00:00.000000Z", "end": "2024-01-11T00:00:00.000000Z"},
+            {"start": "2024-01-11T00:00:00.000000Z", "end": "2024-01-21T00:00:00.000000Z"},
+            {"start": "2024-01-21T00:00:00.000000Z", "end": None},
+        ])
+
+    def test_low_water_mark(self):
+        """The earliest position among the pending windows is the low-water mark."""
+        self.assertEqual(get_low_water_mark([
+            {"start": "2024-02-01T00:00:00.000000Z", "end": None},
+            {"start": "2024-01-01T00:00:00.000000Z", "end": "2024-02-01T00:00:00.000000Z",
+             "progress": "2024-01-15T00:00:00.000000Z"},
+        ]), "2024-01-15T00:00:00.000000Z")
+        self.assertIsNone(get_low_water_mark([]))
+
+    def test_interleave(self):
+        """Items keep their order within an iterator, and errors reach the caller."""
+        items = list(interleave([iter([1, 2]), iter([3])], 2, 4))
+        self.assertEqual([item for index, item in items if index == 0], [1, 2, END_OF_ITERATOR])
+        self.assertEqual([item for index, item in items if index == 1], [3, END_OF_ITERATOR])
+
+        def failing():
+            yield 1
+            raise RuntimeError("Boom")
+
+        with self.assertRaises(RuntimeError):
+            list(interleave([failing()], 1, 1))
+
+    def test_interleave_does_not_start_queued_iterators_after_an_error(self):
+        """Iterators waiting for a worker are not started once the caller stopped."""
+        started = []
+
+        def window(index):
+            started.append(index)
+            if index == 0:
+                raise RuntimeError("Window failed")
+            time.sleep(0.1)
+            yield index
+
+        with self.assertRaises(RuntimeError):
+            list(interleave([window(index) for index in range(8)], 2, 4))
+
+        self.assertLess(len(started), 8)
+        self.assertNotIn(7, started)
+
+
+class TestBackfillSync(unittest.TestCase):
+
+    @patch("tap_zoho_crm.streams.abstracts.write_state")
+    @patch("tap_zoho_crm.streams.abstracts.write_record")
+    def test_backfill_writes_every_record_once(self, mock_write_record, mock_write_state):
+        """Every window is fetched, no record is written twice, and the bookmark ends past the latest record."""
+        stream = build_stream(build_client({"backfill_window_days": 30, "backfill_workers": 3}), SCHEMA,
+                              PagedLeadsStream)
+        state = {}
+
+        with CompiledTransformer() as transformer:
+            self.assertEqual(stream.sync(state, transformer), len(RECORDS))
+
+        written_ids = sorted(int(call.args[1]["id"]) for call in mock_write_record.call_args_list)
+        self.assertEqual(written_ids, list(range(len(RECORDS))))
+        self.assertEqual(list(state["bookmarks"]["leads"]), ["Modified_Time"])
+        self.assertGreaterEqual(state["bookmarks"]["leads"]["Modified_Time"], RECORDS[-1]["Modified_Time"])
+
+    @patch("tap_zoho_crm.streams.abstracts.write_state")
+    @patch("tap_zoho_crm.streams.abstracts.write_record")
+    def test_failed_window_holds_bookmark_back(self, mock_write_record, mock_write_state):
+        """The bookmark never passes a window which is not complete, and the windows are resumed."""
+        stream = build_stream(build_client({"backfill_window_days": 90, "backfill_workers": 1}), SCHEMA,
+                              PagedLeadsStream)
+        stream.failing_window_start = "2024-06-29T00:00:00.000000Z"
+        written_states = []
+        mock_write_state.side_effect = lambda state: written_states.append(copy.deepcopy(state))
+        state = {}
+
+        with CompiledTransformer() as transformer, self.assertRaises(RuntimeError):
+            stream.sync(state, transformer)
+
+        bookmark = written_states[-1]["bookmarks"]["leads"]
+        pending_windows = bookmark["backfill_windows"]
+        self.assertEqual(bookmark["Modified_Time"], stream.failing_window_start)
+        self.assertEqual(pending_windows[0]["start"], stream.failing_window_start)
+
+        mock_write_record.reset_mock()
+        stream = build_stream(build_client({"backfill_window_days": 90, "backfill_workers": 1}), SCHEMA,
+                              PagedLeadsStream)
+        state = written_states[-1]
+        with CompiledTransformer() as transformer:
+            stream.sync(state, transformer)
+
+        resumed_ids = [call.args[1]["id"] for call in mock_write_record.call_args_list]
+        self.assertNotIn("0", resumed_ids)
+        self.assertIn(RECORDS[-1]["id"], resumed_ids)
+        self.assertNotIn("backfill_windows", state["bookmarks"]["leads"])
+
+    @patch("tap_zoho_crm.streams.abstracts.write_state")
+    @patch("tap_zoho_crm.streams.abstracts.write_record")
+    def test_recent_bookmark_is_not_sharded(self, mock_write_record, mock_write_state):
+        """A bookmark within the last window is synced through a single cursor."""
+        stream = build_stream(build_client({"backfill_window_days": 10000}), SCHEMA,
+                              PagedLeadsStream)
+        stream.sync_backfill_windows = MagicMock()
+
+        with CompiledTransformer() as transformer:
+            stream.sync({}, transformer)
+
+        stream.sync_backfill_windows.assert_not_called()
+
+    @patch("tap_zoho_crm.streams.abstracts.write_state")
+    @patch("tap_zoho_crm.streams.abstracts.write_record")
+    def test_record_modified_before_hydration(self, mock_write_record, mock_write_state):
+        """A record modified between the listing and the hydration of its page keeps its
+        listed modified time, so its window goes on paging and no record is lost."""
+        client = build_client({"backfill_window_days": 30, "backfill_workers": 2, "hydrate_by_id": "true"})
+        schema = dict(SCHEMA, properties=dict(
+            SCHEMA["properties"], **{f"field_{index}": {"type": ["null", "string"]} for index in range(60)}))
+        stream = build_stream(client, schema, HydratedLeadsStream)
+        stream.modified_ids = ("1",)
+        stream.client.make_request.side_effect = stream.answer_request
+        written_states = []
+        mock_write_state.side_effect = lambda state: written_states.append(copy.deepcopy(state))
+        state = {}
+
+        with CompiledTransformer() as transformer:
+            stream.sync(state, transformer)
+
+        written_ids = sorted(int(call.args[1]["id"]) for call in mock_write_record.call_args_list)
+        self.assertEqual(written_ids, list(range(len(RECORDS))))
+        bookmarks = [written_state["bookmarks"]["leads"]["Modified_Time"] for written_state in written_states]
+        self.assertEqual(bookmarks, sorted(bookmarks))
+        for written_state in written_states:
+            bookmark = written_state["bookmarks"]["leads"]
+            if bookmark.get("backfill_windows"):
+                self.assertLessEqual(bookmark["Modified_Time"], get_low_water_mark(bookmark["backfill_windows"]))
@@ -0,0 +1,193 @@
+import csv
+import io
+import json
+import threading
+import unittest
+import zipfile
+from datetime import datetime, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import patch
+from tap_zoho_crm.client import Client
+from tap_zoho_crm.bulk_read import bulk_row_to_record
+from tap_zoho_crm.exceptions import ZohoCRMError
+from tap_zoho_crm.helpers import get_config_list
+from tap_zoho_crm.transform import CompiledTransformer
+from stream_fixtures import build_stream
+
+SCHEMA = {
+    "type": "object",
+    "properties": {
+        "id": {"type": ["null", "string"]},
+        "Last_Name": {"type": ["null", "string"]},
+        "Annual_Revenue": {"type": ["null", "number"]},
+        "No_of_Employees": {"type": ["null", "integer"]},
+        "Email_Opt_Out": {"type": ["null", "boolean"]},
+        "Tags": {"type": ["null", "array"], "items": {"type": ["null", "string"]}},
+        "Owner": {"type": ["null", "object"], "additionalProperties": True},
+        "Subform": {"type": ["null", "array"], "items": {"type": ["null", "object"], "additionalProperties": True}},
+        "Modified_Time": {"type": ["null", "string"], "format": "date-time"}
+    }
+}
+
+# The CSV pages the stand-in server exports, in order
+PAGES = [
+    [
+        {"id": "1", "Last_Name": "Müller", "Annual_Revenue": "1200.5", "No_of_Employees": "12",
+         "Email_Opt_Out": "false", "Tags": "a;b", "Owner": "9001", "Modified_Time": "2024-03-02T10:00:00+05:30"},
+        {"id": "2", "Last_Name": "", "Annual_Revenue": "", "No_of_Employees": "",
+         "Email_Opt_Out": "true", "Tags": "", "Owner": "", "Modified_Time": "2024-03-01T00:00:00+00:00"},
+    ],
+    [
+        {"id": "3", "Last_Name": "Doe", "Annual_Revenue": "0", "No_of_Employees": "1",
+         "Email_Opt_Out": "false", "Tags": "c", "Owner": "9002", "Modified_Time": "2024-03-05T08:30:00+00:00"},
+    ],
+]
+
+
+def zip_csv(rows):
+    csv_text = io.StringIO()
+    writer = csv.DictWriter(csv_text, fieldnames=list(rows[0].keys()))
+    writer.writeheader()
+    writer.writerows(rows)
+    archive = io.BytesIO()
+    with zipfile.ZipFile(archive, "w") as zip_file:
+        zip_file.writestr("export.csv", csv_text.getvalue())
+    return archive.getvalue()
+
+
+class BulkReadHandler(BaseHTTPRequestHandler):
+    """A stand-in for the Bulk Read endpoints of Zoho CRM."""
+
+    def log_message(self, *args):
+        pass
+
+    def send_json(self, body):
+        payload = json.dumps(body).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def do_POST(self):
+        server = self.server
+        request = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        server.created_jobs.append(request)
+        job_id = str(len(server.created_jobs))
+        server.polls[job_id] = 0
+        self.send_json({"data": [{"status": "success", "code": "ADDED_SUCCESSFULLY",
+                                  "details": {"id": job_id, "state": "ADDED"}}], "info": {}})
+
+    def do_GET(self):
+        server = self.server
+        parts = self.path.strip("/").split("/")
+        job_id = parts[4]
+        if parts[-1] == "result":
+            payload = zip_csv(PAGES[int(job_id) - 1])
+            self.send_response(200)
+            self.send_header("Content-Type", "application/zip")
+            self.send_header("Content-Length", str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+            return
+
+        server.polls[job_id] += 1
+        if server.job_state:
+            self.send_json({"data": [{"id": job_id, "state": server.job_state}]})
+            return
+        if server.polls[job_id] < 2:
+            self.send_json({"data": [{"id": job_id, "state": "IN PROGRESS"}]})
+            return
+        page = int(job_id)
+        self.send_json({"data": [{"id": job_id, "state": "COMPLETED", "result": {
+            "page": page,
+            "count": len(PAGES[page - 1]),
+            "download_url": f"/crm/bulk/v8/read/{job_id}/result",
+            "more_records": page < len(PAGES)
+        }}]})
+
+
+class TestBulkRead(unittest.TestCase):
+
+    def setUp(self):
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), BulkReadHandler)
+        self.server.created_jobs = []
+        self.server.polls = {}
+        self.server.job_state = None
+        self.server_thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.server_thread.start()
+
+        self.client = Client({
+            "client_id": "dummy_id",
+            "client_secret": "dummy_secret",
+            "refresh_token": "dummy_token",
+            "user_agent": "test-account <test-email>",
+            "start_date": "2024-01-01T00:00:00Z",
+            "bulk_read_streams": "leads",
+            "bulk_read_poll_interval": 0.01,
+            "state_checkpoint_records": 1
+        })
+        self.client._access_token = "token"
+        self.client._token_type = "Zoho-oauthtoken"
+        self.client._expires_at = datetime.now() + timedelta(hours=1)
+        self.client._set_api_domain("http://127.0.0.1:{}".format(self.server.server_address[1]))
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+        self.client._session.close()
+
+    @patch("tap_zoho_crm.streams.abstracts.write_state")
+    @patch("tap_zoho_crm.streams.abstracts.write_record")
+    def test_incremental_sync_through_bulk_read(self, mock_write_record, mock_write_state):
+        """Every page of the export is written as typed records and the bookmark moves to the latest one."""
+        stream = build_stream(self.client, SCHEMA)
+        state = {"bookmarks": {"leads": {"Modified_Time": "2024-03-01T00:00:00.000000Z"}}}
+
+        with CompiledTransformer() as transformer:
+            self.assertEqual(stream.sync(state, transformer), 3)
+
+        records = [call.args[1] for call in mock_write_record.call_args_list]
+        self.assertEqual(records[0], {
+            "id": "1", "Last_Name": "Müller", "Annual_Revenue": 1200.5, "No_of_Employees": 12,
+            "Email_Opt_Out": False, "Tags": ["a", "b"], "Owner": {"id": "9001"},
+            "Modified_Time": "2024-03-02T04:30:00.000000Z"
+        })
+        self.assertIsNone(records[1]["Annual_Revenue"])
+        self.assertEqual(state["bookmarks"]["leads"]["Modified_Time"], "2024-03-05T08:30:00.000000Z")
+        mock_write_state.assert_not_called()
+
+        first_job, second_job = self.server.created_jobs
+        self.assertEqual(first_job["file_type"], "csv")
+        self.assertEqual(first_job["query"]["module"], {"api_name": "Leads"})
+        self.assertEqual(first_job["query"]["criteria"], {
+            "field": {"api_name": "Modified_Time"},
+            "comparator": "greater_equal",
+            "value": "2024-03-01T00:00:00+00:00"
+        })
+        self.assertNotIn("Subform", first_job["query"]["fields"])
+        self.assertEqual(second_job["query"]["page"], 2)
+
+    def test_failed_job_raises(self):
+        """A job which does not complete fails the sync instead of exporting nothing."""
+        self.server.job_state = "FAILURE"
+        stream = build_stream(self.client, SCHEMA)
+
+        with self.assertRaises(ZohoCRMError) as error:
+            list(stream.get_records())
+
+        self.assertIn("FAILURE", str(error.exception))
+
+
+class TestBulkReadHelpers(unittest.TestCase):
+
+    def test_bulk_read_streams_from_config(self):
+        """Streams are listed as a JSON list or a comma separated string."""
+        self.assertEqual(get_config_list({"bulk_read_streams": "leads, deals"}, "bulk_read_streams"), ["leads", "deals"])
+        self.assertEqual(get_config_list({"bulk_read_streams": ["leads"]}, "bulk_read_streams"), ["leads"])
+        self.assertEqual(get_config_list({}, "bulk_read_streams"), [])
+
+    def test_row_to_record(self):
+        """CSV cells are shaped like the values of the records API."""
+        record = bulk_row_to_record({"Tags": "a;b", "Owner": "1", "Name": "", "Amount": "5"}, SCHEMA["properties"])
+        self.assertEqual(record, {"Tags": ["a", "b"], "Owner": {"id": "1"}, "Name": None, "Amount": "5"})
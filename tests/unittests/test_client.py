@@ -1,9 +1,13 @@
+import time
 import unittest
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
 from parameterized import parameterized
 import requests
 from unittest.mock import patch, MagicMock
 from requests.exceptions import Timeout, ConnectionError, ChunkedEncodingError
 from tap_zoho_crm.client import Client
+from tap_zoho_crm import async_client
 from tap_zoho_crm.exceptions import (
     ZohoCRMBadRequestError,
     ZohoCRMUnauthorizedError,
@@ -134,3 +138,163 @@ class TestClient(unittest.TestCase):
 
         self.assertEqual(mock_request.call_count, 5)
 
+
+    @unittest.skipIf(async_client.aiohttp is not None, "aiohttp is installed")
+    def test_aiohttp_engine_requires_aiohttp(self):
+        """
+        Test that selecting the aiohttp http_engine without aiohttp installed fails clearly
+        """
+        config = default_config.copy()
+        config["http_engine"] = "aiohttp"
+
+        with self.assertRaises(ImportError) as context:
+            Client(config)
+
+        self.assertIn("tap-zoho-crm[async]", str(context.exception))
+
+    @parameterized.expand([
+        ["default", None, "https://accounts.zoho.com/oauth/v2/token", "https://www.zohoapis.com/crm/v8"],
+        ["eu", "eu", "https://accounts.zoho.eu/oauth/v2/token", "https://www.zohoapis.eu/crm/v8"],
+        ["india", "IN", "https://accounts.zoho.in/oauth/v2/token", "https://www.zohoapis.in/crm/v8"],
+        ["canada", "ca", "https://accounts.zohocloud.ca/oauth/v2/token", "https://www.zohoapis.ca/crm/v8"],
+    ])
+    def test_data_center_endpoints(self, name, data_center, expected_refresh_url, expected_base_url):
+        """
+        Test that the accounts server and API domain follow the configured data center
+        """
+        config = default_config.copy()
+        config["data_center"] = data_center
+        client = Client(config)
+        self.assertEqual(client.refresh_url, expected_refresh_url)
+        self.assertEqual(client.base_url, expected_base_url)
+
+    def test_unsupported_data_center(self):
+        """
+        Test that an unknown data center is rejected
+        """
+        config = default_config.copy()
+        config["data_center"] = "mars"
+        with self.assertRaises(ValueError):
+            Client(config)
+
+    @patch("tap_zoho_crm.client.Client._Client__make_request")
+    def test_refresh_routes_to_api_domain(self, mock_make_request):
+        """
+        Test that the api_domain returned with the access token becomes the base URL
+        """
+        mock_make_request.return_value = {
+            "access_token": "token",
+            "api_domain": "https://www.zohoapis.eu",
+            "expires_in": 3600
+        }
+        config = default_config.copy()
+        config["data_center"] = "eu"
+        client = Client(config)
+
+        client._refresh_access_token()
+
+        self.assertEqual(mock_make_request.call_args.args[1], "https://accounts.zoho.eu/oauth/v2/token")
+        self.assertEqual(client.base_url, "https://www.zohoapis.eu/crm/v8")
+
+    def test_token_refreshed_before_expiry(self):
+        """
+        Test that a token expiring within the refresh margin is refreshed proactively
+        """
+        config = default_config.copy()
+        config["token_refresh_margin"] = 300
+        client = Client(config)
+        client._access_token = "old-token"
+        client._expires_at = datetime.now() + timedelta(seconds=100)
+
+        def refresh():
+            client._access_token = "new-token"
+            client._expires_at = datetime.now() + timedelta(seconds=3600)
+
+        with patch.object(client, "_refresh_access_token", side_effect=refresh) as mock_refresh:
+            self.assertEqual(client.get_access_token(), "new-token")
+            self.assertEqual(client.get_access_token(), "new-token")
+
+        mock_refresh.assert_called_once()
+
+    def test_concurrent_callers_share_one_refresh(self):
+        """
+        Test that threads hitting an expired token wait for a single refresh
+        """
+        client = Client(default_config)
+
+        def refresh():
+            time.sleep(0.05)
+            client._access_token = "new-token"
+            client._expires_at = datetime.now() + timedelta(seconds=3600)
+
+        with patch.object(client, "_refresh_access_token", side_effect=refresh) as mock_refresh:
+            with ThreadPoolExecutor(max_workers=10) as executor:
+                tokens = list(executor.map(lambda _: client.get_access_token(), range(10)))
+
+        self.assertEqual(tokens, ["new-token"] * 10)
+        mock_refresh.assert_called_once()
+
+    def test_connection_pools_per_host(self):
+        """
+        Test that the accounts server and the API domain get pools sized from the config
+        """
+        config = default_config.copy()
+        config["connection_pool_size"] = 25
+        config["data_center"] = "eu"
+        client = Client(config)
+
+        for host in ("https://accounts.zoho.eu", "https://www.zohoapis.eu"):
+            adapter = client._session.adapters[host]
+            self.assertEqual(adapter._pool_connections, 25)
+            self.assertEqual(adapter._pool_maxsize, 25)
+
+        client._set_api_domain("https://www.zohoapis.in")
+        self.assertIn("https://www.zohoapis.in", client._session.adapters)
+        self.assertEqual(client.base_url, "https://www.zohoapis.in/crm/v8")
+
+    def test_connection_pool_covers_concurrency(self):
+        """
+        Test that the default pool is never smaller than the requests in flight
+        """
+        config = default_config.copy()
+        config["max_concurrent_requests"] = 20
+        client = Client(config)
+        self.assertEqual(client.connection_pool_size, 20)
+
+    def test_gzip_requested(self):
+        """
+        Test that API requests ask for gzip compressed responses over kept-alive connections
+        """
+        client = Client(default_config)
+        client._access_token = "token"
+        client._expires_at = datetime.now() + timedelta(seconds=3600)
+        headers, _ = client.authenticate({"Accept": "application/json"}, {})
+        self.assertEqual(headers["Accept-Encoding"], "gzip")
+        self.assertEqual(headers["Connection"], "keep-alive")
+
+    def test_connection_stats(self):
+        """
+        Test that connection reuse statistics are collected from the session's pools
+        """
+        client = Client(default_config)
+        pool = client._session.adapters["https://www.zohoapis.com"].poolmanager.connection_from_url(
+            "https://www.zohoapis.com")
+        pool.num_requests = 12
+        pool.num_connections = 2
+
+        self.assertEqual(client.get_connection_stats(), {"requests": 12, "connections": 2})
+
+    def test_streamed_request_returns_streamed_response(self):
+        """
+        Test that a streamed request parses the body while it is read
+        """
+        client = Client(default_config)
+        response = MagicMock(status_code=200, headers={})
+        response.iter_content.return_value = [b'{"data": [{"id": "1"}', b'], "info": {}}']
+        with patch.object(client._session, "request", return_value=response) as mock_request:
+            result = client.make_request("GET", "https://www.zohoapis.com/crm/v8/Leads", is_auth_req=False, stream=True)
+
+        self.assertTrue(mock_request.call_args.kwargs["stream"])
+        self.assertEqual(list(result.get("data")), [{"id": "1"}])
+        self.assertEqual(result["info"], {})
+        response.json.assert_not_called()
@@ -0,0 +1,264 @@
+import copy
+import json
+import operator
+import re
+import unittest
+from datetime import datetime
+from unittest.mock import patch, MagicMock
+from tap_zoho_crm.coql import CoqlReader, coql_literal
+from tap_zoho_crm.streams.abstracts import FullTableStream
+from tap_zoho_crm.transform import CompiledTransformer
+from stream_fixtures import build_client, build_stream
+
+SCHEMA = {
+    "type": "object",
+    "properties": {
+        "id": {"type": ["null", "string"]},
+        "Last_Name": {"type": ["null", "string"]},
+        "Subform": {"type": ["null", "array"], "items": {"type": ["null", "object"], "additionalProperties": True}},
+        "Modified_Time": {"type": ["null", "string"], "format": "date-time"}
+    }
+}
+
+
+COQL_CONFIG = {"coql_streams": "leads,notes", "state_checkpoint_records": 1}
+
+QUERY_PATTERN = re.compile(
+    r"select (?P<fields>.+?) from \w+ where (?P<where>.+?)"
+    r"(?: order by (?P<order_by>.+?))?(?: limit (?P<limit>\d+))?$"
+)
+TOKEN_PATTERN = re.compile(
+    r"\s*(?:(?P<in_field>\w+) in \((?P<in_values>[^)]*)\)"
+    r"|(?P<null_field>\w+) is not null"
+    r"|(?P<field>\w+) (?P<operator>>=|<=|>|<|=) (?P<value>'(?:[^'\\]|\\.)*'|\d+)"
+    r"|(?P<keyword>and|or|\(|\)))"
+)
+OPERATORS = {">=": operator.ge, "<=": operator.le, ">": operator.gt, "<": operator.lt, "=": operator.eq}
+
+
+def coql_value(value):
+    """Compare ids as numbers and datetimes as instants, like COQL does."""
+    value = str(value)
+    if value.startswith("'"):
+        value = re.sub(r"\\(.)", r"\1", value[1:-1])
+    if value.isdigit():
+        return int(value)
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        return value
+
+
+def tokenize_where(where):
+    """Split a where clause into its conditions, as predicates of the records, and the
+    `and`, `or` and parentheses joining them."""
+    tokens = []
+    position = 0
+    while position < len(where):
+        match = TOKEN_PATTERN.match(where, position)
+        if not match:
+            raise ValueError(f"Unexpected COQL at {where[position:]!r}")
+        position = match.end()
+        if match["keyword"]:
+            tokens.append(match["keyword"])
+        elif match["in_field"]:
+            tokens.append(lambda record, field=match["in_field"],
+                          values={coql_value(value) for value in match["in_values"].split(", ")}:
+                          field in record and coql_value(record[field]) in values)
+        elif match["null_field"]:
+            tokens.append(lambda record, field=match["null_field"]: record.get(field) is not None)
+        else:
+            tokens.append(lambda record, field=match["field"], compare=OPERATORS[match["operator"]],
+                          value=coql_value(match["value"]):
+                          record.get(field) is not None and compare(coql_value(record[field]), value))
+    return tokens
+
+
+def compile_where(where):
+    """Return a predicate of the records for a where clause of conditions joined by
+    `and`, `or` and parentheses, where `and` binds tighter than `or`."""
+    tokens = tokenize_where(where)
+
+    def parse_or():
+        predicates = [parse_and()]
+        while tokens and tokens[0] == "or":
+            tokens.pop(0)
+            predicates.append(parse_and())
+        return lambda record: any(predicate(record) for predicate in predicates)
+
+    def parse_and():
+        predicates = [parse_condition()]
+        while tokens and tokens[0] == "and":
+            tokens.pop(0)
+            predicates.append(parse_condition())
+        return lambda record: all(predicate(record) for predicate in predicates)
+
+    def parse_condition():
+        condition = tokens.pop(0)
+        if condition != "(":
+            return condition
+        predicate = parse_or()
+        if tokens.pop(0) != ")":
+            raise ValueError(f"Unbalanced parentheses in {where!r}")
+        return predicate
+
+    predicate = parse_or()
+    if tokens:
+        raise ValueError(f"Unexpected COQL in {where!r}")
+    return predicate
+
+
+class CoqlStandIn:
+    """Answers COQL queries from a list of records: the where clause is evaluated for
+    every record, and the matching ones are ordered and limited like the query asks."""
+
+    def __init__(self, records):
+        self.records = records
+        self.queries = []
+
+    def __call__(self, method, endpoint, headers=None, body=None, **kwargs):
+        select_query = json.loads(body)["select_query"]
+        self.queries.append(select_query)
+        query = QUERY_PATTERN.match(select_query)
+        matches = compile_where(query["where"])
+        records = [record for record in self.records if matches(record)]
+        if query["order_by"]:
+            order_fields = [order.split(" ")[0] for order in query["order_by"].split(", ")]
+            records.sort(key=lambda record: [coql_value(record[field]) for field in order_fields])
+        if query["limit"]:
+            records = records[:int(query["limit"])]
+        fields = query["fields"].split(", ")
+        return {"data": [{field: record[field] for field in fields if field in record} for record in records]}
+
+
+class DynamicNotesStream(FullTableStream):
+    tap_stream_id = "notes"
+    key_properties = ["id"]
+    replication_method = "FULL_TABLE"
+    data_key = "data"
+    path = "Notes"
+    is_dynamic = True
+
+
+class TestCoqlReader(unittest.TestCase):
+
+    def test_page_query(self):
+        """Pages are ordered by the sort key and id and start after the last record read."""
+        reader = CoqlReader(MagicMock(), "Leads", ["Last_Name"], sort_key="Modified_Time",
+                            conditions=["Modified_Time >= '2024-01-01T00:00:00+00:00'"],
+                            after={"id": "7", "Modified_Time": "2024-02-01T00:00:00+00:00"})
+        self.assertEqual(reader.build_page_query(), (
+            "select id, Modified_Time, Last_Name from Leads "
+            "where (Modified_Time >= '2024-01-01T00:00:00+00:00') and "
+            "((Modified_Time > '2024-02-01T00:00:00+00:00' or "
+            "(Modified_Time = '2024-02-01T00:00:00+00:00' and id > 7))) "
+            "order by Modified_Time asc, id asc limit 2000"
+        ))
+        self.assertEqual(CoqlReader(MagicMock(), "Notes", ["Note_Title"]).build_page_query(), (
+            "select id, Note_Title from Notes where id is not null order by id asc limit 2000"
+        ))
+
+    def test_wide_selection_is_hydrated(self):
+        """Fields beyond the limit of a query are fetched for the ids of the page and merged."""
+        fields = ["Field_{}".format(index) for index in range(120)]
+        reader = CoqlReader(MagicMock(), "Leads", fields, sort_key="Modified_Time")
+        self.assertEqual(len(reader.page_fields), 50)
+        self.assertEqual([len(batch) for batch in reader.hydrate_batches], [49, 23])
+
+        reader.query = MagicMock(side_effect=lambda select_query: [
+            {"id": "1", "Field_48": "a", "Field_119": "b"}
+        ] if " id in (" in select_query else [{"id": "1", "Modified_Time": "2024-01-01T00:00:00+00:00"}])
+        reader.client.max_concurrent_requests = 2
+
+        pages = list(reader.get_pages())
+
+        self.assertEqual(pages, [([{"id": "1", "Modified_Time": "2024-01-01T00:00:00+00:00",
+                                    "Field_48": "a", "Field_119": "b"}],
+                                  {"id": "1", "Modified_Time": "2024-01-01T00:00:00+00:00"})])
+
+    def test_literals(self):
+        """Ids are numbers, other values are quoted strings."""
+        self.assertEqual(coql_literal("5725767000000411001"), "5725767000000411001")
+        self.assertEqual(coql_literal("O'Brien"), "'O\\'Brien'")
+
+
+class TestCoqlStreams(unittest.TestCase):
+
+    records = [
+        {"id": "1", "Last_Name": "Doe", "Modified_Time": "2024-03-01T00:00:00+00:00"},
+        {"id": "2", "Last_Name": "Roe", "Modified_Time": "2024-03-02T10:00:00+00:00"},
+        {"id": "10", "Last_Name": "Moe", "Modified_Time": "2024-03-02T10:00:00+00:00"},
+        {"id": "3", "Last_Name": "Poe", "Modified_Time": "2024-03-02T10:00:00+00:00"},
+    ]
+
+    @patch("tap_zoho_crm.streams.abstracts.write_state")
+    @patch("tap_zoho_crm.streams.abstracts.write_record")
+    def test_incremental_sync(self, mock_write_record, mock_write_state):
+        """Records modified since the bookmark are queried and the bookmark moves to the latest one."""
+        stand_in = CoqlStandIn(self.records)
+        stream = build_stream(build_client(COQL_CONFIG, stand_in), SCHEMA)
+        state = {"bookmarks": {"leads": {"Modified_Time": "2024-03-01T00:00:00.000000Z"}}}
+        written_states = []
+        mock_write_state.side_effect = lambda state: written_states.append(copy.deepcopy(state))
+
+        with CompiledTransformer() as transformer:
+            self.assertEqual(stream.sync(state, transformer), 4)
+
+        self.assertIn("where (Modified_Time >= '2024-03-01T00:00:00+00:00')", stand_in.queries[0])
+        self.assertNotIn("Subform", stand_in.queries[0])
+        self.assertEqual(state, {"bookmarks": {"leads": {"Modified_Time": "2024-03-02T10:00:00.000000Z"}}})
+        # The keyset of the last record written is part of every checkpoint
+        self.assertEqual(written_states[1]["bookmarks"]["leads"]["coql_after"],
+                         {"id": "2", "Modified_Time": "2024-03-02T10:00:00+00:00"})
+
+    @patch("tap_zoho_crm.streams.abstracts.write_state")
+    @patch("tap_zoho_crm.streams.abstracts.write_record")
+    def test_incremental_sync_resumes_after_last_record(self, mock_write_record, mock_write_state):
+        """An interrupted sync continues right after the last record it wrote."""
+        stand_in = CoqlStandIn(self.records)
+        stream = build_stream(build_client(COQL_CONFIG, stand_in), SCHEMA)
+        state = {"bookmarks": {"leads": {
+            "Modified_Time": "2024-03-02T10:00:00.000000Z",
+            "coql_after": {"id": "2", "Modified_Time": "2024-03-02T10:00:00+00:00"}
+        }}}
+
+        with CompiledTransformer() as transformer:
+            self.assertEqual(stream.sync(state, transformer), 2)
+
+        # Ids are compared as numbers, so "10" comes after "3"
+        self.assertEqual([call.args[1]["id"] for call in mock_write_record.call_args_list], ["3", "10"])
+        self.assertNotIn("coql_after", state["bookmarks"]["leads"])
+
+    @patch("tap_zoho_crm.coql.COQL_PAGE_SIZE", 2)
+    @patch("tap_zoho_crm.streams.abstracts.write_state")
+    @patch("tap_zoho_crm.streams.abstracts.write_record")
+    def test_pages_split_records_of_the_same_time(self, mock_write_record, mock_write_state):
+        """Pages ending within records of the same modified time go on from the id of their last record."""
+        stand_in = CoqlStandIn(self.records)
+        stream = build_stream(build_client(COQL_CONFIG, stand_in), SCHEMA)
+        state = {"bookmarks": {"leads": {"Modified_Time": "2024-03-01T00:00:00.000000Z"}}}
+
+        with CompiledTransformer() as transformer:
+            self.assertEqual(stream.sync(state, transformer), 4)
+
+        self.assertEqual([call.args[1]["id"] for call in mock_write_record.call_args_list], ["1", "2", "3", "10"])
+        self.assertEqual(len(stand_in.queries), 3)
+        self.assertIn("(Modified_Time = '2024-03-02T10:00:00+00:00' and id > 2)", stand_in.queries[1])
+
+    @patch("tap_zoho_crm.streams.abstracts.write_state")
+    @patch("tap_zoho_crm.streams.abstracts.write_record")
+    def test_full_table_resumes_from_cursor(self, mock_write_record, mock_write_state):
+        """The pagination cursor of a COQL stream holds the id of the last record of the page."""
+        stand_in = CoqlStandIn([{"id": "10", "Last_Name": "Doe"}, {"id": "8", "Last_Name": "Roe"},
+                                {"id": "9", "Last_Name": "Poe"}])
+        stream = build_stream(build_client(COQL_CONFIG, stand_in), SCHEMA, DynamicNotesStream)
+        state = {"bookmarks": {"notes": {"pagination": {"page": 1, "page_token": None, "after": {"id": "8"}}}}}
+        written_states = []
+        mock_write_state.side_effect = lambda state: written_states.append(copy.deepcopy(state))
+
+        with CompiledTransformer() as transformer:
+            self.assertEqual(stream.sync(state, transformer), 2)
+
+        self.assertIn("where (id > 8)", stand_in.queries[0])
+        self.assertEqual(written_states[-1]["bookmarks"]["notes"]["pagination"]["after"], {"id": "10"})
+        self.assertEqual(state, {"bookmarks": {"notes": {}}})
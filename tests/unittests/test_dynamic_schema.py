@@ -1,9 +1,13 @@
 import unittest
+from unittest.mock import patch, MagicMock
 from parameterized import parameterized
+from singer import metadata
+from tap_zoho_crm.exceptions import ZohoCRMInternalServerError
 from tap_zoho_crm.schema import (
     should_include_field,
     get_replication_and_primary_key,
-    field_to_property_schema
+    field_to_property_schema,
+    get_dynamic_schema
 )
 
 
@@ -112,3 +116,32 @@ class TestSchemaFunctions(unittest.TestCase):
         result_schema = field_to_property_schema(field)
         self.assertEqual(result_schema, expected_schema)
 
+
+    @patch("tap_zoho_crm.schema.get_dynamic_metadata")
+    def test_get_dynamic_schema_keeps_module_order_and_skips_failures(self, mock_get_dynamic_metadata):
+        """
+        Module field metadata is fetched concurrently, but the schemas keep the module
+        order of settings/modules and a failing module does not abort the others.
+        """
+        modules = ["Leads", "Broken", "Deals", "Accounts"]
+
+        def get_dynamic_metadata(client, module=None):
+            if module is None:
+                return {"modules": [
+                    {"api_name": name, "viewable": True, "api_supported": True} for name in modules
+                ]}
+            if module == "Broken":
+                raise ZohoCRMInternalServerError("boom")
+            return {"fields": [{"api_name": "id"}, {"api_name": "Modified_Time"}]}
+
+        mock_get_dynamic_metadata.side_effect = get_dynamic_metadata
+        client = MagicMock()
+        client.max_concurrent_requests = 3
+
+        schemas, field_metadata = get_dynamic_schema(client)
+
+        self.assertEqual(list(schemas.keys()), ["Leads", "Deals", "Accounts"])
+        self.assertEqual(list(field_metadata.keys()), ["Leads", "Deals", "Accounts"])
+        self.assertEqual(mock_get_dynamic_metadata.call_count, 5)
+        root_metadata = metadata.to_map(field_metadata["Deals"])[()]
+        self.assertEqual(root_metadata["module-api-name"], "Deals")
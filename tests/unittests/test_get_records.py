@@ -0,0 +1,346 @@
+import json
+import unittest
+from datetime import datetime, timedelta
+from unittest.mock import patch, MagicMock
+from requests.exceptions import ChunkedEncodingError, ConnectionError
+from singer import utils as singer_utils
+from tap_zoho_crm.client import Client
+from tap_zoho_crm.exceptions import ZohoCRMBadRequestError
+from tap_zoho_crm.json_stream import StreamedResponse
+from tap_zoho_crm.streams.abstracts import FullTableStream, FIELD_BATCH_SIZE, prefetch
+
+
+class ConcreteDynamicStream(FullTableStream):
+    tap_stream_id = "leads"
+    key_properties = ["id"]
+    replication_method = "FULL_TABLE"
+    data_key = "data"
+    path = "Leads"
+    is_dynamic = True
+
+
+def build_stream(field_count, max_concurrent_requests=3):
+    catalog = MagicMock()
+    catalog.schema.to_dict.return_value = {
+        "properties": {f"field_{i}": {"type": ["null", "string"]} for i in range(field_count)}
+    }
+    catalog.metadata = []
+    client = MagicMock()
+    client.config = {}
+    client.async_client = None
+    client.max_concurrent_requests = max_concurrent_requests
+    return ConcreteDynamicStream(client=client, catalog=catalog)
+
+
+class TestDynamicGetRecords(unittest.TestCase):
+
+    def test_field_batches_are_merged_by_id(self):
+        """Each field batch returns a slice of the record; the slices are merged by id."""
+        stream = build_stream(field_count=120)
+
+        def make_request(method, endpoint, params, headers, body=None, path=None, stream=False):
+            fields = params["fields"].split(",")
+            return {
+                "data": [
+                    {**{field: "a" for field in fields}, "id": "1"},
+                    {**{field: "b" for field in fields}, "id": "2"},
+                ],
+                "info": {"more_records": False}
+            }
+
+        stream.client.make_request.side_effect = make_request
+        records = list(stream.get_records())
+
+        expected_batches = -(-121 // FIELD_BATCH_SIZE)
+        self.assertEqual(stream.client.make_request.call_count, expected_batches)
+        self.assertEqual(len(records), 2)
+        self.assertEqual(len(records[0]), 121)
+        self.assertEqual(records[1]["field_119"], "b")
+
+    def test_dynamic_stream_merges_streamed_batches(self):
+        """Field batches parsed while they are read are merged like loaded responses."""
+        stream = build_stream(field_count=120)
+        stream.client.config = {"stream_responses": True}
+
+        def make_request(method, endpoint, params, headers, body=None, path=None, stream=False):
+            self.assertTrue(stream)
+            fields = params["fields"].split(",")
+            page = {"data": [{**{field: "a" for field in fields}, "id": "1"}], "info": {"more_records": False}}
+            body = json.dumps(page).encode("utf-8")
+            return StreamedResponse(body[index:index + 100] for index in range(0, len(body), 100))
+
+        stream.client.make_request.side_effect = make_request
+        records = list(stream.get_records())
+
+        self.assertEqual(len(records), 1)
+        self.assertEqual(len(records[0]), 121)
+
+    @patch("time.sleep", return_value=None)
+    def test_streamed_page_refetched_when_body_is_cut(self, mock_sleep):
+        """A connection lost while a streamed body is read fetches the page again."""
+        stream = build_stream(field_count=120)
+        stream.client.config = {"stream_responses": True}
+        cut_bodies = []
+
+        def make_request(method, endpoint, params, headers, body=None, path=None, stream=False):
+            fields = params["fields"].split(",")
+            page = {"data": [{**{field: "a" for field in fields}, "id": "1"}], "info": {"more_records": False}}
+            body = json.dumps(page).encode("utf-8")
+
+            def chunks():
+                yield body[:50]
+                if not cut_bodies:
+                    cut_bodies.append(fields[0])
+                    raise ChunkedEncodingError("Connection broken")
+                yield body[50:]
+            return StreamedResponse(chunks())
+
+        stream.client.make_request.side_effect = make_request
+        records = list(stream.get_records())
+
+        self.assertEqual(len(records), 1)
+        self.assertEqual(len(records[0]), 121)
+        self.assertEqual(stream.client.make_request.call_count, 2 * -(-121 // FIELD_BATCH_SIZE))
+
+    @patch("time.sleep", return_value=None)
+    def test_loaded_page_is_not_retried_again(self, mock_sleep):
+        """A connection error on a loaded body is retried by the client only, not again per page."""
+        stream = build_stream(field_count=10)
+        stream.client = Client({
+            "client_id": "dummy_id",
+            "client_secret": "dummy_secret",
+            "refresh_token": "dummy_token",
+            "user_agent": "test-account <test-email>"
+        })
+        stream.client._access_token = "token"
+        stream.client._expires_at = datetime.now() + timedelta(hours=1)
+
+        with patch.object(stream.client._session, "request", side_effect=ConnectionError) as mock_request:
+            with self.assertRaises(ConnectionError):
+                list(stream.get_records())
+
+        self.assertEqual(mock_request.call_count, 5)
+
+    def test_field_batches_do_not_share_params(self):
+        """Concurrent batches must each send their own `fields` value."""
+        stream = build_stream(field_count=120)
+        stream.client.make_request.return_value = {"data": [], "info": {"more_records": False}}
+
+        list(stream.get_records())
+
+        requested = [call.kwargs["params"]["fields"] for call in stream.client.make_request.call_args_list]
+        self.assertEqual(len(set(requested)), len(requested))
+        self.assertNotIn("fields", stream.params)
+
+    def test_pagination_across_pages(self):
+        """All field batches of a page complete before the next page is requested."""
+        stream = build_stream(field_count=60)
+        pages = {
+            None: {"data": [{"id": "1"}], "info": {"more_records": True}},
+            2: {"data": [{"id": "2"}], "info": {"more_records": False}},
+        }
+        stream.client.make_request.side_effect = \
+            lambda method, endpoint, params, headers, body=None, path=None, stream=False: pages[params.get("page")]
+
+        records = list(stream.get_records())
+
+        self.assertEqual([record["id"] for record in records], ["1", "2"])
+        self.assertEqual(stream.client.make_request.call_count, 4)
+
+    def test_only_selected_fields_are_requested(self):
+        """Deselected fields are not sent in the `fields` param; keys are always sent."""
+        stream = build_stream(field_count=3)
+        stream.schema["properties"]["Modified_Time"] = {"type": ["null", "string"]}
+        stream.replication_keys = ["Modified_Time"]
+        stream.metadata = {
+            ("properties", "field_0"): {"selected": True},
+            ("properties", "field_1"): {"selected": False},
+            ("properties", "field_2"): {"inclusion": "unsupported"},
+            ("properties", "Modified_Time"): {"inclusion": "automatic", "selected": False},
+        }
+        stream.client.make_request.return_value = {"data": [], "info": {"more_records": False}}
+
+        list(stream.get_records())
+
+        stream.client.make_request.assert_called_once()
+        fields = stream.client.make_request.call_args.kwargs["params"]["fields"].split(",")
+        self.assertEqual(fields, ["id", "Modified_Time", "field_0"])
+
+    def test_not_modified_response_yields_nothing(self):
+        """A 304 answer to a conditional request ends the stream without records."""
+        stream = build_stream(field_count=3)
+        stream.client.make_request.return_value = None
+
+        self.assertEqual(list(stream.get_records()), [])
+
+    def test_prefetched_pages_keep_order(self):
+        """With prefetch_pages the records and checkpoints are identical to the sequential path."""
+        stream = build_stream(field_count=3)
+        stream.client.config = {"prefetch_pages": 2}
+        stream.checkpoint_pagination = MagicMock()
+        pages = {
+            None: {"data": [{"id": "1"}, {"id": "2"}], "info": {"more_records": True}},
+            2: {"data": [{"id": "3"}], "info": {"more_records": True}},
+            3: {"data": [{"id": "4"}], "info": {"more_records": False}},
+        }
+        stream.client.make_request.side_effect = \
+            lambda method, endpoint, params, headers, body=None, path=None, stream=False: pages[params.get("page")]
+
+        records = list(stream.get_records())
+
+        self.assertEqual([record["id"] for record in records], ["1", "2", "3", "4"])
+        self.assertEqual(
+            [call.args[0]["page"] for call in stream.checkpoint_pagination.call_args_list], [2, 3])
+
+    def test_field_batches_hydrated_by_id(self):
+        """With `hydrate_by_id`, the page lists ids once and every batch is fetched for those ids."""
+        stream = build_stream(field_count=120)
+        stream.client.config = {"hydrate_by_id": "true"}
+        stream.headers["If-Modified-Since"] = "2024-01-01T00:00:00+00:00"
+        listed_ids = [str(record_id) for record_id in range(150)]
+
+        def make_request(method, endpoint, params, headers, body=None, path=None, stream=False):
+            if "ids" not in params:
+                self.assertEqual(params["fields"], "id")
+                return {"data": [{"id": record_id} for record_id in listed_ids], "info": {"more_records": False}}
+            self.assertNotIn("If-Modified-Since", headers)
+            ids = params["ids"].split(",")
+            self.assertLessEqual(len(ids), 100)
+            # A record deleted after the page was listed is not returned
+            return {"data": [{"id": record_id, **{field: record_id for field in params["fields"].split(",")}}
+                             for record_id in ids if record_id != "7"]}
+
+        stream.client.make_request.side_effect = make_request
+        records = list(stream.get_records())
+
+        expected_batches = -(-121 // FIELD_BATCH_SIZE)
+        self.assertEqual(stream.client.make_request.call_count, 1 + expected_batches * 2)
+        self.assertEqual([record["id"] for record in records], [record_id for record_id in listed_ids if record_id != "7"])
+        self.assertEqual(len(records[0]), 121)
+        self.assertEqual(records[-1]["field_119"], "149")
+
+    def test_field_batches_use_async_engine(self):
+        """With the aiohttp engine all field batches of a page go out in one event-loop round."""
+        stream = build_stream(field_count=120)
+        stream.client.async_client = MagicMock()
+        stream.client.async_client.make_requests.side_effect = lambda requests: [
+            {"data": [{"id": "1", request["params"]["fields"].split(",")[-1]: "x"}],
+             "info": {"more_records": False}}
+            for request in requests
+        ]
+
+        records = list(stream.get_records())
+
+        stream.client.async_client.make_requests.assert_called_once()
+        stream.client.make_request.assert_not_called()
+        self.assertEqual(len(records), 1)
+        self.assertEqual(records[0]["field_119"], "x")
+
+
+class TestPrefetch(unittest.TestCase):
+
+    def test_prefetch_reraises_errors(self):
+        """An error raised while fetching is raised in the consumer after the buffered items."""
+        def pages():
+            yield 1
+            raise ZohoCRMBadRequestError("boom")
+
+        consumed = []
+        with self.assertRaises(ZohoCRMBadRequestError):
+            for item in prefetch(pages(), 1):
+                consumed.append(item)
+        self.assertEqual(consumed, [1])
+
+    def test_prefetch_stops_when_consumer_stops(self):
+        """Closing the consumer stops the producer thread and closes the source generator."""
+        closed = []
+
+        def pages():
+            try:
+                for index in range(1000):
+                    yield index
+            finally:
+                closed.append(True)
+
+        prefetched = prefetch(pages(), 2)
+        self.assertEqual(next(prefetched), 0)
+        prefetched.close()
+
+        self.assertEqual(closed, [True])
+
+
+class TestResumablePagination(unittest.TestCase):
+
+    def setUp(self):
+        self.stream = build_stream(field_count=3)
+        self.stream.is_selected = MagicMock(return_value=True)
+        self.transformer = MagicMock()
+        self.transformer.transform.side_effect = lambda record, schema, mdata: record
+
+    @patch("tap_zoho_crm.streams.abstracts.write_record")
+    @patch("tap_zoho_crm.streams.abstracts.write_state")
+    def test_cursor_checkpointed_after_each_page(self, mock_write_state, mock_write_record):
+        """The next page cursor is saved once a page is written and cleared at the end."""
+        pages = {
+            None: {"data": [{"id": "1"}], "info": {"more_records": True}},
+            2: {"data": [{"id": "2"}], "info": {"next_page_token": "token-3"}},
+            "token-3": {"data": [{"id": "3"}], "info": {"more_records": False}},
+        }
+        saved_cursors = []
+        mock_write_state.side_effect = lambda state: saved_cursors.append(
+            dict(state["bookmarks"]["leads"]["pagination"]))
+        self.stream.client.make_request.side_effect = \
+            lambda method, endpoint, params, headers, body=None, path=None, stream=False: \
+            pages[params.get("page_token") or params.get("page")]
+        state = {}
+
+        self.stream.sync(state, self.transformer)
+
+        self.assertEqual([(cursor["page"], cursor["page_token"]) for cursor in saved_cursors],
+                         [(2, None), (2, "token-3")])
+        self.assertEqual(mock_write_record.call_count, 3)
+        self.assertNotIn("pagination", state["bookmarks"]["leads"])
+
+    @patch("tap_zoho_crm.streams.abstracts.write_record")
+    @patch("tap_zoho_crm.streams.abstracts.write_state")
+    def test_resume_from_saved_cursor(self, mock_write_state, mock_write_record):
+        """An interrupted sync restarts from the saved page."""
+        self.stream.client.make_request.return_value = {"data": [{"id": "5"}], "info": {"more_records": False}}
+        state = {"bookmarks": {"leads": {"pagination": {
+            "page": 5, "page_token": None, "saved_at": "2020-01-01T00:00:00.000000Z"}}}}
+
+        self.stream.sync(state, self.transformer)
+
+        self.assertEqual(self.stream.client.make_request.call_args.kwargs["params"]["page"], 5)
+        mock_write_record.assert_called_once()
+
+    @patch("tap_zoho_crm.streams.abstracts.write_record")
+    @patch("tap_zoho_crm.streams.abstracts.write_state")
+    def test_expired_page_token_restarts_stream(self, mock_write_state, mock_write_record):
+        """A page token older than a day is discarded and the stream restarts."""
+        self.stream.client.make_request.return_value = {"data": [{"id": "1"}], "info": {"more_records": False}}
+        state = {"bookmarks": {"leads": {"pagination": {
+            "page": 12, "page_token": "old", "saved_at": "2020-01-01T00:00:00.000000Z"}}}}
+
+        self.stream.sync(state, self.transformer)
+
+        params = self.stream.client.make_request.call_args.kwargs["params"]
+        self.assertNotIn("page", params)
+        self.assertNotIn("page_token", params)
+
+    @patch("tap_zoho_crm.streams.abstracts.write_record")
+    @patch("tap_zoho_crm.streams.abstracts.write_state")
+    def test_rejected_cursor_restarts_stream(self, mock_write_state, mock_write_record):
+        """A cursor rejected by the API falls back to a full restart."""
+        self.stream.client.make_request.side_effect = [
+            ZohoCRMBadRequestError("invalid page token"),
+            {"data": [{"id": "1"}], "info": {"more_records": False}},
+        ]
+        state = {"bookmarks": {"leads": {"pagination": {
+            "page": 12, "page_token": "token", "saved_at": singer_utils.strftime(singer_utils.now())}}}}
+
+        self.stream.sync(state, self.transformer)
+
+        mock_write_record.assert_called_once()
+        self.assertNotIn("page_token", self.stream.client.make_request.call_args.kwargs["params"])
+        self.assertNotIn("pagination", state["bookmarks"]["leads"])
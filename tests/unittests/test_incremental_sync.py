@@ -56,3 +56,57 @@ class TestSync(unittest.TestCase):
         result = self.stream.write_bookmark(state, "test_stream", "updated_at", 200)
         self.assertEqual(result, {'bookmarks': {'test_stream': {'updated_at': 300}}})
 
+
+    def test_incremental_filters_pushed_to_server(self):
+        """Streams backed by the records API send If-Modified-Since a second before the
+        bookmark, so records of the bookmark's second are not skipped, and sort ascending."""
+        self.stream.if_modified_since_supported = True
+        self.stream.sort_by = "Modified_Time"
+
+        self.stream.set_incremental_filters("2024-01-02T03:04:05.000000Z")
+
+        self.assertEqual(self.stream.headers["If-Modified-Since"], "2024-01-02T03:04:04+00:00")
+        self.assertEqual(self.stream.params["sort_by"], "Modified_Time")
+        self.assertEqual(self.stream.params["sort_order"], "asc")
+        self.assertNotIn("If-Modified-Since", IncrementalStream.headers)
+
+    def test_incremental_filters_not_supported(self):
+        """Streams without server-side filtering only get the updated_since param."""
+        self.stream.set_incremental_filters("2024-01-02T03:04:05Z")
+
+        self.assertNotIn("If-Modified-Since", self.stream.headers)
+        self.assertEqual(self.stream.params, {"updated_since": "2024-01-02T03:04:05Z"})
+
+    @patch("tap_zoho_crm.streams.abstracts.write_state")
+    @patch("tap_zoho_crm.streams.abstracts.write_record")
+    @patch("tap_zoho_crm.streams.abstracts.IncrementalStream.is_selected", return_value=True)
+    def test_sorted_stream_checkpoints_state(self, mock_is_selected, mock_write_record, mock_write_state):
+        """Sorted streams emit a STATE message every `state_checkpoint_records` records."""
+        self.stream.client.config = {"start_date": "2024-01-01T00:00:00Z", "state_checkpoint_records": 2}
+        self.stream.sort_by = "updated_at"
+        records = [{"id": i, "updated_at": f"2024-01-0{i}T00:00:00Z"} for i in range(1, 6)]
+        self.stream.get_records = MagicMock(return_value=iter(records))
+        transformer = MagicMock()
+        transformer.transform.side_effect = lambda record, schema, mdata: record
+        state = {}
+
+        self.stream.sync(state, transformer)
+
+        self.assertEqual(mock_write_state.call_count, 2)
+        self.assertEqual(mock_write_record.call_count, 5)
+        self.assertEqual(state["bookmarks"]["stream_1"]["updated_at"], "2024-01-05T00:00:00Z")
+
+    @patch("tap_zoho_crm.streams.abstracts.write_state")
+    @patch("tap_zoho_crm.streams.abstracts.write_record")
+    @patch("tap_zoho_crm.streams.abstracts.IncrementalStream.is_selected", return_value=True)
+    def test_unsorted_stream_does_not_checkpoint(self, mock_is_selected, mock_write_record, mock_write_state):
+        """Without an ascending sort the bookmark is only written at the end of the stream."""
+        self.stream.client.config = {"start_date": "2024-01-01T00:00:00Z", "state_checkpoint_records": 1}
+        records = [{"id": i, "updated_at": f"2024-01-0{i}T00:00:00Z"} for i in (3, 1, 2)]
+        self.stream.get_records = MagicMock(return_value=iter(records))
+        transformer = MagicMock()
+        transformer.transform.side_effect = lambda record, schema, mdata: record
+
+        self.stream.sync({}, transformer)
+
+        mock_write_state.assert_not_called()
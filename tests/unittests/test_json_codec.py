@@ -0,0 +1,80 @@
+import io
+import json
+import unittest
+from datetime import datetime, timezone
+from decimal import Decimal
+from unittest.mock import patch
+import singer
+from tap_zoho_crm import json_codec, writer
+
+RECORD = {
+    "id": "5725767000000411001",
+    "Last_Name": "Müller ☃",
+    "Amount": 1234.5,
+    "Probability": 10,
+    "Tag": [{"name": "a\"b\\c"}],
+    "Owner": None,
+    "Converted": False
+}
+
+
+class TestJSONCodec(unittest.TestCase):
+
+    def test_messages_decode_like_singer(self):
+        """The fast codec emits messages which decode to the same values as singer's."""
+        messages = [
+            singer.RecordMessage(stream="leads", record=RECORD,
+                                 time_extracted=datetime(2024, 1, 2, 3, 4, 5, tzinfo=timezone.utc)),
+            singer.SchemaMessage(stream="leads", schema={"type": "object"}, key_properties=["id"]),
+            singer.StateMessage(value={"bookmarks": {"leads": {"Modified_Time": "2024-01-01T00:00:00Z"}}}),
+        ]
+        for message in messages:
+            line = json_codec.format_message(message)
+            self.assertNotIn(b"\n", line)
+            self.assertEqual(json.loads(line), json.loads(singer.format_message(message)))
+
+    def test_unsupported_values_fall_back_to_singer(self):
+        """Values orjson cannot encode exactly are serialized by singer."""
+        for record in ({"amount": Decimal("1.10")}, {"big": 2 ** 70}):
+            message = singer.RecordMessage(stream="leads", record=record)
+            self.assertEqual(json_codec.format_message(message), singer.format_message(message).encode("utf-8"))
+
+    def test_standard_library_without_orjson(self):
+        """Without orjson, messages are byte-identical to singer's and decoding is unchanged."""
+        message = singer.RecordMessage(stream="leads", record=RECORD)
+        with patch.object(json_codec, "orjson", None):
+            self.assertEqual(json_codec.format_message(message), singer.format_message(message).encode("utf-8"))
+            self.assertEqual(json_codec.loads(b'{"data": [1.5]}'), {"data": [1.5]})
+
+    def test_non_finite_floats_are_rejected_like_singer(self):
+        """NaN and infinities raise like singer's output instead of being written as null."""
+        for record in ({"amount": float("nan")}, {"items": [{"amount": float("inf")}], "owner": None}):
+            with self.assertRaises(ValueError):
+                json_codec.format_message(singer.RecordMessage(stream="leads", record=record))
+        message = singer.RecordMessage(stream="leads", record={"amount": 1.5, "owner": None})
+        self.assertEqual(json.loads(json_codec.format_message(message))["record"], {"amount": 1.5, "owner": None})
+
+    def test_loads_falls_back_to_standard_library(self):
+        """Documents rejected by orjson are decoded, or rejected, by the standard library."""
+        self.assertEqual(json_codec.loads('{"Amount": 12.5, "Name": "Müller"}'), {"Amount": 12.5, "Name": "Müller"})
+        self.assertEqual(str(json_codec.loads(b'{"value": NaN}')["value"]), "nan")
+        with self.assertRaises(ValueError):
+            json_codec.loads(b'{"data": ')
+
+    def test_emitted_message_is_a_line(self):
+        """Each emitted message is a single line on stdout."""
+        stdout = io.TextIOWrapper(io.BytesIO(), encoding="utf-8")
+        with patch("sys.stdout", stdout):
+            writer.emit_state({"bookmarks": {}})
+
+        output = stdout.buffer.getvalue()
+        self.assertEqual(json.loads(output), {"type": "STATE", "value": {"bookmarks": {}}})
+        self.assertTrue(output.endswith(b"\n"))
+
+    def test_output_is_utf8_whatever_the_stdout_encoding(self):
+        """Non-ASCII characters are written as UTF-8 even when stdout encodes text otherwise."""
+        stdout = io.TextIOWrapper(io.BytesIO(), encoding="latin-1")
+        with patch("sys.stdout", stdout):
+            writer.emit_message(singer.RecordMessage(stream="leads", record={"Last_Name": "王"}))
+
+        self.assertEqual(json.loads(stdout.buffer.getvalue().decode("utf-8"))["record"], {"Last_Name": "王"})
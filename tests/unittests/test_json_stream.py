@@ -0,0 +1,61 @@
+import json
+import unittest
+from tap_zoho_crm.json_stream import StreamedResponse
+
+PAGE = {
+    "data": [
+        {"id": "1", "Last_Name": "Müller", "Amount": 1234.5, "Tags": [{"name": "a"}]},
+        {"id": "2", "Last_Name": "O\"Brien", "Amount": 1234567890123, "Owner": None},
+    ],
+    "info": {"per_page": 200, "more_records": True, "next_page_token": "token"}
+}
+
+
+def chunked(text, size):
+    body = text.encode("utf-8")
+    return [body[index:index + size] for index in range(0, len(body), size)]
+
+
+class TestStreamedResponse(unittest.TestCase):
+
+    def test_records_and_info_for_any_chunking(self):
+        """Records and the info block match the whole-body parse wherever the chunks split."""
+        body = json.dumps(PAGE, ensure_ascii=False, indent=1)
+        for size in (1, 2, 3, 7, 64, len(body)):
+            response = StreamedResponse(chunked(body, size))
+
+            records = list(response.get("data", []))
+
+            self.assertEqual(records, PAGE["data"], size)
+            self.assertIn("info", response)
+            self.assertEqual(response["info"], PAGE["info"], size)
+
+    def test_records_are_yielded_as_they_arrive(self):
+        """The first record is available before the rest of the body has been read."""
+        chunks = iter(chunked(json.dumps(PAGE), 16))
+        response = StreamedResponse(chunks)
+
+        first_record = next(response.get("data"))
+
+        self.assertEqual(first_record["id"], "1")
+        self.assertIsNotNone(next(chunks, None))
+
+    def test_info_skips_unconsumed_records(self):
+        """Looking up the info block skips the records which were not consumed."""
+        response = StreamedResponse(chunked(json.dumps(PAGE), 5))
+        next(response.get("data"))
+
+        self.assertEqual(response.get("info"), PAGE["info"])
+        self.assertEqual(response.read_rest(), {"data": [], "info": PAGE["info"]})
+
+    def test_missing_and_empty_members(self):
+        """An empty object and an empty array parse like their whole-body counterparts."""
+        self.assertIsNone(StreamedResponse([b"{}"]).get("data"))
+        self.assertEqual(list(StreamedResponse([b'{"data": []}']).get("data", [])), [])
+        self.assertFalse("info" in StreamedResponse([b'{"data": []}']))
+
+    def test_truncated_body_raises(self):
+        """A body cut short is an error rather than a silently shorter page."""
+        response = StreamedResponse([json.dumps(PAGE).encode("utf-8")[:60]])
+        with self.assertRaises(ValueError):
+            list(response.get("data"))
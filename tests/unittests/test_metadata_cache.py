@@ -0,0 +1,99 @@
+import os
+import time
+import tempfile
+import unittest
+from unittest.mock import MagicMock
+from tap_zoho_crm.metadata_cache import MetadataCache
+from tap_zoho_crm.schema import get_dynamic_metadata
+
+
+class TestMetadataCache(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.config = {
+            "client_id": "dummy_id",
+            "refresh_token": "dummy_token",
+            "metadata_cache_dir": self.tmp_dir.name,
+            "metadata_cache_ttl": 3600
+        }
+        self.client = MagicMock()
+        self.client.base_url = "https://www.zohoapis.com/crm/v8"
+        self.client.metadata_cache = MetadataCache.from_config(self.config)
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_cache_disabled_without_directory(self):
+        """The cache is opt-in and is not built without `metadata_cache_dir`."""
+        self.assertIsNone(MetadataCache.from_config({"client_id": "dummy_id"}))
+
+    def test_cache_key_does_not_contain_secrets(self):
+        """The cache directory is keyed by a hash of the account credentials."""
+        cache_dir = self.client.metadata_cache.cache_dir
+        self.assertNotIn("dummy_token", cache_dir)
+        self.assertTrue(os.path.isdir(cache_dir))
+
+    def test_fresh_entry_skips_request(self):
+        """A cached response younger than the TTL is returned without an API call."""
+        self.client.make_request.return_value = {"fields": [{"api_name": "id"}]}
+
+        first = get_dynamic_metadata(self.client, module="Leads")
+        second = get_dynamic_metadata(self.client, module="Leads")
+
+        self.assertEqual(first, second)
+        self.client.make_request.assert_called_once()
+        self.assertEqual(self.client.make_request.call_args.kwargs["headers"], {})
+
+    def test_stale_entry_is_revalidated(self):
+        """A stale entry is revalidated and reused when the API answers 304."""
+        cache = self.client.metadata_cache
+        entry = cache.write("Leads", {"fields": [{"api_name": "id"}]})
+        entry["fetched_at"] = time.time() - 7200
+        cache.ttl = 3600
+        cache.read = MagicMock(return_value=entry)
+        self.client.make_request.return_value = None
+
+        result = get_dynamic_metadata(self.client, module="Leads")
+
+        self.assertEqual(result, {"fields": [{"api_name": "id"}]})
+        headers = self.client.make_request.call_args.kwargs["headers"]
+        self.assertEqual(headers["If-Modified-Since"], entry["last_modified"])
+
+    def test_force_refresh_ignores_cache(self):
+        """`refresh_metadata_cache` bypasses cached entries and rewrites them."""
+        self.client.metadata_cache.write("_modules", {"modules": []})
+        self.config["refresh_metadata_cache"] = True
+        self.client.metadata_cache = MetadataCache.from_config(self.config)
+        self.client.make_request.return_value = {"modules": [{"api_name": "Leads"}]}
+
+        result = get_dynamic_metadata(self.client)
+
+        self.assertEqual(result, {"modules": [{"api_name": "Leads"}]})
+        self.client.make_request.assert_called_once()
+
+    def test_modified_entry_is_fetched_again(self):
+        """A revalidation answering with the modified fields only triggers a full request."""
+        cache = self.client.metadata_cache
+        entry = cache.write("Leads", {"fields": [{"api_name": "id"}, {"api_name": "Last_Name"}]})
+        entry["fetched_at"] = time.time() - 7200
+        cache.read = MagicMock(return_value=entry)
+        full_response = {"fields": [{"api_name": "id"}, {"api_name": "Last_Name"}, {"api_name": "Email"}]}
+        self.client.make_request.side_effect = [{"fields": [{"api_name": "Email"}]}, full_response]
+
+        result = get_dynamic_metadata(self.client, module="Leads")
+
+        self.assertEqual(result, full_response)
+        first_call, second_call = self.client.make_request.call_args_list
+        self.assertIn("If-Modified-Since", first_call.kwargs["headers"])
+        self.assertEqual(second_call.kwargs["headers"], {})
+        del cache.read
+        self.assertEqual(cache.read("Leads")["response"], full_response)
+
+    def test_skipped_module_is_not_cached(self):
+        """An error body answered for a module without permission is not cached."""
+        self.client.make_request.return_value = {"code": "NO_PERMISSION", "status": "error"}
+
+        get_dynamic_metadata(self.client, module="Leads")
+
+        self.assertIsNone(self.client.metadata_cache.read("Leads"))
@@ -0,0 +1,127 @@
+import time
+import threading
+import unittest
+from unittest.mock import patch, MagicMock
+from tap_zoho_crm.client import raise_for_error
+from tap_zoho_crm.exceptions import ZohoCRMRateLimitError
+from tap_zoho_crm.rate_limiter import (
+    MAX_RATE_LIMIT_RETRY_WAIT,
+    RateLimiter,
+    parse_rate_limit_headers,
+    rate_limit_wait
+)
+
+
+class TestRateLimiter(unittest.TestCase):
+
+    def test_concurrent_requests_are_capped(self):
+        """No more than `max_concurrent_requests` callers hold a slot at once."""
+        limiter = RateLimiter(max_concurrent_requests=2)
+        lock = threading.Lock()
+        in_flight = []
+        peak = []
+
+        def request():
+            limiter.acquire()
+            with lock:
+                in_flight.append(1)
+                peak.append(len(in_flight))
+            time.sleep(0.02)
+            with lock:
+                in_flight.pop()
+            limiter.release()
+
+        threads = [threading.Thread(target=request) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(max(peak), 2)
+
+    def test_requests_per_minute_are_spaced(self):
+        """Once the burst is spent, requests wait for the bucket to refill."""
+        limiter = RateLimiter(max_concurrent_requests=1, requests_per_minute=1200)
+
+        waits = []
+        for _ in range(3):
+            waits.append(limiter.acquire())
+            limiter.release()
+
+        self.assertLess(waits[0], 0.01)
+        self.assertGreater(waits[1] + waits[2], 0.07)
+        self.assertAlmostEqual(limiter.total_wait, sum(waits), delta=0.01)
+
+    @patch("tap_zoho_crm.rate_limiter.metrics.log")
+    def test_wait_time_is_emitted_as_metric(self, mock_log):
+        """Waiting for a token is reported as a rate_limiter_wait timer."""
+        limiter = RateLimiter(max_concurrent_requests=1, requests_per_minute=1200)
+        limiter.acquire("https://www.zohoapis.com/crm/v8/Leads")
+        limiter.release()
+        limiter.acquire("https://www.zohoapis.com/crm/v8/Leads")
+        limiter.release()
+
+        mock_log.assert_called_once()
+        point = mock_log.call_args.args[1]
+        self.assertEqual(point.metric, "rate_limiter_wait")
+        self.assertEqual(point.tags, {"endpoint": "https://www.zohoapis.com/crm/v8/Leads"})
+
+    def test_parse_rate_limit_headers(self):
+        """The reset header is an epoch in milliseconds and is converted to seconds from now."""
+        reset_at = int((time.time() + 30) * 1000)
+        headers = {"X-RATELIMIT-LIMIT": "100", "X-RATELIMIT-REMAINING": "7", "X-RATELIMIT-RESET": str(reset_at)}
+
+        limit, remaining, reset_in = parse_rate_limit_headers(headers)
+
+        self.assertEqual((limit, remaining), (100, 7))
+        self.assertAlmostEqual(reset_in, 30, delta=1)
+        self.assertEqual(parse_rate_limit_headers(None), (None, None, None))
+        self.assertEqual(parse_rate_limit_headers({"X-RATELIMIT-REMAINING": "x"}), (None, None, None))
+
+    def test_pacing_follows_remaining_calls(self):
+        """Requests are spread over the window when few calls remain and sped up again after."""
+        limiter = RateLimiter(max_concurrent_requests=5)
+        reset_at = str(int((time.time() + 10) * 1000))
+
+        limiter.update_from_headers(
+            {"X-RATELIMIT-LIMIT": "100", "X-RATELIMIT-REMAINING": "5", "X-RATELIMIT-RESET": reset_at})
+        self.assertAlmostEqual(limiter._min_interval, 2, delta=0.2)
+
+        limiter.update_from_headers(
+            {"X-RATELIMIT-LIMIT": "100", "X-RATELIMIT-REMAINING": "80", "X-RATELIMIT-RESET": reset_at})
+        self.assertEqual(limiter._min_interval, 0)
+
+    def test_rate_limit_wait_prefers_retry_after(self):
+        """The retry wait is the API's requested delay, or exponential when unknown."""
+        wait = rate_limit_wait()
+        next(wait)
+
+        self.assertEqual(wait.send(ZohoCRMRateLimitError("limited")), 1)
+        self.assertEqual(wait.send(ZohoCRMRateLimitError("limited")), 2)
+        response = MagicMock(headers={"Retry-After": "7"})
+        self.assertEqual(wait.send(ZohoCRMRateLimitError("limited", response)), 7)
+
+    def test_rate_limit_error_uses_reset_header(self):
+        """Without Retry-After, the error waits until the rate limit window resets."""
+        reset_at = str(int((time.time() + 20) * 1000))
+        response = MagicMock(headers={"X-RATELIMIT-RESET": reset_at})
+
+        error = ZohoCRMRateLimitError("limited", response)
+
+        self.assertIn(error.retry_after, (20, 21))
+
+    def test_rate_limit_without_headers_waits_the_max(self):
+        """The accounts server's 400 throttling carries no delay, so the retry waits the max wait."""
+        response = MagicMock(status_code=400, headers={})
+        response.json.return_value = {
+            "error": "Access Denied",
+            "error_description": "You have made too many requests continuously. Please try again after some time."
+        }
+
+        with self.assertRaises(ZohoCRMRateLimitError) as error:
+            raise_for_error(response)
+
+        self.assertEqual(error.exception.retry_after, MAX_RATE_LIMIT_RETRY_WAIT)
+        wait = rate_limit_wait()
+        next(wait)
+        self.assertEqual(wait.send(error.exception), MAX_RATE_LIMIT_RETRY_WAIT)
@@ -1,7 +1,7 @@
 import unittest
 from unittest.mock import patch, MagicMock
 from tap_zoho_crm.sync import write_schema, sync, update_currently_syncing
-from tap_zoho_crm.sync import build_dynamic_stream
+from tap_zoho_crm.sync import build_dynamic_stream, get_dynamic_module_paths
 from tap_zoho_crm.streams.abstracts import FullTableStream, IncrementalStream
 from tap_zoho_crm.streams import Currencies, Organization
 
@@ -28,10 +28,10 @@ class TestSync(unittest.TestCase):
         mock_stream.write_schema.assert_called_once()
         self.assertEqual(len(mock_stream.child_to_sync), 0)
 
-    @patch("singer.write_schema")
+    @patch("tap_zoho_crm.streams.abstracts.write_schema")
     @patch("singer.get_currently_syncing")
-    @patch("singer.Transformer")
-    @patch("singer.write_state")
+    @patch("tap_zoho_crm.sync.CompiledTransformer")
+    @patch("tap_zoho_crm.sync.write_state")
     @patch("tap_zoho_crm.streams.abstracts.IncrementalStream.sync")
     def test_sync_stream1_called(self, mock_sync, mock_write_state, mock_transformer, mock_get_currently_syncing, mock_write_schema):
         mock_catalog = MagicMock()
@@ -53,10 +53,12 @@ class TestSync(unittest.TestCase):
         sync(client, config, mock_catalog, state)
 
         self.assertEqual(mock_sync.call_count, 2)
+        transformer = mock_transformer.return_value.__enter__.return_value
+        self.assertEqual([call.kwargs["transformer"] for call in mock_sync.call_args_list], [transformer] * 2)
 
     @patch("singer.get_currently_syncing")
     @patch("singer.set_currently_syncing")
-    @patch("singer.write_state")
+    @patch("tap_zoho_crm.sync.write_state")
     def test_remove_currently_syncing(self, mock_write_state, mock_set_currently_syncing, mock_get_currently_syncing):
         mock_get_currently_syncing.return_value = "some_stream"
         state = {"currently_syncing": "some_stream"}
@@ -70,7 +72,7 @@ class TestSync(unittest.TestCase):
 
     @patch("singer.get_currently_syncing")
     @patch("singer.set_currently_syncing")
-    @patch("singer.write_state")
+    @patch("tap_zoho_crm.sync.write_state")
     def test_set_currently_syncing(self, mock_write_state, mock_set_currently_syncing, mock_get_currently_syncing):
         mock_get_currently_syncing.return_value = None
         state = {}
@@ -140,4 +142,34 @@ class TestSync(unittest.TestCase):
         self.assertEqual(stream_instance.path, "Contacts")
         self.assertEqual(stream_instance.data_key, "data")
         self.assertTrue(stream_instance.is_dynamic)
+        self.assertTrue(stream_instance.if_modified_since_supported)
+        self.assertEqual(stream_instance.sort_by, "")
 
+
+    @patch("tap_zoho_crm.sync.get_dynamic_metadata")
+    def test_get_dynamic_module_paths_from_catalog(self, mock_get_dynamic_metadata):
+        """Module API names written during discovery are used without any API call."""
+        catalog = MagicMock()
+        catalog.get_stream.return_value.metadata = [
+            {"breadcrumb": [], "metadata": {"module-api-name": "Sales_Orders"}}
+        ]
+
+        result = get_dynamic_module_paths(MagicMock(), catalog, ["users", "sales_orders"])
+
+        self.assertEqual(result, {"sales_orders": "Sales_Orders"})
+        mock_get_dynamic_metadata.assert_not_called()
+
+    @patch("tap_zoho_crm.sync.get_dynamic_metadata")
+    def test_get_dynamic_module_paths_fallback(self, mock_get_dynamic_metadata):
+        """Catalogs without module-api-name fall back to a single settings/modules call."""
+        catalog = MagicMock()
+        catalog.get_stream.return_value.metadata = [{"breadcrumb": [], "metadata": {}}]
+        mock_get_dynamic_metadata.return_value = {
+            "modules": [{"api_name": "Leads"}, {"api_name": "Deals"}]
+        }
+
+        client = MagicMock()
+        result = get_dynamic_module_paths(client, catalog, ["leads", "deals", "currencies"])
+
+        self.assertEqual(result, {"leads": "Leads", "deals": "Deals"})
+        mock_get_dynamic_metadata.assert_called_once_with(client)
@@ -0,0 +1,83 @@
+import os
+import stat
+import time
+import tempfile
+import unittest
+from unittest.mock import patch
+from tap_zoho_crm.client import Client
+from tap_zoho_crm.token_cache import TokenCache
+
+
+default_config = {
+    "client_id": "dummy_id",
+    "client_secret": "dummy_secret",
+    "refresh_token": "dummy_token",
+    "user_agent": "test-account <test-email>"
+}
+
+TOKEN_RESPONSE = {
+    "access_token": "fresh-token",
+    "api_domain": "https://www.zohoapis.eu",
+    "token_type": "Bearer",
+    "expires_in": 3600
+}
+
+
+class TestTokenCache(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.config = dict(default_config, token_cache_path=os.path.join(self.tmp_dir.name, "token.json"))
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    @patch("tap_zoho_crm.client.Client._Client__make_request", return_value=TOKEN_RESPONSE)
+    def test_refreshed_token_is_cached_privately(self, mock_make_request):
+        """A refreshed token is written to a file only readable by its owner."""
+        with Client(self.config) as client:
+            self.assertEqual(client.get_access_token(), "fresh-token")
+
+        mode = stat.S_IMODE(os.stat(self.config["token_cache_path"]).st_mode)
+        self.assertEqual(mode, 0o600)
+        cached = TokenCache.from_config(self.config).read()
+        self.assertEqual(cached["access_token"], "fresh-token")
+        self.assertEqual(cached["api_domain"], "https://www.zohoapis.eu")
+        self.assertNotIn("dummy_token", open(self.config["token_cache_path"]).read())
+
+    @patch("tap_zoho_crm.client.Client._Client__make_request", return_value=TOKEN_RESPONSE)
+    def test_cached_token_skips_refresh(self, mock_make_request):
+        """A later run reuses the cached token and its API domain without a refresh."""
+        TokenCache.from_config(self.config).write({
+            "access_token": "cached-token",
+            "api_domain": "https://www.zohoapis.in",
+            "token_type": "Bearer",
+            "expires_at": time.time() + 1800
+        })
+
+        with Client(self.config) as client:
+            self.assertEqual(client.get_access_token(), "cached-token")
+            self.assertEqual(client.base_url, "https://www.zohoapis.in/crm/v8")
+
+        mock_make_request.assert_not_called()
+
+    @patch("tap_zoho_crm.client.Client._Client__make_request", return_value=TOKEN_RESPONSE)
+    def test_nearly_expired_token_is_refreshed(self, mock_make_request):
+        """A cached token about to expire is refreshed and replaced in the cache."""
+        TokenCache.from_config(self.config).write({
+            "access_token": "old-token",
+            "expires_at": time.time() + 60
+        })
+
+        with Client(self.config) as client:
+            self.assertEqual(client.get_access_token(), "fresh-token")
+
+        mock_make_request.assert_called_once()
+        self.assertEqual(TokenCache.from_config(self.config).read()["access_token"], "fresh-token")
+
+    def test_cache_of_other_credentials_is_ignored(self):
+        """A token issued for another refresh token is never reused."""
+        TokenCache.from_config(self.config).write({"access_token": "other", "expires_at": time.time() + 1800})
+        other_config = dict(self.config, refresh_token="another_token")
+
+        self.assertIsNone(TokenCache.from_config(other_config).read())
@@ -0,0 +1,102 @@
+import copy
+import unittest
+from singer import Transformer, metadata
+from singer.transform import SchemaMismatch
+from tap_zoho_crm.schema import field_to_property_schema, get_static_schemas
+from tap_zoho_crm.transform import CompiledTransformer, transform_datetime
+
+FIELD_TYPES = [
+    {"data_type": "text"},
+    {"data_type": "picklist"},
+    {"data_type": "multiselectpicklist"},
+    {"data_type": "ownerlookup", "json_type": "jsonobject"},
+    {"data_type": "subform", "json_type": "jsonarray"},
+    {"data_type": "currency", "json_type": "double"},
+    {"data_type": "boolean"},
+    {"data_type": "datetime"},
+    {"data_type": "date"},
+    {"data_type": "integer"},
+    {"data_type": "double"},
+]
+
+VALUES = {
+    "text": ["Müller", "", None, 12],
+    "picklist": ["Closed Won", None],
+    "multiselectpicklist": [["a", "b"], [], None],
+    "ownerlookup": [{"name": "Jane", "id": "1", "email": "jane@example.com"}, None],
+    "subform": [[{"id": "1", "Quantity": 2}], None],
+    "currency": [1234.5, "1,234.50", 0, None, ""],
+    "boolean": [True, False, "false", "true", None],
+    "datetime": ["2024-01-02T03:04:05+05:30", "2024-01-02T03:04:05Z", "2024-01-02T03:04:05.123+00:00",
+                 "2024-01-02T03:04:05", None, ""],
+    "date": ["2024-01-02", None],
+    "integer": [42, "1,000", 3.7, None],
+    "double": [0.1, "2.5", 7, None],
+}
+
+
+def build_dynamic_stream(field_count):
+    schema = {"type": "object", "properties": {"id": {"type": ["null", "string"]}}}
+    records = [{"id": str(index)} for index in range(12)]
+    for index in range(field_count):
+        field = FIELD_TYPES[index % len(FIELD_TYPES)]
+        field_name = f"{field['data_type']}_{index}"
+        schema["properties"][field_name] = field_to_property_schema(field)
+        values = VALUES[field["data_type"]]
+        for record_index, record in enumerate(records):
+            record[field_name] = copy.deepcopy(values[(record_index + index) % len(values)])
+    return schema, records
+
+
+class TestCompiledTransformer(unittest.TestCase):
+
+    def assert_same_output(self, schema, records, mdata=None):
+        singer_transformer = Transformer()
+        compiled_transformer = CompiledTransformer()
+        for record in records:
+            expected = singer_transformer.transform(copy.deepcopy(record), copy.deepcopy(schema), mdata)
+            self.assertEqual(compiled_transformer.transform(copy.deepcopy(record), schema, mdata), expected)
+        self.assertEqual(compiled_transformer.removed, singer_transformer.removed)
+        self.assertEqual(compiled_transformer.filtered, singer_transformer.filtered)
+
+    def test_dynamic_module_output_matches_singer(self):
+        """Records of a generated module transform exactly as with singer's transformer."""
+        schema, records = build_dynamic_stream(field_count=60)
+        records[0]["Unknown_Field"] = "not in the schema"
+        self.assert_same_output(schema, records)
+
+    def test_field_selection_matches_singer(self):
+        """Deselected and unsupported fields are dropped, automatic fields are always kept."""
+        schema, records = build_dynamic_stream(field_count=30)
+        mdata = metadata.to_map(metadata.get_standard_metadata(schema=schema, key_properties=["id"]))
+        mdata = metadata.write(mdata, ("properties", "text_0"), "selected", False)
+        mdata = metadata.write(mdata, ("properties", "picklist_1"), "inclusion", "unsupported")
+        mdata = metadata.write(mdata, ("properties", "id"), "selected", False)
+        mdata = metadata.write(mdata, ("properties", "ownerlookup_3", "properties", "email"), "selected", False)
+
+        self.assert_same_output(schema, records, mdata)
+
+    def test_static_streams_match_singer(self):
+        """The schemas of the static streams transform exactly as with singer's transformer."""
+        schemas, _ = get_static_schemas()
+        for stream_name, schema in schemas.items():
+            record = {field_name: None for field_name in schema["properties"]}
+            self.assert_same_output(schema, [record])
+
+    def test_mismatch_raises_singer_error(self):
+        """A record which does not match the schema fails with singer's error."""
+        schema, records = build_dynamic_stream(field_count=12)
+        records[0]["integer_9"] = "not a number"
+
+        with self.assertRaises(SchemaMismatch) as compiled_error:
+            CompiledTransformer().transform(copy.deepcopy(records[0]), schema)
+        with self.assertRaises(SchemaMismatch) as singer_error:
+            Transformer().transform(copy.deepcopy(records[0]), copy.deepcopy(schema))
+        self.assertEqual(str(compiled_error.exception), str(singer_error.exception))
+
+    def test_datetime_matches_singer(self):
+        """The ISO timestamp fast path formats values like singer's dateutil based parser."""
+        singer_transformer = Transformer()
+        for value in VALUES["datetime"] + VALUES["date"] + ["2024-01-02T03:04:05.5-08:00", "2024-02-30T03:04:05+00:00", "Jan 2 2024", 1700000000,
+                                                             "0001-01-01T00:00:00+05:30", "9999-12-31T23:59:59-05:00"]:
+            self.assertEqual(transform_datetime(value), singer_transformer._transform_datetime(value), value)
@@ -0,0 +1,139 @@
+import io
+import json
+import unittest
+from unittest.mock import patch, MagicMock
+import singer
+from tap_zoho_crm import writer
+from tap_zoho_crm.sync import sync_streams_concurrently
+
+
+class TestThreadedOutputWriter(unittest.TestCase):
+
+    @patch("tap_zoho_crm.writer.emit_state")
+    @patch("tap_zoho_crm.writer.emit_message")
+    def test_messages_written_in_queue_order(self, mock_write_message, mock_write_state):
+        """Messages from the queue are written in order by the writer thread."""
+        output_writer = writer.ThreadedOutputWriter({})
+        for index in range(100):
+            output_writer.write_message(singer.RecordMessage(stream="leads", record={"id": index}))
+        output_writer.close()
+
+        written = [call.args[0].record["id"] for call in mock_write_message.call_args_list]
+        self.assertEqual(written, list(range(100)))
+
+    @patch("tap_zoho_crm.writer.emit_state")
+    @patch("tap_zoho_crm.writer.emit_message")
+    def test_stream_states_are_merged(self, mock_write_message, mock_write_state):
+        """Bookmarks of each stream state are merged without touching other streams."""
+        state = {"bookmarks": {"leads": {"Modified_Time": "2024-01-01T00:00:00Z"}}}
+        output_writer = writer.ThreadedOutputWriter(state)
+
+        deals_state = {"bookmarks": {"deals": {"Modified_Time": "2024-02-01T00:00:00Z"}, "notes": {}}}
+        output_writer.write_state(deals_state)
+        deals_state["bookmarks"]["deals"]["Modified_Time"] = "mutated after emit"
+        output_writer.close()
+
+        self.assertEqual(state, {"bookmarks": {
+            "leads": {"Modified_Time": "2024-01-01T00:00:00Z"},
+            "deals": {"Modified_Time": "2024-02-01T00:00:00Z"},
+        }})
+        mock_write_state.assert_called_once_with(state)
+
+    @patch("tap_zoho_crm.writer.emit_message", side_effect=BrokenPipeError("closed"))
+    def test_writer_error_is_raised(self, mock_write_message):
+        """A failure in the writer thread is surfaced to the producers."""
+        output_writer = writer.ThreadedOutputWriter({})
+        output_writer.write_message(singer.RecordMessage(stream="leads", record={}))
+
+        with self.assertRaises(BrokenPipeError):
+            output_writer.close()
+
+
+class TestBufferedOutputWriter(unittest.TestCase):
+
+    def test_state_flushes_pending_records_first(self):
+        """Records are held back until a STATE message, which is written right after them."""
+        stdout = MagicMock()
+        with patch("sys.stdout", stdout):
+            output_writer = writer.BufferedOutputWriter()
+            for index in range(3):
+                output_writer.write_message(singer.RecordMessage(stream="leads", record={"id": index}))
+            stdout.buffer.write.assert_not_called()
+
+            state = {"bookmarks": {"leads": {"Modified_Time": "2024-01-01T00:00:00Z"}}}
+            output_writer.write_state(state)
+            state["bookmarks"]["leads"]["Modified_Time"] = "mutated after emit"
+
+        stdout.buffer.write.assert_called_once()
+        messages = [json.loads(line) for line in stdout.buffer.write.call_args.args[0].splitlines()]
+        self.assertEqual([message["type"] for message in messages], ["RECORD"] * 3 + ["STATE"])
+        self.assertEqual([message["record"]["id"] for message in messages[:3]], [0, 1, 2])
+        self.assertEqual(messages[3]["value"]["bookmarks"]["leads"]["Modified_Time"], "2024-01-01T00:00:00Z")
+
+    def test_full_buffer_is_written(self):
+        """The buffer is written once it holds `buffer_size` bytes, and the rest on close."""
+        stdout = io.TextIOWrapper(io.BytesIO(), encoding="utf-8")
+        with patch("sys.stdout", stdout):
+            output_writer = writer.BufferedOutputWriter(buffer_size=200)
+            for index in range(10):
+                output_writer.write_message(singer.RecordMessage(stream="leads", record={"id": index}))
+            written_before_close = stdout.buffer.getvalue().count(b"\n")
+            output_writer.close()
+
+        self.assertGreater(written_before_close, 0)
+        self.assertLess(written_before_close, 10)
+        self.assertEqual([json.loads(line)["record"]["id"] for line in stdout.buffer.getvalue().splitlines()],
+                         list(range(10)))
+
+    def test_threaded_writer_writes_through_buffer(self):
+        """Concurrent streams can share a buffered output, flushed when the writer closes."""
+        stdout = io.TextIOWrapper(io.BytesIO(), encoding="utf-8")
+        with patch("sys.stdout", stdout):
+            output_writer = writer.ThreadedOutputWriter({}, writer.BufferedOutputWriter())
+            output_writer.write_message(singer.RecordMessage(stream="leads", record={"id": 1}))
+            output_writer.write_state({"bookmarks": {"leads": {"Modified_Time": "2024-01-01T00:00:00Z"}}})
+            output_writer.write_message(singer.RecordMessage(stream="leads", record={"id": 2}))
+            output_writer.close()
+
+        types = [json.loads(line)["type"] for line in stdout.buffer.getvalue().splitlines()]
+        self.assertEqual(types, ["RECORD", "STATE", "RECORD"])
+
+
+class TestConcurrentSync(unittest.TestCase):
+
+    @patch("tap_zoho_crm.writer.emit_state")
+    @patch("tap_zoho_crm.writer.emit_message")
+    @patch("tap_zoho_crm.sync.write_schema")
+    @patch("tap_zoho_crm.sync.build_stream")
+    def test_streams_synced_with_isolated_state(self, mock_build_stream, mock_write_schema,
+                                                mock_write_message, mock_write_state):
+        """Every stream syncs against its own state and the bookmarks land in the tap state."""
+        def make_stream(client, catalog, stream_name, dynamic_schema_path):
+            stream = MagicMock()
+            stream.tap_stream_id = stream_name
+            stream.parent = ""
+            stream.child_to_sync = []
+
+            def stream_sync(state, transformer):
+                self.assertEqual(list(state["bookmarks"].keys()), [stream_name])
+                state["bookmarks"][stream_name]["Modified_Time"] = f"{stream_name}-bookmark"
+                writer.write_record(stream_name, {"id": 1})
+                return 1
+
+            stream.sync.side_effect = stream_sync
+            return stream
+
+        mock_build_stream.side_effect = make_stream
+        state = {"bookmarks": {"leads": {"Modified_Time": "old"}}}
+
+        sync_streams_concurrently(MagicMock(), MagicMock(), state, ["leads", "deals", "calls"], {}, 3)
+
+        self.assertEqual(state["bookmarks"], {
+            "leads": {"Modified_Time": "leads-bookmark"},
+            "deals": {"Modified_Time": "deals-bookmark"},
+            "calls": {"Modified_Time": "calls-bookmark"},
+        })
+        self.assertEqual(mock_write_message.call_count, 3)
+        self.assertEqual(mock_write_schema.call_count, 3)
+        self.assertIsInstance(writer.get_output_writer(), writer.OutputWriter)
+        self.assertNotIsInstance(writer.get_output_writer(), writer.ThreadedOutputWriter)